@@ -0,0 +1,20 @@
+"""Performance benchmarks for scikit-bot.
+
+The benchmarks use `airspeed velocity <https://asv.readthedocs.io>`_. To run
+them against the current working tree, call (from the repository's root)::
+
+    pip install -e .[benchmarking]
+    asv run --python=same
+
+To compare two commits, e.g. before merging a change, use::
+
+    asv continuous main HEAD
+
+CI runs this comparison for each pull request and fails if a benchmark gets
+more than 25% slower. Each push to ``main`` appends its results to the
+``benchmark-results`` branch, which holds the history of all runs (the first
+push creates it). To browse
+it locally, check the branch out into ``.asv/results`` and run ``asv publish
+&& asv preview``.
+
+"""
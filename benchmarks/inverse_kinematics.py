@@ -0,0 +1,163 @@
+"""Benchmarks for skbot.inverse_kinematics.
+
+Each benchmark solves the same set of randomly generated (but reproducible) IK
+problems. A problem's goal is the tool pose of a random joint configuration,
+and the solver starts from a perturbation of that configuration, i.e., all
+goals are reachable.
+
+"""
+
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+import warnings
+
+import numpy as np
+
+import skbot.ignition as ign
+import skbot.inverse_kinematics as ik
+import skbot.transform as tf
+
+
+ROBOT_FOLDER = Path(__file__).parents[1] / "tests" / "ignition" / "sdf" / "robots"
+
+# the panda's "ready" pose (base to tool); locked joints keep this value
+PANDA_READY = [0, -0.785, 0, -2.356, 0, 1.571, 0.785]
+
+N_PROBLEMS = 5
+START_NOISE = 0.3
+
+
+def load_robot(name: str, dof: int = None) -> Tuple[tf.Frame, tf.Frame, List[tf.Joint]]:
+    """Load a robot from the test fixtures.
+
+    Parameters
+    ----------
+    name : str
+        The name of the robot's folder in ``tests/ignition/sdf/robots``.
+    dof : int
+        If not None, only use the first ``dof`` joints (counted from the base).
+        The remaining joints are locked.
+
+    Returns
+    -------
+    base_frame : tf.Frame
+        The robot's root frame.
+    tool_frame : tf.Frame
+        The robot's end-effector.
+    joints : List[tf.Joint]
+        The joints to solve for, ordered from base to tool.
+
+    """
+
+    tool_name = {"panda": "panda_link8", "double_pendulum": "lower_link"}[name]
+
+    sdf_string = (ROBOT_FOLDER / name / "model.sdf").read_text()
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        base_frame = ign.sdformat.to_frame_graph(sdf_string)
+    tool_frame = base_frame.find_frame(f".../{tool_name}")
+
+    joints = tool_frame.joints_between(base_frame)[::-1]
+    if name == "panda":
+        for joint, value in zip(joints, PANDA_READY):
+            joint.param = value
+
+    return base_frame, tool_frame, joints[:dof]
+
+
+ROBOTS: Dict[str, Callable[[], Tuple[tf.Frame, tf.Frame, List[tf.Joint]]]] = {
+    "2dof_planar": lambda: load_robot("double_pendulum"),
+    "4dof_panda": lambda: load_robot("panda", 4),
+    "6dof_panda": lambda: load_robot("panda", 6),
+    "7dof_panda": lambda: load_robot("panda"),
+}
+
+SOLVERS = {"ccd": ik.ccd, "gd": ik.gd, "dls": ik.dls}
+
+
+def make_problems(
+    base_frame: tf.Frame, tool_frame: tf.Frame, joints: List[tf.Joint], seed: int = 0
+) -> List[Tuple[np.ndarray, np.ndarray, tf.AffineMatrix]]:
+    """Sample IK problems.
+
+    Returns
+    -------
+    problems : List[Tuple[np.ndarray, np.ndarray, tf.AffineMatrix]]
+        The initial joint values, the goal position, and the goal pose of each
+        problem.
+
+    """
+
+    rng = np.random.default_rng(seed)
+    lower = np.array([x.lower_limit for x in joints])
+    upper = np.array([x.upper_limit for x in joints])
+
+    problems = list()
+    for _ in range(N_PROBLEMS):
+        goal = rng.uniform(lower, upper)
+        for joint, value in zip(joints, goal):
+            joint.param = value
+
+        position = tool_frame.transform((0, 0, 0), base_frame)
+        pose = tf.AffineMatrix.from_links(tool_frame.links_between(base_frame))
+
+        start = goal + rng.normal(0, START_NOISE, len(joints))
+        start = np.clip(start, lower, upper)
+        problems.append((start, position, pose))
+
+    return problems
+
+
+class SolveSuite:
+    """Solve time, success rate, and iterations of the IK solvers.
+
+    Iterations are solver specific: cycles over all target+joint pairs for
+    ccd, L-BFGS-B iterations for gd, and Levenberg-Marquardt iterations for
+    dls.
+
+    """
+
+    params = (list(SOLVERS), list(ROBOTS), ["position", "pose"])
+    param_names = ["solver", "robot", "targets"]
+    timeout = 600
+
+    def setup(self, solver: str, robot: str, targets: str) -> None:
+        self.solver = SOLVERS[solver]
+        self.base_frame, self.tool_frame, self.joints = ROBOTS[robot]()
+        self.problems = make_problems(self.base_frame, self.tool_frame, self.joints)
+        self.targets = targets
+
+    def solve_all(self) -> List[ik.IKResult]:
+        results = list()
+        for start, position, pose in self.problems:
+            for joint, value in zip(self.joints, start):
+                joint.param = value
+
+            targets = [
+                ik.PositionTarget((0, 0, 0), position, self.tool_frame, self.base_frame)
+            ]
+            if self.targets == "pose":
+                targets.append(
+                    ik.RotationTarget(pose, self.tool_frame, self.base_frame)
+                )
+
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                results.append(self.solver(targets, self.joints, return_result=True))
+
+        return results
+
+    def time_solve(self, solver: str, robot: str, targets: str) -> None:
+        self.solve_all()
+
+    def track_success_rate(self, solver: str, robot: str, targets: str) -> float:
+        results = self.solve_all()
+        return 100 * np.mean([x.success for x in results])
+
+    track_success_rate.unit = "%"
+
+    def track_iterations(self, solver: str, robot: str, targets: str) -> float:
+        results = self.solve_all()
+        return np.mean([x.iterations for x in results])
+
+    track_iterations.unit = "iterations"
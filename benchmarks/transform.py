@@ -0,0 +1,162 @@
+"""Benchmarks for skbot.transform.
+
+These benchmarks cover the primitives that most other parts of scikit-bot
+(and most user code) build upon: walking and searching frame graphs,
+constructing rotations, and the vectorized helper functions.
+
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+
+import skbot.transform as tf
+from skbot.transform._utils import angle_between, vector_project
+
+
+def make_chain(length: int) -> Tuple[tf.Frame, tf.Frame, List[tf.Link]]:
+    """A serial chain of ``length`` links in 3D.
+
+    Links alternate between translations and rotational joints, i.e., the
+    chain looks like a (very long) robot arm.
+
+    Returns
+    -------
+    base : tf.Frame
+        The first frame of the chain.
+    tool : tf.Frame
+        The last frame of the chain.
+    links : List[tf.Link]
+        The links from ``tool`` to ``base``.
+
+    """
+
+    rng = np.random.default_rng(0)
+
+    base = tf.Frame(3, name="base")
+    links = list()
+    frame = base
+    for idx in range(length):
+        if idx % 2 == 0:
+            link = tf.Translation(rng.uniform(-1, 1, 3))
+        else:
+            axis = rng.normal(size=3)
+            link = tf.RotationalJoint(axis / np.linalg.norm(axis), angle=1)
+
+        child = tf.Frame(3, name=f"frame_{idx}")
+        link(frame, child)
+        links.append(link)
+        frame = child
+
+    # links map from the tool into the base
+    inverted = [tf.InvertLink(x) for x in reversed(links)]
+    return base, frame, inverted
+
+
+def make_tree(n_frames: int) -> List[tf.Frame]:
+    """A random (recursive) tree of ``n_frames`` frames in 3D.
+
+    Each frame is attached to a uniformly chosen earlier frame, which gives a
+    tree of logarithmic depth. ``frames[0]`` is the root.
+
+    """
+
+    rng = np.random.default_rng(0)
+
+    frames = [tf.Frame(3, name="frame_0")]
+    for idx in range(1, n_frames):
+        parent = frames[rng.integers(idx)]
+        child = tf.Frame(3, name=f"frame_{idx}")
+        tf.Translation(rng.uniform(-1, 1, 3))(parent, child)
+        frames.append(child)
+
+    return frames
+
+
+class ChainSuite:
+    """Transformations along serial chains."""
+
+    params = [1, 10, 100]
+    param_names = ["chain_length"]
+
+    def setup(self, chain_length: int) -> None:
+        self.base, self.tool, self.links = make_chain(chain_length)
+        self.point = np.array((1.0, 2.0, 3.0))
+        self.points = np.random.default_rng(0).uniform(-1, 1, (10_000, 3))
+
+    def time_transform(self, chain_length: int) -> None:
+        self.tool.transform(self.point, self.base)
+
+    def time_transform_batch(self, chain_length: int) -> None:
+        self.tool.transform(self.points, self.base)
+
+    def time_get_affine_matrix(self, chain_length: int) -> None:
+        self.tool.get_affine_matrix(self.base)
+
+    def time_simplify_links(self, chain_length: int) -> None:
+        tf.simplify_links(self.links)
+
+    def time_simplify_links_keep_joints(self, chain_length: int) -> None:
+        tf.simplify_links(self.links, keep_joints=True)
+
+
+class GraphSearchSuite:
+    """Searching for chains in frame graphs."""
+
+    params = [10, 100, 1_000, 10_000]
+    param_names = ["n_frames"]
+    timeout = 300
+
+    def setup(self, n_frames: int) -> None:
+        self.frames = make_tree(n_frames)
+
+    def time_chain_between_leaf_to_root(self, n_frames: int) -> None:
+        self.frames[-1].chain_between(self.frames[0])
+
+    def time_chain_between_root_to_leaf(self, n_frames: int) -> None:
+        self.frames[0].chain_between(self.frames[-1])
+
+    def time_chain_between_by_name(self, n_frames: int) -> None:
+        self.frames[0].chain_between(f"frame_{n_frames - 1}")
+
+
+class RotationSuite:
+    """Constructing rotations from common parameterizations."""
+
+    params = [1, 1_000]
+    param_names = ["batch_size"]
+
+    def setup(self, batch_size: int) -> None:
+        rng = np.random.default_rng(0)
+        self.rotvecs = rng.uniform(-1, 1, (batch_size, 3))
+        self.angles = rng.uniform(-np.pi, np.pi, (batch_size, 3))
+
+    def time_rotvec_rotation(self, batch_size: int) -> None:
+        tf.RotvecRotation(self.rotvecs)
+
+    def time_euler_rotation(self, batch_size: int) -> None:
+        tf.EulerRotation("xyz", self.angles)
+
+    def time_euler_rotation_transform(self, batch_size: int) -> None:
+        tf.EulerRotation("xyz", self.angles).transform(self.rotvecs)
+
+
+class UtilsSuite:
+    """Vectorized helper functions on large batches of 3D vectors."""
+
+    params = [1_000, 1_000_000]
+    param_names = ["batch_size"]
+
+    def setup(self, batch_size: int) -> None:
+        rng = np.random.default_rng(0)
+        self.vec_a = rng.uniform(-1, 1, (batch_size, 3))
+        self.vec_b = rng.uniform(-1, 1, (batch_size, 3))
+
+        # compile numba kernels outside of the timed code
+        vector_project(self.vec_a[:1], self.vec_b[:1])
+
+    def time_vector_project(self, batch_size: int) -> None:
+        vector_project(self.vec_a, self.vec_b)
+
+    def time_angle_between(self, batch_size: int) -> None:
+        angle_between(self.vec_a, self.vec_b)
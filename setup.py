@@ -25,6 +25,7 @@ extras_require = {
     ],
     "linting": ["flake8 == 4.0.1", "black == 21.12b0"],
     "testing": ["pytest == 7.0.1", "coverage[toml] == 6.3.2"],
+    "benchmarking": ["asv == 0.5.1"],
     "dev": [
         "lxml-stubs == 0.3.1",
         "python-semantic-release == 7.25.2",
@@ -1,4 +1,55 @@
-# register the numpy overloads
-from . import _numba_overloads
+# Note: the numpy overloads for numba (``skbot._numba_overloads``) are
+# registered by the modules that use numba. This keeps ``import skbot.<module>``
+# fast for modules that don't depend on numba.
+
+from typing import Sequence
 
 __version__ = "0.14.0"
+
+
+def warmup(
+    *,
+    dtypes: Sequence[str] = ("float32", "float64", "int64"),
+    ndims: Sequence[int] = (1, 2, 3),
+) -> None:
+    """Compile scikit-bot's numba kernels ahead of their first use.
+
+    .. versionadded:: 0.15.0
+
+    Some functions of scikit-bot, e.g., :class:`tf.Rotation
+    <skbot.transform.Rotation>`, use numba kernels that are compiled for the
+    type of their input on first use, which can take a few seconds per type.
+    This function compiles the kernels for the most common types up-front, so
+    that first use is fast.
+
+    Compiled kernels are cached on disk. Once cached, warming up only loads
+    them (a fraction of a second), and processes that find the cache (see
+    Notes) skip compilation even without calling this function.
+
+    Parameters
+    ----------
+    dtypes : Sequence[str]
+        The dtypes of the input arrays to compile for. The default includes
+        ``int64`` because vectors given as tuples of integers, e.g., ``(1, 0,
+        0)``, become integer arrays.
+    ndims : Sequence[int]
+        The number of dimensions of the input arrays to compile for.
+
+    Notes
+    -----
+    Kernels are cached next to scikit-bot's source files, or in
+    ``NUMBA_CACHE_DIR`` if that environment variable is set (e.g. if the
+    installation is read-only). To ship compiled kernels, e.g., in a container
+    image for short-lived worker processes, warm up while building the
+    image::
+
+        python -c "import skbot; skbot.warmup()"
+
+    and make sure that the workers use the same ``NUMBA_CACHE_DIR``, Python
+    version, numba version, and CPU architecture as the build.
+
+    """
+
+    from .transform._utils import _compile_kernels
+
+    _compile_kernels(dtypes, ndims)
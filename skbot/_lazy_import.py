@@ -0,0 +1,54 @@
+import importlib
+import sys
+from typing import Callable, Dict, List, Tuple
+
+
+def lazy_attributes(
+    package: str, attributes: Dict[str, Tuple[str, str]]
+) -> Tuple[Callable, Callable]:
+    """Create module-level ``__getattr__`` and ``__dir__`` (PEP 562).
+
+    Importing some of scikit-bot's (sub-)modules is expensive, e.g., the
+    generated ignition messages or SDFormat bindings. Packages use this
+    function to only import them once they are accessed.
+
+    Parameters
+    ----------
+    package : str
+        The ``__name__`` of the package that exposes the attributes.
+    attributes : Dict[str, Tuple[str, str]]
+        A mapping from attribute name to ``(module, name)`` where module is
+        the (relative) module to import and name is the name of the attribute
+        inside that module. If name is None, the attribute is the module
+        itself.
+
+    Returns
+    -------
+    __getattr__ : Callable
+        The module-level ``__getattr__`` of the package.
+    __dir__ : Callable
+        The module-level ``__dir__`` of the package.
+
+    """
+
+    def __getattr__(name: str):
+        try:
+            module_name, attribute = attributes[name]
+        except KeyError:
+            raise AttributeError(
+                f"module '{package}' has no attribute '{name}'"
+            ) from None
+
+        module = importlib.import_module(module_name, package)
+        value = module if attribute is None else getattr(module, attribute)
+
+        # cache the result; subsequent lookups won't call __getattr__
+        setattr(sys.modules[package], name, value)
+
+        return value
+
+    def __dir__() -> List[str]:
+        package_globals = vars(sys.modules[package])
+        return sorted(set(package_globals) | set(attributes))
+
+    return __getattr__, __dir__
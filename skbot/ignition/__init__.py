@@ -36,13 +36,35 @@ Functions
 .. autosummary::
     :toctree:
 
+    skbot.ignition.AsyncSubscriber
+    skbot.ignition.ConflatingSubscriber
     skbot.ignition.create_frame_graph
+    skbot.ignition.DiscoveryClient
     skbot.ignition.download_fuel_model
     skbot.ignition.FrustumProjection
     skbot.ignition.get_fuel_model
     skbot.ignition.get_fuel_model_info
     skbot.ignition.Subscriber
 
+.. rubric:: Zero-Copy Parsers
+
+.. autosummary::
+    :toctree:
+
+    skbot.ignition.parsers.array_parser
+    skbot.ignition.parsers.parse_image
+    skbot.ignition.parsers.parse_point_cloud_packed
+    skbot.ignition.parsers.parse_laser_scan
+    skbot.ignition.parsers.parse_double_v
+
+.. rubric:: Lazy Decoding
+
+.. autosummary::
+    :toctree:
+
+    skbot.ignition.lazy.LazyMessage
+    skbot.ignition.lazy.lazy_parser
+
 .. rubric:: SDFormat Specific
 
 .. note::
@@ -54,8 +76,11 @@ Functions
 .. autosummary::
     :toctree:
 
+    skbot.ignition.sdformat.dump
     skbot.ignition.sdformat.dumps
     skbot.ignition.sdformat.get_version
+    skbot.ignition.sdformat.load
+    skbot.ignition.sdformat.load_many
     skbot.ignition.sdformat.loads
     skbot.ignition.sdformat.loads_generic
     skbot.ignition.sdformat.to_frame_graph
@@ -152,21 +177,43 @@ documentation`_.
 .. _json: https://docs.python.org/3/library/json.html
 """
 
-from . import messages
-from .subscriber import Subscriber
-from .transformations import FrustumProjection
-from .sdformat.create_frame_graph import create_frame_graph
-from . import sdformat
-from .fuel import get_fuel_model_info, download_fuel_model, get_fuel_model
+from .._lazy_import import lazy_attributes
+
+# Submodules are imported on first access. Some of them (e.g., messages or the
+# SDFormat bindings) are large and importing all of them is slow.
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "messages": (".messages", None),
+        "parsers": (".parsers", None),
+        "lazy": (".lazy", None),
+        "discovery": (".discovery", None),
+        "fuel": (".fuel", None),
+        "sdformat": (".sdformat", None),
+        "Subscriber": (".subscriber", "Subscriber"),
+        "AsyncSubscriber": (".subscriber", "AsyncSubscriber"),
+        "ConflatingSubscriber": (".subscriber", "ConflatingSubscriber"),
+        "DiscoveryClient": (".discovery", "DiscoveryClient"),
+        "FrustumProjection": (".transformations", "FrustumProjection"),
+        "create_frame_graph": (".sdformat.create_frame_graph", "create_frame_graph"),
+        "get_fuel_model_info": (".fuel", "get_fuel_model_info"),
+        "download_fuel_model": (".fuel", "download_fuel_model"),
+        "get_fuel_model": (".fuel", "get_fuel_model"),
+    },
+)
 
 __all__ = [
     "messages",
+    "parsers",
+    "lazy",
     "Subscriber",
+    "AsyncSubscriber",
+    "ConflatingSubscriber",
+    "DiscoveryClient",
     "FrustumProjection",
     "create_frame_graph",
     "sdformat",
     "get_fuel_model_info",
     "download_fuel_model",
     "get_fuel_model",
-    "transform_graph_from_sdf",
 ]
@@ -0,0 +1,382 @@
+import getpass
+import os
+import select
+import socket
+import struct
+import threading
+import time
+import uuid
+from typing import Dict, List, Tuple
+
+import betterproto
+
+from . import messages
+
+# defaults used by ign-transport (>= v8) for message discovery
+MULTICAST_GROUP = "239.255.0.7"
+MSG_DISCOVERY_PORT = 10317
+WIRE_VERSION = 10
+HEARTBEAT_INTERVAL = 1.0
+SILENCE_INTERVAL = 3.0
+
+# discovery datagrams are prefixed by their length as a little-endian uint16
+_length_prefix = struct.Struct("<H")
+
+
+def default_partition() -> str:
+    """The ign-transport partition of this process.
+
+    Returns
+    -------
+    partition : str
+        The value of ``IGN_PARTITION`` if set, otherwise
+        ``<hostname>:<username>`` (the ign-transport default).
+
+    """
+
+    partition = os.environ.get("IGN_PARTITION", None)
+    if partition is None:
+        partition = f"{socket.gethostname()}:{getpass.getuser()}"
+
+    return partition
+
+
+class DiscoveryClient:
+    """Speak the ign-transport discovery protocol.
+
+    Ign-transport processes announce their publishers by sending
+    ``skbot.ignition.messages.Discovery`` messages to a UDP multicast group.
+    This client joins the group, tracks the announced message publishers in a
+    table, and keeps the table up to date in a background thread (heartbeats,
+    unadvertisements, and processes that went silent). Looking up the ZMQ
+    address of a topic is thus a dictionary access once the publisher has been
+    seen, which avoids calling ``ign topic -i`` in a subprocess.
+
+    Parameters
+    ----------
+    partition : str
+        The ign-transport partition to discover. If None, use
+        :func:`default_partition`.
+    multicast_group : str
+        The multicast group used for discovery. Defaults to ign-transport's
+        group.
+    port : int
+        The UDP port used for message discovery. Defaults to ign-transport's
+        port.
+    interface : str
+        The IP of the network interface to use for discovery. If None, use the
+        value of ``IGN_IP`` or, if that is not set, let the OS choose.
+    heartbeat_interval : float
+        Time (in s) between two heartbeats sent by this client. This is also
+        the interval in which silent processes are removed from the table.
+    silence_interval : float
+        Time (in s) after which a process that hasn't sent any discovery
+        message is considered dead and its publishers are removed.
+
+    Notes
+    -----
+    Only the subset of the protocol needed to subscribe is implemented; the
+    client never advertises publishers itself.
+
+    """
+
+    def __init__(
+        self,
+        partition: str = None,
+        *,
+        multicast_group: str = MULTICAST_GROUP,
+        port: int = MSG_DISCOVERY_PORT,
+        interface: str = None,
+        heartbeat_interval: float = HEARTBEAT_INTERVAL,
+        silence_interval: float = SILENCE_INTERVAL,
+    ) -> None:
+        self.partition = default_partition() if partition is None else partition
+        self.multicast_group = multicast_group
+        self.port = port
+        self.interface = (
+            os.environ.get("IGN_IP", None) if interface is None else interface
+        )
+        self.heartbeat_interval = heartbeat_interval
+        self.silence_interval = silence_interval
+        self.process_uuid = str(uuid.uuid4())
+
+        # topic -> (process_uuid, node_uuid) -> publisher
+        self._publishers: Dict[
+            str, Dict[Tuple[str, str], messages.DiscoveryPublisher]
+        ] = dict()
+        self._last_seen: Dict[str, float] = dict()
+        self._changed = threading.Condition()
+
+        self._recv_socket = None
+        self._send_socket = None
+        self._thread = None
+        self._running = threading.Event()
+
+    def fully_qualified(self, topic: str) -> str:
+        """The name of a topic as used on the wire."""
+        return f"@/{self.partition}@{topic}"
+
+    @property
+    def is_running(self) -> bool:
+        return self._running.is_set()
+
+    def start(self) -> "DiscoveryClient":
+        """Join the multicast group and start the background thread.
+
+        Calling start on a running client does nothing.
+
+        """
+
+        with self._changed:
+            if self.is_running:
+                return self
+
+            interface = "0.0.0.0" if self.interface is None else self.interface
+
+            recv_socket = socket.socket(
+                socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP
+            )
+            recv_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if hasattr(socket, "SO_REUSEPORT"):
+                recv_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            recv_socket.bind(("", self.port))
+            membership = struct.pack(
+                "4s4s",
+                socket.inet_aton(self.multicast_group),
+                socket.inet_aton(interface),
+            )
+            recv_socket.setsockopt(
+                socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, membership
+            )
+
+            send_socket = socket.socket(
+                socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP
+            )
+            send_socket.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 1)
+            send_socket.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 1)
+            if self.interface is not None:
+                send_socket.setsockopt(
+                    socket.IPPROTO_IP,
+                    socket.IP_MULTICAST_IF,
+                    socket.inet_aton(self.interface),
+                )
+
+            self._recv_socket = recv_socket
+            self._send_socket = send_socket
+            self._running.set()
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+        return self
+
+    def stop(self) -> None:
+        """Say goodbye, stop the background thread, and clear the table."""
+
+        if not self.is_running:
+            return
+
+        self._send(messages.DiscoveryType.BYE)
+        self._running.clear()
+        self._thread.join()
+        self._recv_socket.close()
+        self._send_socket.close()
+
+        with self._changed:
+            self._publishers.clear()
+            self._last_seen.clear()
+
+    def __enter__(self) -> "DiscoveryClient":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    def publishers(self, topic: str) -> List[messages.DiscoveryPublisher]:
+        """The currently known publishers of a topic.
+
+        Parameters
+        ----------
+        topic : str
+            The name of the topic as shown by `ign topic -l`.
+
+        Returns
+        -------
+        publishers : List[messages.DiscoveryPublisher]
+            The publishers advertising the topic.
+
+        """
+
+        with self._changed:
+            known = self._publishers.get(self.fully_qualified(topic), dict())
+            return list(known.values())
+
+    def wait_for_publisher(
+        self, topic: str, timeout: float = 1.0
+    ) -> messages.DiscoveryPublisher:
+        """Get a publisher of the topic, requesting one if necessary.
+
+        If the table doesn't contain a publisher for the topic yet, this
+        broadcasts a discovery request (``SUBSCRIBE``) and waits for a
+        matching advertisement.
+
+        Parameters
+        ----------
+        topic : str
+            The name of the topic as shown by `ign topic -l`.
+        timeout : float
+            Time (in s) to wait for a publisher to announce itself.
+
+        Returns
+        -------
+        publisher : messages.DiscoveryPublisher
+            A publisher of the topic.
+
+        Raises
+        ------
+        IOError
+            If no publisher was found within the timeout.
+
+        """
+
+        name = self.fully_qualified(topic)
+        deadline = time.monotonic() + timeout
+        next_request = time.monotonic()
+
+        with self._changed:
+            while True:
+                known = self._publishers.get(name, None)
+                if known:
+                    return next(iter(known.values()))
+
+                now = time.monotonic()
+                if now >= deadline:
+                    raise IOError(f"Could not identify socket for {topic}.")
+
+                if now >= next_request:
+                    self._send(
+                        messages.DiscoveryType.SUBSCRIBE,
+                        sub=messages.DiscoverySubscriber(topic=name),
+                    )
+                    next_request = now + self.heartbeat_interval
+
+                self._changed.wait(min(deadline, next_request) - now)
+
+    def _send(self, msg_type: messages.DiscoveryType, **kwargs) -> None:
+        msg = messages.Discovery(
+            version=WIRE_VERSION,
+            process_uuid=self.process_uuid,
+            type=msg_type,
+            **kwargs,
+        )
+        payload = bytes(msg)
+        self._send_socket.sendto(
+            _length_prefix.pack(len(payload)) + payload,
+            (self.multicast_group, self.port),
+        )
+
+    def _run(self) -> None:
+        next_heartbeat = time.monotonic()
+
+        while self._running.is_set():
+            now = time.monotonic()
+            if now >= next_heartbeat:
+                self._send(messages.DiscoveryType.HEARTBEAT)
+                self._prune(now)
+                next_heartbeat = now + self.heartbeat_interval
+
+            readable, _, _ = select.select(
+                [self._recv_socket], [], [], min(next_heartbeat - now, 0.1)
+            )
+            if readable:
+                datagram = self._recv_socket.recv(65535)
+                self._dispatch(datagram)
+
+    def _dispatch(self, datagram: bytes) -> None:
+        if len(datagram) < _length_prefix.size:
+            return
+
+        (length,) = _length_prefix.unpack_from(datagram)
+        if length + _length_prefix.size != len(datagram):
+            return
+
+        try:
+            msg = messages.Discovery().parse(datagram[_length_prefix.size :])
+        except Exception:
+            # not a discovery message; ignore it like ign-transport does
+            return
+
+        if msg.version != WIRE_VERSION or msg.process_uuid == self.process_uuid:
+            return
+
+        Type = messages.DiscoveryType
+        with self._changed:
+            self._last_seen[msg.process_uuid] = time.monotonic()
+
+            if msg.type == Type.ADVERTISE:
+                publisher = msg.pub
+                if betterproto.which_one_of(publisher, "pub_type")[0] != "msg_pub":
+                    return
+                if publisher.scope == messages.DiscoveryPublisherScope.PROCESS:
+                    return
+                if not publisher.topic.startswith(f"@/{self.partition}@"):
+                    return
+                topic_publishers = self._publishers.setdefault(publisher.topic, dict())
+                topic_publishers[
+                    (publisher.process_uuid, publisher.node_uuid)
+                ] = publisher
+                self._changed.notify_all()
+            elif msg.type == Type.UNADVERTISE:
+                publisher = msg.pub
+                topic_publishers = self._publishers.get(publisher.topic, dict())
+                topic_publishers.pop(
+                    (publisher.process_uuid, publisher.node_uuid), None
+                )
+            elif msg.type == Type.BYE:
+                self._forget(msg.process_uuid)
+
+    def _prune(self, now: float) -> None:
+        with self._changed:
+            silent = [
+                process
+                for process, last_seen in self._last_seen.items()
+                if now - last_seen > self.silence_interval
+            ]
+            for process in silent:
+                self._forget(process)
+
+    def _forget(self, process_uuid: str) -> None:
+        self._last_seen.pop(process_uuid, None)
+        for topic_publishers in self._publishers.values():
+            for key in [k for k in topic_publishers if k[0] == process_uuid]:
+                del topic_publishers[key]
+
+
+_shared_clients: Dict[str, DiscoveryClient] = dict()
+_shared_lock = threading.Lock()
+
+
+def shared_client(partition: str = None) -> DiscoveryClient:
+    """The process-wide discovery client of a partition.
+
+    Subscribers use this client by default so that many subscriptions share a
+    single publisher table and background thread. The client is created (but
+    not started) on first use.
+
+    Parameters
+    ----------
+    partition : str
+        The ign-transport partition. If None, use :func:`default_partition`.
+
+    Returns
+    -------
+    client : DiscoveryClient
+        The shared client.
+
+    """
+
+    partition = default_partition() if partition is None else partition
+
+    with _shared_lock:
+        if partition not in _shared_clients:
+            _shared_clients[partition] = DiscoveryClient(partition)
+        return _shared_clients[partition]
@@ -0,0 +1,190 @@
+"""Lazy, on-demand decoding of Ignition messages.
+
+Parsing a message with the generated betterproto classes decodes the entire
+message tree, e.g., every ``Model``, ``Link``, and ``Visual`` of a ``Scene``.
+:class:`LazyMessage` instead only indexes the top-level fields of the
+serialized message and decodes a field the first time it is accessed. Nested
+messages are again :class:`LazyMessage` objects, so only the path that is
+actually read gets decoded.
+
+"""
+
+import dataclasses
+from typing import Any, Dict, List, Tuple, Type
+
+import betterproto
+
+from . import messages
+from .parsers import Buffer, as_memoryview, iter_fields
+
+# message class -> field name -> (number, is message, is repeated, nested class)
+_field_info: Dict[Type, Dict[str, Tuple[int, bool, bool, Type]]] = dict()
+
+
+def _fields(message_type: Type) -> Dict[str, Tuple[int, bool, bool, Type]]:
+    try:
+        return _field_info[message_type]
+    except KeyError:
+        pass
+
+    proto_meta = message_type()._betterproto
+    info = dict()
+    for field in dataclasses.fields(message_type):
+        meta = betterproto.FieldMetadata.get(field)
+        nested = proto_meta.cls_by_field.get(field.name, None)
+        is_message = (
+            meta.proto_type == betterproto.TYPE_MESSAGE
+            and not meta.wraps
+            and isinstance(nested, type)
+            and issubclass(nested, betterproto.Message)
+        )
+        is_repeated = proto_meta.default_gen[field.name] is list
+        info[field.name] = (meta.number, is_message, is_repeated, nested)
+
+    _field_info[message_type] = info
+    return info
+
+
+class LazyMessage:
+    """A read-only message that decodes fields on first access.
+
+    The object exposes the same attributes as the betterproto message it wraps
+    (``message_type``). Accessing a scalar or map field decodes that field
+    only; accessing a (repeated) message field returns (a list of)
+    :class:`LazyMessage`. Decoded values are cached.
+
+    Parameters
+    ----------
+    message_type : Type[betterproto.Message]
+        The generated class of the message, e.g.,
+        ``skbot.ignition.messages.Scene``.
+    data : Buffer
+        The serialized message. The buffer is referenced, not copied, and must
+        not be modified while the message is in use.
+
+    Notes
+    -----
+    Use :meth:`to_message` to obtain a fully decoded (and mutable) betterproto
+    message, e.g., to modify it or to use betterproto functions such as
+    ``betterproto.which_one_of``.
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+        scene = LazyMessage(messages.Scene, data)
+        # decodes the first model's pose, but no links, visuals, etc.
+        position = scene.model[0].pose.position
+
+    """
+
+    __slots__ = ("_message_type", "_buffer", "_index", "_cache")
+
+    def __init__(self, message_type: Type[betterproto.Message], data: Buffer):
+        buffer = as_memoryview(data)
+        index: Dict[int, List[Tuple[int, int, int]]] = dict()
+        for number, _, start, value_start, end in iter_fields(buffer):
+            index.setdefault(number, list()).append((start, value_start, end))
+
+        object.__setattr__(self, "_message_type", message_type)
+        object.__setattr__(self, "_buffer", buffer)
+        object.__setattr__(self, "_index", index)
+        object.__setattr__(self, "_cache", dict())
+
+    @property
+    def message_type(self) -> Type[betterproto.Message]:
+        return self._message_type
+
+    def __getattr__(self, name: str) -> Any:
+        # only called if normal lookup fails, i.e., for protobuf fields
+        try:
+            return self._cache[name]
+        except KeyError:
+            pass
+
+        try:
+            number, is_message, is_repeated, nested = _fields(self._message_type)[name]
+        except KeyError:
+            raise AttributeError(
+                f"'{self._message_type.__name__}' has no field '{name}'"
+            ) from None
+
+        occurrences = self._index.get(number, list())
+        buffer = self._buffer
+
+        if is_message and is_repeated:
+            value = [LazyMessage(nested, buffer[v:e]) for _, v, e in occurrences]
+        elif is_message and len(occurrences) == 1:
+            _, value_start, end = occurrences[0]
+            value = LazyMessage(nested, buffer[value_start:end])
+        elif is_message:
+            # concatenated encodings merge (and nothing encodes the default)
+            value = LazyMessage(
+                nested, b"".join(buffer[v:e] for _, v, e in occurrences)
+            )
+        else:
+            raw = b"".join(buffer[s:e] for s, _, e in occurrences)
+            value = getattr(self._message_type().parse(raw), name)
+
+        self._cache[name] = value
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(
+            "LazyMessage is read-only. Use `to_message()` to get a mutable copy."
+        )
+
+    def __dir__(self) -> List[str]:
+        return list(super().__dir__()) + list(_fields(self._message_type))
+
+    def __bytes__(self) -> bytes:
+        return self._buffer.tobytes()
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, LazyMessage):
+            other = other.to_message()
+
+        return self.to_message() == other
+
+    def __repr__(self) -> str:
+        return f"Lazy{self._message_type.__name__}({len(self._buffer)} bytes)"
+
+    def to_message(self) -> betterproto.Message:
+        """Decode the full message.
+
+        Returns
+        -------
+        message : betterproto.Message
+            A (new) instance of ``message_type``.
+
+        """
+
+        return self._message_type().parse(bytes(self))
+
+    def to_dict(self, *args, **kwargs) -> dict:
+        """Decode the full message into a dict. See ``betterproto.Message.to_dict``."""
+        return self.to_message().to_dict(*args, **kwargs)
+
+
+def lazy_parser(msg: List[Buffer]) -> LazyMessage:
+    """Parse a ZMQ message into a :class:`LazyMessage`.
+
+    A drop-in replacement for the default parser of
+    :class:`skbot.ignition.Subscriber`. Combined with ``copy=False`` the
+    message is indexed directly in ZMQ's buffer.
+
+    Parameters
+    ----------
+    msg : List[Buffer]
+        The ZMQ message (zmq_topic, sender, protobuf_message, message_type).
+
+    Returns
+    -------
+    message : LazyMessage
+        The lazily decoded message.
+
+    """
+
+    message_type = bytes(msg[3]).decode("utf-8").split(".")[-1]
+    return LazyMessage(getattr(messages, message_type), msg[2])
@@ -0,0 +1,356 @@
+"""Zero-copy parsers for messages that carry bulk data.
+
+The default parser of :class:`skbot.ignition.Subscriber` decodes messages
+using the generated betterproto classes, which copies bulk data (images, point
+clouds, laser scans) into python ``bytes`` or ``list`` objects. The parsers in
+this module instead read the protobuf framing directly and return the bulk data
+as numpy arrays that are views into the received ZMQ frame. All other fields
+are decoded as usual.
+
+To avoid the copy made by ZMQ itself, combine them with ``copy=False``, e.g.,
+``Subscriber("/camera", parser=array_parser, copy=False)``.
+
+"""
+
+from typing import Callable, Dict, Iterator, List, Tuple, Union
+
+import betterproto
+import numpy as np
+import zmq
+
+from . import messages
+
+Buffer = Union[bytes, memoryview, zmq.Frame]
+
+PixelFormat = messages.PixelFormatType
+# pixel format -> (dtype, channels)
+pixel_formats = {
+    PixelFormat.L_INT8: (np.uint8, 1),
+    PixelFormat.L_INT16: (np.uint16, 1),
+    PixelFormat.RGB_INT8: (np.uint8, 3),
+    PixelFormat.RGBA_INT8: (np.uint8, 4),
+    PixelFormat.BGRA_INT8: (np.uint8, 4),
+    PixelFormat.RGB_INT16: (np.uint16, 3),
+    PixelFormat.RGB_INT32: (np.uint32, 3),
+    PixelFormat.BGR_INT8: (np.uint8, 3),
+    PixelFormat.BGR_INT16: (np.uint16, 3),
+    PixelFormat.BGR_INT32: (np.uint32, 3),
+    PixelFormat.R_FLOAT16: (np.float16, 1),
+    PixelFormat.RGB_FLOAT16: (np.float16, 3),
+    PixelFormat.R_FLOAT32: (np.float32, 1),
+    PixelFormat.RGB_FLOAT32: (np.float32, 3),
+    PixelFormat.BAYER_RGGB8: (np.uint8, 1),
+    PixelFormat.BAYER_BGGR8: (np.uint8, 1),
+    PixelFormat.BAYER_GBRG8: (np.uint8, 1),
+    PixelFormat.BAYER_GRBG8: (np.uint8, 1),
+}
+
+FieldType = messages.PointCloudPackedFieldDataType
+point_field_types = {
+    FieldType.INT8: np.int8,
+    FieldType.UINT8: np.uint8,
+    FieldType.INT16: np.int16,
+    FieldType.UINT16: np.uint16,
+    FieldType.INT32: np.int32,
+    FieldType.UINT32: np.uint32,
+    FieldType.FLOAT32: np.float32,
+    FieldType.FLOAT64: np.float64,
+}
+
+
+def as_memoryview(buffer: Buffer) -> memoryview:
+    """A view of a ZMQ frame or bytes-like object.
+
+    The view may be writable. The frame may be shared with other parsers, so
+    arrays created from it must be made read-only before handing them out.
+
+    """
+    if isinstance(buffer, zmq.Frame):
+        buffer = buffer.buffer
+
+    return memoryview(buffer)
+
+
+def _read_varint(buffer: memoryview, pos: int) -> Tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        byte = buffer[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+def iter_fields(buffer: memoryview) -> Iterator[Tuple[int, int, int, int, int]]:
+    """Walk the top-level fields of a serialized protobuf message.
+
+    Parameters
+    ----------
+    buffer : memoryview
+        The serialized message.
+
+    Yields
+    ------
+    number : int
+        The field number.
+    wire_type : int
+        The wire type of the field.
+    start : int
+        The offset of the field's key in ``buffer``.
+    value_start : int
+        The offset of the field's value in ``buffer``. For length-delimited
+        fields this is the start of the payload (after the length prefix).
+    end : int
+        The offset of the first byte after the field.
+
+    """
+
+    pos = 0
+    while pos < len(buffer):
+        start = pos
+        key, pos = _read_varint(buffer, pos)
+        number, wire_type = key >> 3, key & 0x7
+        value_start = pos
+
+        if wire_type == betterproto.WIRE_VARINT:
+            _, pos = _read_varint(buffer, pos)
+        elif wire_type == betterproto.WIRE_FIXED_64:
+            pos += 8
+        elif wire_type == betterproto.WIRE_FIXED_32:
+            pos += 4
+        elif wire_type == betterproto.WIRE_LEN_DELIM:
+            length, value_start = _read_varint(buffer, pos)
+            pos = value_start + length
+        else:
+            raise ValueError(f"Unsupported wire type {wire_type}.")
+
+        yield number, wire_type, start, value_start, pos
+
+
+def split_fields(
+    message_type: type, buffer: Buffer, bulk_fields: List[int]
+) -> Tuple[betterproto.Message, Dict[int, List[memoryview]]]:
+    """Decode a message except for its length-delimited bulk fields.
+
+    Parameters
+    ----------
+    message_type : type
+        The betterproto class of the message.
+    buffer : Buffer
+        The serialized message.
+    bulk_fields : List[int]
+        The numbers of (length-delimited) fields that should not be decoded.
+
+    Returns
+    -------
+    message : betterproto.Message
+        The message with all fields except the bulk fields decoded.
+    bulk : Dict[int, List[memoryview]]
+        The payload of each occurrence of a bulk field as view into
+        ``buffer``.
+
+    """
+
+    buffer = as_memoryview(buffer)
+    bulk = {number: list() for number in bulk_fields}
+    remainder = list()
+
+    for number, wire_type, start, value_start, end in iter_fields(buffer):
+        if number in bulk and wire_type == betterproto.WIRE_LEN_DELIM:
+            bulk[number].append(buffer[value_start:end])
+        else:
+            remainder.append(buffer[start:end])
+
+    message = message_type().parse(b"".join(remainder))
+
+    return message, bulk
+
+
+def _packed_array(chunks: List[memoryview], dtype: np.dtype) -> np.ndarray:
+    if len(chunks) == 0:
+        array = np.empty(0, dtype=dtype)
+    elif len(chunks) == 1:
+        array = np.frombuffer(chunks[0], dtype=dtype)
+    else:
+        # a packed field may legally be split; this case needs a copy
+        array = np.concatenate([np.frombuffer(x, dtype=dtype) for x in chunks])
+
+    array.flags.writeable = False
+    return array
+
+
+def parse_image(msg: List[Buffer]) -> messages.Image:
+    """Parse an ``Image`` message without copying the pixel data.
+
+    Parameters
+    ----------
+    msg : List[Buffer]
+        The ZMQ message (zmq_topic, sender, protobuf_message, message_type).
+
+    Returns
+    -------
+    image : messages.Image
+        The decoded message. ``image.data`` is a read-only array of shape
+        (height, width) for single-channel formats and (height, width,
+        channels) otherwise. For unknown formats it is the raw data with shape
+        (height, step) and dtype uint8.
+
+    """
+
+    image, bulk = split_fields(messages.Image, msg[2], [5])
+    data = bulk[5][-1] if bulk[5] else memoryview(b"")
+
+    if image.pixel_format_type in pixel_formats and image.height > 0:
+        dtype, channels = pixel_formats[image.pixel_format_type]
+        dtype = np.dtype(dtype).newbyteorder("<")
+        shape = (image.height, image.width, channels)
+        strides = (image.step, channels * dtype.itemsize, dtype.itemsize)
+        pixels = np.ndarray(shape, dtype=dtype, buffer=data, strides=strides)
+        if channels == 1:
+            pixels = pixels[..., 0]
+    else:
+        pixels = np.frombuffer(data, dtype=np.uint8)
+        if image.height > 0:
+            pixels = pixels.reshape(image.height, -1)
+
+    pixels.flags.writeable = False
+    image.data = pixels
+    return image
+
+
+def parse_point_cloud_packed(msg: List[Buffer]) -> messages.PointCloudPacked:
+    """Parse a ``PointCloudPacked`` message without copying the points.
+
+    Parameters
+    ----------
+    msg : List[Buffer]
+        The ZMQ message (zmq_topic, sender, protobuf_message, message_type).
+
+    Returns
+    -------
+    cloud : messages.PointCloudPacked
+        The decoded message. ``cloud.data`` is a read-only structured array of
+        shape (height, width) whose dtype is built from ``cloud.field``, i.e.,
+        ``cloud.data["x"]`` is the array of x coordinates.
+
+    """
+
+    cloud, bulk = split_fields(messages.PointCloudPacked, msg[2], [8])
+    data = bulk[8][-1] if bulk[8] else memoryview(b"")
+    byteorder = ">" if cloud.is_bigendian else "<"
+
+    names, formats, offsets = list(), list(), list()
+    for field in cloud.field:
+        field_dtype = np.dtype(point_field_types[field.datatype])
+        field_dtype = field_dtype.newbyteorder(byteorder)
+        if field.count > 1:
+            field_dtype = np.dtype((field_dtype, (field.count,)))
+        names.append(field.name)
+        formats.append(field_dtype)
+        offsets.append(field.offset)
+
+    dtype = np.dtype(
+        {
+            "names": names,
+            "formats": formats,
+            "offsets": offsets,
+            "itemsize": cloud.point_step,
+        }
+    )
+
+    shape = (cloud.height, cloud.width)
+    strides = (cloud.row_step, cloud.point_step)
+    points = np.ndarray(shape, dtype=dtype, buffer=data, strides=strides)
+    points.flags.writeable = False
+    cloud.data = points
+
+    return cloud
+
+
+def parse_laser_scan(msg: List[Buffer]) -> messages.LaserScan:
+    """Parse a ``LaserScan`` message without copying ranges or intensities.
+
+    Parameters
+    ----------
+    msg : List[Buffer]
+        The ZMQ message (zmq_topic, sender, protobuf_message, message_type).
+
+    Returns
+    -------
+    scan : messages.LaserScan
+        The decoded message. ``scan.ranges`` and ``scan.intensities`` are
+        read-only arrays of shape (vertical_count, count) if the scan has more
+        than one vertical ray and (count,) otherwise.
+
+    """
+
+    scan, bulk = split_fields(messages.LaserScan, msg[2], [14, 15])
+    dtype = np.dtype("<f8")
+
+    for number, name in [(14, "ranges"), (15, "intensities")]:
+        values = _packed_array(bulk[number], dtype)
+        if scan.vertical_count > 1 and values.size == scan.vertical_count * scan.count:
+            values = values.reshape(scan.vertical_count, scan.count)
+        setattr(scan, name, values)
+
+    return scan
+
+
+def parse_double_v(msg: List[Buffer]) -> messages.Double_V:
+    """Parse a ``Double_V`` message without copying the data.
+
+    Parameters
+    ----------
+    msg : List[Buffer]
+        The ZMQ message (zmq_topic, sender, protobuf_message, message_type).
+
+    Returns
+    -------
+    vector : messages.Double_V
+        The decoded message. ``vector.data`` is a read-only array.
+
+    """
+
+    vector, bulk = split_fields(messages.Double_V, msg[2], [1])
+    vector.data = _packed_array(bulk[1], np.dtype("<f8"))
+
+    return vector
+
+
+array_parsers: Dict[str, Callable] = {
+    "ignition.msgs.Image": parse_image,
+    "ignition.msgs.PointCloudPacked": parse_point_cloud_packed,
+    "ignition.msgs.LaserScan": parse_laser_scan,
+    "ignition.msgs.Double_V": parse_double_v,
+}
+
+
+def array_parser(msg: List[Buffer]) -> betterproto.Message:
+    """Parse a message using a zero-copy parser if one exists.
+
+    Messages for which this module has a dedicated parser (see
+    ``array_parsers``) are decoded with it; all other messages are decoded
+    using the generated betterproto classes.
+
+    Parameters
+    ----------
+    msg : List[Buffer]
+        The ZMQ message (zmq_topic, sender, protobuf_message, message_type).
+
+    Returns
+    -------
+    message : betterproto.Message
+        The decoded message.
+
+    """
+
+    message_type = bytes(msg[3]).decode("utf-8")
+    parser = array_parsers.get(message_type, None)
+
+    if parser is None:
+        message_class = getattr(messages, message_type.split(".")[-1])
+        return message_class().parse(bytes(msg[2]))
+
+    return parser(msg)
@@ -1,6 +1,30 @@
-from .sdformat import loads, dumps, get_version
-from .transform_factory import to_frame_graph
-from .load_as_generic import loads_generic
-from . import generic_sdf
+from ..._lazy_import import lazy_attributes
 
-__all__ = ["get_version", "loads", "dumps", "to_frame_graph", "loads_generic"]
+# loaded on first access to keep `import skbot.ignition.sdformat` fast
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "get_version": (".sdformat", "get_version"),
+        "loads": (".sdformat", "loads"),
+        "dumps": (".sdformat", "dumps"),
+        "load": (".sdformat", "load"),
+        "dump": (".sdformat", "dump"),
+        "to_frame_graph": (".transform_factory", "to_frame_graph"),
+        "loads_generic": (".load_as_generic", "loads_generic"),
+        "load_many": (".load_many", "load_many"),
+        "generic_sdf": (".generic_sdf", None),
+        "bindings": (".bindings", None),
+        "cache": (".cache", None),
+    },
+)
+
+__all__ = [
+    "get_version",
+    "loads",
+    "dumps",
+    "load",
+    "dump",
+    "to_frame_graph",
+    "loads_generic",
+    "load_many",
+]
@@ -1 +1,16 @@
-# nothing here
+from ...._lazy_import import lazy_attributes
+
+# each version is only imported when it is used
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "v10": (".v10", None),
+        "v12": (".v12", None),
+        "v13": (".v13", None),
+        "v14": (".v14", None),
+        "v15": (".v15", None),
+        "v16": (".v16", None),
+        "v17": (".v17", None),
+        "v18": (".v18", None),
+    },
+)
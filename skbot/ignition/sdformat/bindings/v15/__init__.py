@@ -1,21 +1,27 @@
-from .actor import Actor
-from .collision import Collision
-from .geometry import Geometry
-from .joint import Joint
-from .light import Light
-from .link import Link
-from .material import Material
-from .model import Model as ModelModel
-from .physics import Physics
-from .scene import Scene
-from .sdf import Sdf
-from .sensor import Sensor
-from .state import (
-    Model as StateModel,
-    State,
+from ....._lazy_import import lazy_attributes
+
+# bindings are large; only import the submodules that are actually used
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "Actor": (".actor", "Actor"),
+        "Collision": (".collision", "Collision"),
+        "Geometry": (".geometry", "Geometry"),
+        "Joint": (".joint", "Joint"),
+        "Light": (".light", "Light"),
+        "Link": (".link", "Link"),
+        "Material": (".material", "Material"),
+        "ModelModel": (".model", "Model"),
+        "Physics": (".physics", "Physics"),
+        "Scene": (".scene", "Scene"),
+        "Sdf": (".sdf", "Sdf"),
+        "Sensor": (".sensor", "Sensor"),
+        "StateModel": (".state", "Model"),
+        "State": (".state", "State"),
+        "Visual": (".visual", "Visual"),
+        "World": (".world", "World"),
+    },
 )
-from .visual import Visual
-from .world import World
 
 __all__ = [
     "Actor",
@@ -0,0 +1,175 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Callable, Union
+
+import cachetools
+
+from ... import __version__
+
+
+class ParseCache:
+    """In-memory cache of parsed SDFormat trees.
+
+    Trees are stored pickled. This keeps the footprint small and means that
+    every hit returns a fresh copy which can be modified without affecting the
+    cache (or other copies).
+
+    Parameters
+    ----------
+    maxsize : int
+        The maximum number of trees to keep. Least recently used trees are
+        evicted first.
+
+    Notes
+    -----
+    The cache is thread-safe.
+
+    """
+
+    def __init__(self, maxsize: int = 16) -> None:
+        self._cache = cachetools.LRUCache(maxsize=maxsize)
+        # cachetools' caches are not thread-safe; even a lookup reorders them
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Union[bytes, None]:
+        with self._lock:
+            return self._cache.get(key, None)
+
+    def update(self, key: str, blob: bytes) -> None:
+        with self._lock:
+            self._cache[key] = blob
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+class FileParseCache:
+    """On-disk cache of parsed SDFormat trees.
+
+    Each tree is stored as a pickle file named after its key. The cache never
+    evicts; delete the folder to reset it.
+
+    Parameters
+    ----------
+    location : str
+        The folder in which to store the trees.
+
+    Notes
+    -----
+    Loading a pickle can execute arbitrary code. Only use folders that are
+    not writable by untrusted users.
+
+    """
+
+    def __init__(self, location: str) -> None:
+        self._base = Path(location).expanduser()
+        self._base.mkdir(exist_ok=True, parents=True)
+
+    def get(self, key: str) -> Union[bytes, None]:
+        file_loc = self._base / f"{key}.pickle"
+
+        if file_loc.exists():
+            return file_loc.read_bytes()
+        else:
+            return None
+
+    def update(self, key: str, blob: bytes) -> None:
+        # write to a temporary file first so that concurrent readers
+        # never see a partially written tree
+        fd, tmp_name = tempfile.mkstemp(dir=self._base, suffix=".tmp")
+        with os.fdopen(fd, "wb") as file:
+            file.write(blob)
+        os.replace(tmp_name, self._base / f"{key}.pickle")
+
+
+parse_cache = ParseCache()
+
+
+def cache_key(sdf: str, *args: Any) -> str:
+    """Compute the cache key of a SDF string.
+
+    Parameters
+    ----------
+    sdf : str
+        The SDFormat XML.
+    args : Any
+        Additional parameters that influence the parsed tree, e.g., version
+        and handler. They are converted to strings.
+
+    Returns
+    -------
+    key : str
+        The hex digest of the SHA-256 hash of scikit-bot's version, the args,
+        and the SDF string.
+
+    """
+
+    hasher = hashlib.sha256()
+    hasher.update(__version__.encode("utf-8"))
+    for arg in args:
+        hasher.update(b"\0" + str(arg).encode("utf-8"))
+    hasher.update(b"\0" + sdf.encode("utf-8"))
+
+    return hasher.hexdigest()
+
+
+def cached_parse(
+    key: str,
+    parse: Callable[[], Any],
+    *,
+    use_cache: bool = True,
+    cache_dir: str = None,
+) -> Any:
+    """Parse a tree, or load it from the cache.
+
+    Parameters
+    ----------
+    key : str
+        The cache key of the tree (see :func:`cache_key`).
+    parse : Callable[[], Any]
+        A function that parses the tree on a cache miss.
+    use_cache : bool
+        If ``True``, use (and update) the in-memory ``parse_cache``.
+    cache_dir : str
+        If not ``None``, use (and update) a :class:`FileParseCache` in this
+        folder.
+
+    Returns
+    -------
+    tree : Any
+        The parsed tree.
+
+    Notes
+    -----
+    Caches are checked in the order (1) in-memory, (2) file. Updates are done
+    in reverse order.
+
+    """
+
+    caches = list()
+    if use_cache:
+        caches.append(parse_cache)
+    if cache_dir is not None:
+        caches.append(FileParseCache(cache_dir))
+
+    for idx, cache in enumerate(caches):
+        blob = cache.get(key)
+        if blob is not None:
+            # update the faster caches that missed
+            for faster_cache in caches[:idx]:
+                faster_cache.update(key, blob)
+            return pickle.loads(blob)
+
+    tree = parse()
+
+    if caches:
+        blob = pickle.dumps(tree, protocol=pickle.HIGHEST_PROTOCOL)
+        for cache in caches:
+            cache.update(key, blob)
+
+    return tree
@@ -0,0 +1,316 @@
+"""Single-pass parser for scikit-bot's SDFormat bindings.
+
+xsData's ``XmlParser`` supports the full XML schema feature set, which makes it
+slow; it creates a node object per XML element and resolves every child
+through a chain of generic lookups. scikit-bot's SDFormat bindings, however,
+only use a small subset of these features: dataclass elements, primitive
+(str, float, int, bool) elements and attributes, text content, and an
+``##any`` wildcard that holds plugin configuration.
+
+This module parses exactly that subset directly from lxml's ``iterparse``
+events into the binding dataclasses, using per-class lookup tables built (once)
+from xsData's metadata. Documents that use anything else, e.g., namespaces,
+unknown elements, or values that fail to convert, raise
+:class:`FastPathError`; callers are expected to fall back to xsData, which
+then either parses the document or reports the error.
+
+"""
+
+import io
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Type, TypeVar, Union
+
+from lxml import etree
+from xsdata.formats.dataclass.context import XmlContext
+from xsdata.formats.dataclass.models.generics import AnyElement
+
+T = TypeVar("T")
+
+
+class FastPathError(Exception):
+    """The document can not be parsed by the fast parser."""
+
+
+_bool_literals = {"true": True, "1": True, "false": False, "0": False}
+
+
+def _to_bool(value: str) -> bool:
+    return _bool_literals[value.strip()]
+
+
+# mirrors xsData's converters for the types used by the bindings
+_converters = {str: str, float: float, int: int, bool: _to_bool}
+
+# marks elements/attributes whose (xsData) semantics aren't supported
+_UNSUPPORTED = object()
+
+# (field name, dataclass or None, converter or None, is list, default, nillable)
+_Field = Tuple[str, Optional[Type], Any, bool, Any, bool]
+
+
+class _Schema:
+    """Lookup tables of a binding class."""
+
+    __slots__ = ("clazz", "elements", "attributes", "text", "wildcard")
+
+    def __init__(self, clazz: Type, context: XmlContext) -> None:
+        meta = context.build(clazz)
+
+        self.clazz = clazz
+        self.elements: Dict[str, Any] = dict()
+        self.attributes: Dict[str, Any] = dict()
+        self.text: Optional[Tuple[str, Any]] = None
+        self.wildcard: Optional[str] = None
+
+        if meta.any_attributes or meta.mixed_content:
+            raise FastPathError(f"Unsupported binding: {clazz.__name__}")
+
+        for qname, xml_vars in meta.elements.items():
+            var = xml_vars[0]
+            if (
+                len(xml_vars) != 1
+                or var.is_elements
+                or var.is_clazz_union
+                or var.any_type
+                or var.derived
+                or var.tokens
+                or not var.init
+            ):
+                self.elements[qname] = _UNSUPPORTED
+            elif var.clazz is not None:
+                self.elements[qname] = (
+                    var.name,
+                    var.clazz,
+                    None,
+                    var.list_element,
+                    var.default,
+                    var.nillable,
+                )
+            else:
+                self.elements[qname] = (
+                    var.name,
+                    None,
+                    _converter(var.types),
+                    var.list_element,
+                    var.default,
+                    var.nillable,
+                )
+
+        for qname, var in meta.attributes.items():
+            converter = _converter(var.types)
+            if converter is _UNSUPPORTED or var.tokens or not var.init:
+                self.attributes[qname] = _UNSUPPORTED
+            else:
+                self.attributes[qname] = (var.name, converter)
+
+        if meta.text is not None:
+            converter = _converter(meta.text.types)
+            if converter is _UNSUPPORTED or meta.text.tokens:
+                raise FastPathError(f"Unsupported binding: {clazz.__name__}")
+            self.text = (meta.text.name, converter)
+
+        if meta.wildcards:
+            var = meta.wildcards[0]
+            if len(meta.wildcards) != 1 or not var.list_element or var.mixed:
+                raise FastPathError(f"Unsupported binding: {clazz.__name__}")
+            self.wildcard = var.name
+
+
+def _converter(types: Tuple[Type, ...]) -> Any:
+    if len(types) != 1:
+        return _UNSUPPORTED
+    return _converters.get(types[0], _UNSUPPORTED)
+
+
+_schemas: Dict[Type, _Schema] = dict()
+
+
+def _schema(clazz: Type, context: XmlContext) -> _Schema:
+    try:
+        return _schemas[clazz]
+    except KeyError:
+        pass
+
+    schema = _Schema(clazz, context)
+    _schemas[clazz] = schema
+    return schema
+
+
+def _normalize(content: Optional[str]) -> Optional[str]:
+    # xsData drops whitespace-only text and tails of wildcard content
+    if content and content.strip():
+        return content
+    return None
+
+
+# kinds of stack frames
+_ELEMENT = 0
+_PRIMITIVE = 1
+_WILDCARD = 2
+
+
+def parse(sdf: Union[str, BinaryIO], clazz: Type[T], context: XmlContext) -> T:
+    """Parse SDFormat XML into a tree of binding objects.
+
+    Parameters
+    ----------
+    sdf : Union[str, BinaryIO]
+        The SDFormat XML to parse, or a binary file-like object to read it
+        from.
+    clazz : Type[T]
+        The binding class of the root element, e.g.,
+        ``skbot.ignition.sdformat.bindings.v18.sdf.Sdf``.
+    context : XmlContext
+        The xsData context used to look up the metadata of binding classes.
+
+    Returns
+    -------
+    root : T
+        The root of the parsed tree. It is equal to the tree produced by
+        xsData's ``XmlParser``.
+
+    Raises
+    ------
+    FastPathError
+        If the document uses features that this parser doesn't support. This
+        includes invalid documents.
+
+    """
+
+    if isinstance(sdf, str):
+        sdf = io.BytesIO(sdf.encode())
+
+    root_qname = context.build(clazz).qname
+    events = etree.iterparse(
+        sdf,
+        events=("start", "end", "start-ns"),
+        recover=True,
+        remove_comments=True,
+    )
+
+    # frames are [kind, schema/field, params/children, field in parent, assigned]
+    stack: List[list] = list()
+    root = None
+
+    try:
+        for event, element in events:
+            if event == "start":
+                tag = element.tag
+                if not isinstance(tag, str):
+                    raise FastPathError("Processing instructions are not supported.")
+
+                if not stack:
+                    if tag != root_qname:
+                        raise FastPathError(f"Unexpected root element `{tag}`.")
+                    stack.append([_ELEMENT, _schema(clazz, context), {}, None, set()])
+                    continue
+
+                parent = stack[-1]
+                kind = parent[0]
+                if kind == _WILDCARD:
+                    stack.append([_WILDCARD, None, [], None, None])
+                    continue
+                elif kind == _PRIMITIVE:
+                    raise FastPathError(f"Unexpected child `{tag}`.")
+
+                schema: _Schema = parent[1]
+                field = schema.elements.get(tag, None)
+                if field is None and schema.wildcard is not None:
+                    stack.append([_WILDCARD, None, [], None, None])
+                    continue
+                elif field is None or field is _UNSUPPORTED:
+                    raise FastPathError(f"Unsupported element `{tag}`.")
+
+                name, child_clazz, _, is_list, _, _ = field
+                if not is_list:
+                    assigned = parent[4]
+                    if name in assigned:
+                        raise FastPathError(f"Duplicate element `{tag}`.")
+                    assigned.add(name)
+
+                if child_clazz is None:
+                    stack.append([_PRIMITIVE, None, None, field, None])
+                else:
+                    child_schema = _schema(child_clazz, context)
+                    stack.append([_ELEMENT, child_schema, {}, field, set()])
+
+            elif event == "end":
+                kind, schema, params, field, _ = stack.pop()
+
+                if kind == _ELEMENT:
+                    for key, value in element.attrib.items():
+                        attribute = schema.attributes.get(key, None)
+                        if attribute is None:
+                            # xsData ignores unknown attributes
+                            continue
+                        elif attribute is _UNSUPPORTED:
+                            raise FastPathError(f"Unsupported attribute `{key}`.")
+                        params[attribute[0]] = attribute[1](value)
+
+                    text = element.text
+                    if schema.text is not None and text is not None:
+                        params[schema.text[0]] = schema.text[1](text)
+                    elif schema.wildcard is not None:
+                        text = _normalize(text)
+                        tail = _normalize(element.tail)
+                        if text is not None or tail is not None:
+                            items = params.setdefault(schema.wildcard, [])
+                            if text is not None:
+                                items.insert(0, text)
+                            if tail is not None:
+                                items.append(tail)
+
+                    value = schema.clazz(**params)
+                elif kind == _PRIMITIVE:
+                    _, _, convert, _, default, nillable = field
+                    text = element.text
+                    if text is not None:
+                        value = convert(text)
+                    elif callable(default):
+                        value = None
+                    else:
+                        value = default
+
+                    if value is None and not nillable:
+                        value = ""
+                else:
+                    children = params
+                    text = element.text
+                    if children:
+                        text = _normalize(text)
+                    value = AnyElement(
+                        qname=element.tag,
+                        text="" if text is None else text,
+                        tail=_normalize(element.tail),
+                        attributes=dict(element.attrib),
+                        children=children,
+                    )
+
+                element.clear()
+
+                if not stack:
+                    root = value
+                    continue
+
+                parent = stack[-1]
+                if parent[0] == _WILDCARD:
+                    parent[2].append(value)
+                elif field is None:
+                    parent[2].setdefault(parent[1].wildcard, []).append(value)
+                elif field[3]:
+                    parent[2].setdefault(field[0], []).append(value)
+                else:
+                    parent[2][field[0]] = value
+
+            else:
+                raise FastPathError("Namespaces are not supported.")
+
+    except (ValueError, KeyError, TypeError) as e:
+        # a value failed to convert or the XML is broken beyond recovery
+        raise FastPathError("Failed to parse the document.") from e
+    except etree.XMLSyntaxError as e:
+        raise FastPathError("Invalid XML.") from e
+
+    if root is None:
+        raise FastPathError("The document is empty.")
+
+    return root
@@ -392,7 +392,7 @@ class Link(ElementBase):
             parent_static = _scaffolding[parent_name]
             child_static = _scaffolding[child_name]
 
-            link = tf.CompundLink(parent_static.links_between(child_static))
+            link = _scaffolding.static_link(parent_static, child_static)
             link(parent, child)
 
         for frame in self._frames:
@@ -415,7 +415,7 @@ class Link(ElementBase):
             parent_static = _scaffolding[parent_name]
             child_static = _scaffolding[child_name]
 
-            link = tf.CompundLink(parent_static.links_between(child_static))
+            link = _scaffolding.static_link(parent_static, child_static)
             link(parent, child)
 
             sensor.to_dynamic_graph(
@@ -22,6 +22,7 @@ from .actor import Actor
 from .light import Light
 from ..exceptions import ParseError
 from .... import transform as tf
+from .scope import ScopedFrames
 from .origin import Origin
 
 
@@ -311,13 +312,10 @@ class Model(ElementBase):
         shape: Tuple,
         axis: int = -1,
     ) -> tf.Frame:
+        scopes = ScopedFrames(declared_frames)
+        world = {"world": declared_frames["world"]}
         for model in self.models:
-            scope = {
-                name.split("::", 1)[1]: frame
-                for name, frame in declared_frames.items()
-                if name.startswith(f"{model.name}::")
-            }
-            scope["world"] = declared_frames["world"]
+            scope = scopes.scope(model.name, overrides=world)
             model.to_static_graph(scope, seed=seed, shape=shape, axis=axis)
 
         for model in self.models:
@@ -343,28 +341,24 @@ class Model(ElementBase):
         shape: Tuple[int] = ...,
         axis: int = -1,
         apply_state: bool = True,
+        fuse_static: bool = False,
         _scaffolding: Dict[str, tf.Frame],
     ) -> tf.Frame:
+        # index the scaffolding once; nested elements share the index
+        _scaffolding = ScopedFrames(_scaffolding, fuse=fuse_static)
+        scaffold_world = {"world": _scaffolding["world"]}
+        scopes = ScopedFrames(declared_frames)
+        world = {"world": declared_frames["world"]}
         for model in self.models:
-            scaffold_scope = {
-                name.split("::", 1)[1]: frame
-                for name, frame in _scaffolding.items()
-                if name.startswith(f"{model.name}::")
-            }
-            scaffold_scope["world"] = _scaffolding["world"]
-
-            scope = {
-                name.split("::", 1)[1]: frame
-                for name, frame in declared_frames.items()
-                if name.startswith(f"{model.name}::")
-            }
-            scope["world"] = declared_frames["world"]
+            scaffold_scope = _scaffolding.scope(model.name, overrides=scaffold_world)
+            scope = scopes.scope(model.name, overrides=world)
             model.to_dynamic_graph(
                 scope,
                 seed=seed,
                 shape=shape,
                 axis=axis,
                 apply_state=apply_state,
+                fuse_static=fuse_static,
                 _scaffolding=scaffold_scope,
             )
 
@@ -376,7 +370,7 @@ class Model(ElementBase):
             parent_static = _scaffolding[self.canonical_link]
         child = declared_frames["__model__"]
         child_static = _scaffolding["__model__"]
-        tf.CompundLink(parent_static.links_between(child_static))(parent, child)
+        _scaffolding.static_link(parent_static, child_static)(parent, child)
 
         for el in chain(self.frames, self.links, self.joints):
             el.to_dynamic_graph(
@@ -1,10 +1,392 @@
-import warnings
+from typing import Any, Dict, Union
 
-from .base import ElementBase, should_warn_unsupported
+import numpy as np
+
+from .base import (
+    ElementBase,
+    FloatElement,
+    IntegerElement,
+    Pose,
+    StringElement,
+    vector3,
+)
+from .model import Model
+from ..exceptions import ParseError
+from .... import transform as tf
 
 
 class Population(ElementBase):
-    def __init__(self, *, sdf_version: str) -> None:
-        if should_warn_unsupported():
-            warnings.warn("`Population` has not been implemented yet.")
+    """A set of automatically placed copies of a model.
+
+    A population places ``model_count`` copies of a model inside a region (a
+    box or a cylinder) that is centered at the population's pose. How the
+    copies are placed is determined by the population's distribution.
+
+    Instead of creating one :class:`Model` per copy, the population is
+    expanded into a single batched link (see :meth:`to_tf_link`) that maps
+    the model into the population's frame at all sampled positions at once.
+    As such, frames of the model transform vectors into a batch of vectors
+    with shape ``(model_count, 3)``; one per copy.
+
+    Like in Gazebo, the model's own pose is replaced by the population's pose,
+    i.e., each copy is placed at the population's pose offset by its sampled
+    position.
+
+    .. versionchanged:: 0.15.0
+        Populations are now expanded when building frame graphs.
+
+    Parameters
+    ----------
+    name : str
+        A unique name for the population. It must not match the name of
+        another population or model in the world.
+    pose : Pose
+        The position and orientation of the population's region.
+    model_count : int
+        The number of models to place. It is ignored by ``grid``
+        distributions. Default: ``1``.
+    distribution : Population.Distribution
+        How the models are placed inside the region. Default: ``random``.
+    box : Population.Box
+        The region in which to place models. Mutually exclusive with
+        ``cylinder``. If neither is set, a unit box is used.
+    cylinder : Population.Cylinder
+        The region in which to place models. Mutually exclusive with ``box``.
+    model : Model
+        The model to populate. Its pose is replaced by ``pose``.
+    sdf_version : str
+        The SDFormat version to use when constructing this element.
+
+    Attributes
+    ----------
+    name : str
+        See ``Parameters`` section.
+    pose : Pose
+        See ``Parameters`` section.
+    model_count : int
+        See ``Parameters`` section.
+    distribution : Population.Distribution
+        See ``Parameters`` section.
+    box : Population.Box
+        See ``Parameters`` section.
+    cylinder : Population.Cylinder
+        See ``Parameters`` section.
+    model : Model
+        See ``Parameters`` section.
+
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        pose: Pose = None,
+        model_count: int = 1,
+        distribution: "Population.Distribution" = None,
+        box: "Population.Box" = None,
+        cylinder: "Population.Cylinder" = None,
+        model: Model,
+        sdf_version: str,
+    ) -> None:
         super().__init__(sdf_version=sdf_version)
+        self.name = name
+        self.pose = Pose(sdf_version=sdf_version) if pose is None else pose
+        self.model_count = model_count
+        self.distribution = (
+            Population.Distribution(sdf_version=sdf_version)
+            if distribution is None
+            else distribution
+        )
+        self.box = box
+        self.cylinder = cylinder
+        self.model = model
+        self.model.pose = self.pose
+        self.model._origin.pose = self.pose
+
+        if self.box is not None and self.cylinder is not None:
+            raise ParseError(
+                f"Population `{name}` may only use one of `box` or `cylinder`."
+            )
+
+        if self.box is None and self.cylinder is None:
+            self.box = Population.Box(sdf_version=sdf_version)
+
+    @classmethod
+    def from_specific(cls, specific: Any, *, version: str) -> "Population":
+        args_with_default = {
+            "pose": Pose,
+            "model_count": IntegerElement,
+            "distribution": Population.Distribution,
+        }
+        standard_args = cls._prepare_standard_args(
+            specific, args_with_default, version=version
+        )
+
+        if specific.box is not None:
+            standard_args["box"] = Population.Box.from_specific(
+                specific.box, version=version
+            )
+
+        if specific.cylinder is not None:
+            standard_args["cylinder"] = Population.Cylinder.from_specific(
+                specific.cylinder, version=version
+            )
+
+        return cls(
+            name=specific.name,
+            model=Model.from_specific(specific.model, version=version),
+            **standard_args,
+            sdf_version=version,
+        )
+
+    def sample_positions(
+        self, seed: Union[int, np.random.Generator] = None
+    ) -> np.ndarray:
+        """Sample the position of each model.
+
+        Parameters
+        ----------
+        seed : Union[int, np.random.Generator]
+            The seed (or generator) to use for random distributions. If None,
+            fresh entropy is used.
+
+        Returns
+        -------
+        positions : np.ndarray
+            The position of each model in the population's frame. Shape:
+            ``(count, 3)`` where ``count`` is ``model_count`` or ``rows *
+            cols`` for grid distributions.
+
+        """
+
+        rng = np.random.default_rng(seed)
+        kind = self.distribution.type
+        count = self.model_count
+
+        if kind == "grid":
+            rows = self.distribution.rows
+            cols = self.distribution.cols
+            row, col = np.divmod(np.arange(rows * cols), cols)
+
+            positions = np.zeros((rows * cols, 3))
+            positions[:, 0] = col * self.distribution.step[0]
+            positions[:, 1] = row * self.distribution.step[1]
+            return positions
+
+        if self.cylinder is not None:
+            radius = self.cylinder.radius
+            half_length = self.cylinder.length / 2
+            extent = np.array((radius, radius, half_length))
+        else:
+            extent = self.box.size / 2
+
+        positions = np.zeros((count, 3))
+        if kind in ["linear-x", "linear-y", "linear-z"]:
+            idx = "xyz".index(kind[-1])
+            steps = (np.arange(count) + 0.5) / count
+            positions[:, idx] = (2 * steps - 1) * extent[idx]
+            return positions
+
+        positions[:, 2] = rng.uniform(-extent[2], extent[2], count)
+
+        if kind == "random" and self.cylinder is not None:
+            # sqrt makes samples uniform over the disk's area
+            rho = radius * np.sqrt(rng.uniform(0, 1, count))
+            phi = rng.uniform(0, 2 * np.pi, count)
+        elif kind == "random":
+            positions[:, :2] = rng.uniform(-extent[:2], extent[:2], (count, 2))
+            return positions
+        elif self.cylinder is not None:
+            # uniform: Vogel's spiral spaces points evenly on a disk
+            golden_angle = np.pi * (3 - np.sqrt(5))
+            rho = radius * np.sqrt((np.arange(count) + 0.5) / count)
+            phi = np.arange(count) * golden_angle
+        else:
+            # uniform: the centers of a random subset of cells of a grid whose
+            # aspect ratio matches the box
+            width, height = 2 * extent[:2]
+            if height > 0:
+                cols = max(1, int(np.ceil(np.sqrt(count * width / height))))
+            else:
+                cols = count
+            cols = max(1, min(cols, count))
+            rows = int(np.ceil(count / cols))
+
+            cells = np.sort(rng.choice(rows * cols, count, replace=False))
+            row, col = np.divmod(cells, cols)
+            positions[:, 0] = ((col + 0.5) / cols * 2 - 1) * extent[0]
+            positions[:, 1] = ((row + 0.5) / rows * 2 - 1) * extent[1]
+            return positions
+
+        positions[:, 0] = rho * np.cos(phi)
+        positions[:, 1] = rho * np.sin(phi)
+        return positions
+
+    def to_tf_link(self, *, seed: Union[int, np.random.Generator] = None) -> tf.Link:
+        """Batched tf.Link from the **model** to the **parent** frame.
+
+        Parameters
+        ----------
+        seed : Union[int, np.random.Generator]
+            The seed (or generator) to use when sampling positions. See
+            :meth:`sample_positions`.
+
+        Returns
+        -------
+        link : tf.Link
+            A link that maps the model's frame into the frame named by
+            ``pose.relative_to``. It transforms a vector of shape ``(3,)`` into
+            a batch of shape ``(count, 3)``.
+
+        """
+
+        positions = self.sample_positions(seed)
+
+        return tf.CompundLink(
+            [
+                tf.Translation(positions),
+                self.pose.to_tf_link(),
+            ]
+        )
+
+    class Distribution(ElementBase):
+        """How models are placed inside a population's region.
+
+        Parameters
+        ----------
+        type : str
+            The kind of distribution. One of:
+                - random: Models are placed uniformly at random.
+                - uniform: Models are placed approximately in a 2D grid
+                  pattern with control over the number of models.
+                - grid: Models are placed evenly in a 2D grid pattern with
+                  ``rows * cols`` cells that starts at the origin of the
+                  population's frame. The region and ``model_count`` are
+                  ignored.
+                - linear-x: Models are placed evenly in a row along the x-axis.
+                - linear-y: Models are placed evenly in a row along the y-axis.
+                - linear-z: Models are placed evenly in a row along the z-axis.
+            Default: ``random``.
+        rows : int
+            The number of rows of a grid. Default: ``1``.
+        cols : int
+            The number of columns of a grid. Default: ``1``.
+        step : str
+            The distance between cells of a grid. Default: ``"0.5 0.5 0"``.
+        sdf_version : str
+            The SDFormat version to use when constructing this element.
+
+        Attributes
+        ----------
+        type : str
+            See ``Parameters`` section.
+        rows : int
+            See ``Parameters`` section.
+        cols : int
+            See ``Parameters`` section.
+        step : np.ndarray
+            See ``Parameters`` section.
+
+        """
+
+        kinds = ["random", "uniform", "grid", "linear-x", "linear-y", "linear-z"]
+
+        def __init__(
+            self,
+            *,
+            type: str = "random",
+            rows: int = 1,
+            cols: int = 1,
+            step: str = "0.5 0.5 0",
+            sdf_version: str,
+        ) -> None:
+            super().__init__(sdf_version=sdf_version)
+            self.type = type
+            self.rows = rows
+            self.cols = cols
+            self.step = vector3(step)
+
+            if self.type not in Population.Distribution.kinds:
+                raise ParseError(f"Unknown population distribution `{type}`.")
+
+        @classmethod
+        def from_specific(cls, specific: Any, *, version: str) -> "ElementBase":
+            args_with_default: Dict[str, ElementBase] = {
+                "type": StringElement,
+                "rows": IntegerElement,
+                "cols": IntegerElement,
+                "step": StringElement,
+            }
+            standard_args = cls._prepare_standard_args(
+                specific, args_with_default, version=version
+            )
+            return cls(**standard_args, sdf_version=version)
+
+    class Box(ElementBase):
+        """A box-shaped region centered at the population's pose.
+
+        Parameters
+        ----------
+        size : str
+            The side lengths of the box. Default: ``"1 1 1"``.
+        sdf_version : str
+            The SDFormat version to use when constructing this element.
+
+        Attributes
+        ----------
+        size : np.ndarray
+            See ``Parameters`` section.
+
+        """
+
+        def __init__(self, *, size: str = "1 1 1", sdf_version: str) -> None:
+            super().__init__(sdf_version=sdf_version)
+            self.size = vector3(size)
+
+        @classmethod
+        def from_specific(cls, specific: Any, *, version: str) -> "ElementBase":
+            standard_args = cls._prepare_standard_args(
+                specific, {"size": StringElement}, version=version
+            )
+            return cls(**standard_args, sdf_version=version)
+
+    class Cylinder(ElementBase):
+        """A cylinder-shaped region centered at the population's pose.
+
+        The cylinder's axis is the z-axis of the population's frame.
+
+        Parameters
+        ----------
+        radius : float
+            The radius of the cylinder. Default: ``1``.
+        length : float
+            The length of the cylinder along its axis. Default: ``1``.
+        sdf_version : str
+            The SDFormat version to use when constructing this element.
+
+        Attributes
+        ----------
+        radius : float
+            See ``Parameters`` section.
+        length : float
+            See ``Parameters`` section.
+
+        """
+
+        def __init__(
+            self, *, radius: float = 1, length: float = 1, sdf_version: str
+        ) -> None:
+            super().__init__(sdf_version=sdf_version)
+            self.radius = radius
+            self.length = length
+
+        @classmethod
+        def from_specific(cls, specific: Any, *, version: str) -> "ElementBase":
+            args_with_default: Dict[str, ElementBase] = {
+                "radius": FloatElement,
+                "length": FloatElement,
+            }
+            standard_args = cls._prepare_standard_args(
+                specific, args_with_default, version=version
+            )
+            return cls(**standard_args, sdf_version=version)
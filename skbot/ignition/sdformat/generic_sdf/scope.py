@@ -0,0 +1,303 @@
+from typing import Dict, Iterator, List, Mapping, Optional
+
+from .... import transform as tf
+
+
+class _Node:
+    __slots__ = ("frames", "children")
+
+    def __init__(self) -> None:
+        self.frames: Dict[str, tf.Frame] = dict()
+        self.children: Dict[str, "_Node"] = dict()
+
+
+class ScopedFrames(Mapping):
+    """Read-only view of declared frames with nested scopes.
+
+    Declared frames are stored in flat dicts whose keys use ``::`` to separate
+    scopes, e.g., ``model_A::link_B``. This class indexes such a dict in a
+    trie keyed by scope. A nested scope (:meth:`scope`) is a view into the
+    same trie; creating it neither scans nor copies the parent's frames.
+
+    If the frames belong to a static frame graph (the scaffolding), views also
+    share a :class:`LinkTree` of the graph (see :meth:`links_between` and
+    :meth:`static_link`).
+
+    Parameters
+    ----------
+    frames : Mapping[str, tf.Frame]
+        The declared frames to index. If ``frames`` is a ScopedFrames, the new
+        object shares its index (and link tree).
+    fuse : bool
+        If True, :meth:`static_link` fuses chains into a single
+        :class:`tf.AffineMatrix <skbot.transform.AffineMatrix>`. Nested scopes
+        inherit this setting. Defaults to False.
+
+    """
+
+    def __init__(self, frames: Mapping[str, tf.Frame], *, fuse: bool = False) -> None:
+        self._fuse = fuse
+
+        if isinstance(frames, ScopedFrames):
+            self._node = frames._node
+            self._overrides = frames._overrides
+            self._links = frames._links
+            return
+
+        self._node = _Node()
+        self._overrides: Dict[str, tf.Frame] = dict()
+        self._links = LinkTree()
+
+        for name, frame in frames.items():
+            *path, leaf = name.split("::")
+            node = self._node
+            for segment in path:
+                try:
+                    node = node.children[segment]
+                except KeyError:
+                    child = _Node()
+                    node.children[segment] = child
+                    node = child
+            node.frames[leaf] = frame
+
+    def scope(self, name: str, overrides: Dict[str, tf.Frame] = None) -> "ScopedFrames":
+        """The frames declared inside a nested scope.
+
+        Parameters
+        ----------
+        name : str
+            The name of the nested scope, e.g., the name of a model.
+        overrides : Dict[str, tf.Frame]
+            Frames that should be visible inside the nested scope in addition
+            to the frames declared by it, e.g., ``world``. They take precedence
+            over declared frames of the same name.
+
+        Returns
+        -------
+        scope : ScopedFrames
+            A view of the frames of the nested scope. Their names are relative
+            to the scope, i.e., ``model_A::link_B`` becomes ``link_B``.
+
+        """
+
+        view = ScopedFrames.__new__(ScopedFrames)
+        view._node = self._node.children.get(name, None) or _Node()
+        view._overrides = dict() if overrides is None else overrides
+        view._links = self._links
+        view._fuse = self._fuse
+
+        return view
+
+    def links_between(self, parent: tf.Frame, child: tf.Frame) -> List[tf.Link]:
+        """The links between two frames of the static graph.
+
+        Equivalent to ``parent.links_between(child)``, but uses a
+        :class:`LinkTree` that is shared by all views of the same frames. Use
+        it to connect dynamic frames based on the scaffolding.
+
+        Parameters
+        ----------
+        parent : tf.Frame
+            The frame in which the chain starts.
+        child : tf.Frame
+            The frame in which the chain ends.
+
+        Returns
+        -------
+        links : List[tf.Link]
+            The links that transform from ``parent`` into ``child``.
+
+        """
+
+        return self._links.links_between(parent, child)
+
+    def static_link(self, parent: tf.Frame, child: tf.Frame) -> tf.Link:
+        """A link that maps from one frame of the static graph into another.
+
+        Parameters
+        ----------
+        parent : tf.Frame
+            The frame in which the chain starts.
+        child : tf.Frame
+            The frame in which the chain ends.
+
+        Returns
+        -------
+        link : tf.Link
+            A :class:`tf.CompundLink <skbot.transform.CompundLink>` of the
+            links between ``parent`` and ``child``, or (if this object fuses
+            links) a :class:`tf.AffineMatrix <skbot.transform.AffineMatrix>` that
+            is equivalent to it.
+
+        """
+
+        links = self.links_between(parent, child)
+
+        if self._fuse:
+            return tf.AffineMatrix.from_links(links)
+        else:
+            return tf.CompundLink(links)
+
+    def __getitem__(self, name: str) -> tf.Frame:
+        try:
+            return self._overrides[name]
+        except KeyError:
+            pass
+
+        *path, leaf = name.split("::")
+        node = self._node
+        try:
+            for segment in path:
+                node = node.children[segment]
+            return node.frames[leaf]
+        except KeyError:
+            raise KeyError(name) from None
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._overrides
+
+        for name in _names(self._node, ""):
+            if name not in self._overrides:
+                yield name
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+def _names(node: _Node, prefix: str) -> Iterator[str]:
+    for leaf in node.frames:
+        yield prefix + leaf
+
+    for segment, child in node.children.items():
+        yield from _names(child, f"{prefix}{segment}::")
+
+
+class _TreeNode:
+    __slots__ = ("root", "parent", "depth", "up", "down")
+
+    def __init__(
+        self,
+        root: tf.Frame,
+        parent: Optional[tf.Frame],
+        depth: int,
+        up: Optional[tf.Link],
+        down: Optional[tf.Link],
+    ) -> None:
+        self.root = root
+        self.parent = parent
+        self.depth = depth
+        # link from this frame into its parent and vice versa
+        self.up = up
+        self.down = down
+
+
+class LinkTree:
+    """Spanning trees of a static frame graph.
+
+    Static frame graphs (the scaffolding) connect frames using invertible pose
+    links that form a tree. This class indexes the graph by rooting each
+    connected component at an arbitrary frame and storing each frame's parent
+    and depth. Afterwards, the chain between two frames is found by walking up
+    to their common ancestor in O(depth) instead of searching the graph.
+
+    Some elements add their pose to the scaffolding more than once. The
+    resulting parallel links (links between the same two frames) are assumed
+    to be equivalent, and only the first one is used.
+
+    Components are indexed lazily, i.e., the first time one of their frames is
+    used. The graph must not change afterwards.
+
+    """
+
+    def __init__(self) -> None:
+        self._nodes: Dict[tf.Frame, _TreeNode] = dict()
+        # roots of components that contain cycles
+        self._not_a_tree = set()
+
+    def links_between(self, parent: tf.Frame, child: tf.Frame) -> List[tf.Link]:
+        """The links that transform from ``parent`` into ``child``.
+
+        Parameters
+        ----------
+        parent : tf.Frame
+            The frame in which the chain starts.
+        child : tf.Frame
+            The frame in which the chain ends.
+
+        Returns
+        -------
+        links : List[tf.Link]
+            A chain equivalent to ``parent.links_between(child)``. If the
+            frames' component is not a tree, or if the chain would have to
+            traverse a one-way link in reverse, the result of
+            ``parent.links_between(child)`` is returned.
+
+        """
+
+        parent_node = self._node(parent)
+        child_node = self._node(child)
+
+        if (
+            parent_node.root is not child_node.root
+            or parent_node.root in self._not_a_tree
+        ):
+            return parent.links_between(child)
+
+        up_links: List[tf.Link] = list()
+        down_links: List[tf.Link] = list()
+
+        while parent_node.depth > child_node.depth:
+            up_links.append(parent_node.up)
+            parent_node = self._nodes[parent_node.parent]
+
+        while child_node.depth > parent_node.depth:
+            down_links.append(child_node.down)
+            child_node = self._nodes[child_node.parent]
+
+        while parent_node is not child_node:
+            up_links.append(parent_node.up)
+            parent_node = self._nodes[parent_node.parent]
+            down_links.append(child_node.down)
+            child_node = self._nodes[child_node.parent]
+
+        if None in up_links:
+            # the chain walks a one-way link backwards
+            return parent.links_between(child)
+
+        down_links.reverse()
+        return up_links + down_links
+
+    def _node(self, frame: tf.Frame) -> _TreeNode:
+        try:
+            return self._nodes[frame]
+        except KeyError:
+            pass
+
+        self._index(frame)
+        return self._nodes[frame]
+
+    def _index(self, root: tf.Frame) -> None:
+        nodes = self._nodes
+        nodes[root] = _TreeNode(root, None, 0, None, None)
+
+        frontier = [root]
+        while frontier:
+            frame = frontier.pop()
+            node = nodes[frame]
+
+            for child, link in frame._children:
+                if child in nodes:
+                    # parallel links are fine; anything else closes a cycle
+                    if child is not node.parent and nodes[child].parent is not frame:
+                        self._not_a_tree.add(root)
+                    continue
+
+                for neighbour, up in child._children:
+                    if neighbour is frame:
+                        break
+                else:
+                    # a one-way link, e.g., a projection
+                    up = None
+
+                nodes[child] = _TreeNode(root, frame, node.depth + 1, up, link)
+                frontier.append(child)
@@ -284,6 +284,7 @@ class Sdf(ElementBase):
         shape: Tuple[int] = (3,),
         axis: int = -1,
         apply_state: bool = True,
+        fuse_static: bool = False,
     ) -> Dict[str, List[tf.Frame]]:
         graphs = {
             "worlds": list(),
@@ -298,7 +299,14 @@ class Sdf(ElementBase):
             except IndexError:
                 break
 
-            root = world.to_dynamic_graph(frames, seed=seed, shape=shape, axis=axis)
+            root = world.to_dynamic_graph(
+                frames,
+                seed=seed,
+                shape=shape,
+                axis=axis,
+                fuse_static=fuse_static,
+                _scaffolding=scaffold["worlds"][idx],
+            )
             graphs["worlds"].append(root)
 
         for idx, model in enumerate(self._models):
@@ -313,7 +321,12 @@ class Sdf(ElementBase):
                 frames["world"] = tf.Frame(3, name="world")
 
             root = model.to_dynamic_graph(
-                frames, seed=seed, shape=shape, axis=axis, _scaffolding=static_frames
+                frames,
+                seed=seed,
+                shape=shape,
+                axis=axis,
+                fuse_static=fuse_static,
+                _scaffolding=static_frames,
             )
             graphs["models"].append(root)
 
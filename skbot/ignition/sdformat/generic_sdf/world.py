@@ -1,8 +1,11 @@
 from ..exceptions import ParseError
 from typing import Dict, List, Any, Tuple
 from itertools import chain
+import copy
 import warnings
 
+import numpy as np
+
 from .base import (
     ElementBase,
     NamedPoseBearing,
@@ -27,6 +30,7 @@ from .population import Population
 from .atmosphere import Atmosphere
 from .gui import Gui
 from .... import transform as tf
+from .scope import ScopedFrames
 
 
 class World(ElementBase):
@@ -179,7 +183,8 @@ class World(ElementBase):
     respectively.
 
     The `populations` kwarg is resolved upon construction and generated models
-    are appended to the list of `Worlds.models`.
+    are appended to the list of `Worlds.models`. Each population adds a single
+    (batched) model named after the population; see :class:`Population`.
 
     """
 
@@ -275,10 +280,18 @@ class World(ElementBase):
             self.models,
             self._joints,
         ]
-        for el in chain(*pose_bearing):
+        for el in chain(*pose_bearing, self.populations):
             if el.pose.relative_to is None:
                 el.pose.relative_to = "world"
 
+        # models generated by a population are batched into a single model
+        self._populations: Dict[str, Population] = dict()
+        for population in self.populations:
+            model = copy.copy(population.model)
+            model.name = population.name
+            self.models.append(model)
+            self._populations[model.name] = population
+
     @property
     def joints(self):
         warnings.warn(
@@ -363,18 +376,21 @@ class World(ElementBase):
         shape: Tuple[int] = ...,
         axis: int = -1,
     ) -> tf.Frame:
+        scopes = ScopedFrames(declared_frames)
+        world = {"world": declared_frames["world"]}
         for model in self.models:
-            scope = {
-                name.split("::", 1)[1]: frame
-                for name, frame in declared_frames.items()
-                if name.startswith(f"{model.name}::")
-            }
-            scope["world"] = declared_frames["world"]
+            scope = scopes.scope(model.name, overrides=world)
             model.to_static_graph(scope, seed=seed, shape=shape, axis=axis)
 
+        rng = np.random.default_rng(seed)
         for model in self.models:
-            link = model.pose.to_tf_link()
-            parent_name = model.pose.relative_to
+            if model.name in self._populations:
+                population = self._populations[model.name]
+                link = population.to_tf_link(seed=rng)
+                parent_name = population.pose.relative_to
+            else:
+                link = model.pose.to_tf_link()
+                parent_name = model.pose.relative_to
             child_name = f"{model.name}::{model.placement_frame}"
 
             parent = declared_frames[parent_name]
@@ -402,32 +418,28 @@ class World(ElementBase):
         shape: Tuple[int] = (3,),
         axis: int = -1,
         apply_state: bool = True,
+        fuse_static: bool = False,
         _scaffolding: Dict[str, tf.Frame] = None,
     ) -> tf.Frame:
         if _scaffolding is None:
             _scaffolding = self.declared_frames()
             self.to_static_graph(_scaffolding, seed=seed, shape=shape, axis=axis)
 
+        # index the scaffolding once; nested elements share the index
+        _scaffolding = ScopedFrames(_scaffolding, fuse=fuse_static)
+        scaffold_world = {"world": _scaffolding["world"]}
+        scopes = ScopedFrames(declared_frames)
+        world = {"world": declared_frames["world"]}
         for model in self.models:
-            scaffold_scope = {
-                name.split("::", 1)[1]: frame
-                for name, frame in _scaffolding.items()
-                if name.startswith(f"{model.name}::")
-            }
-            scaffold_scope["world"] = _scaffolding["world"]
-
-            scope = {
-                name.split("::", 1)[1]: frame
-                for name, frame in declared_frames.items()
-                if name.startswith(f"{model.name}::")
-            }
-            scope["world"] = declared_frames["world"]
+            scaffold_scope = _scaffolding.scope(model.name, overrides=scaffold_world)
+            scope = scopes.scope(model.name, overrides=world)
             model.to_dynamic_graph(
                 scope,
                 seed=seed,
                 shape=shape,
                 axis=axis,
                 apply_state=apply_state,
+                fuse_static=fuse_static,
                 _scaffolding=scaffold_scope,
             )
 
@@ -595,49 +607,8 @@ class World(ElementBase):
             return cls(**generic_args, sdf_version=version)
 
     class WorldPopulation(Population):
-        # def __init__(
-        #     self,
-        #     *,
-        #     name: str,
-        #     pose: Pose = None,
-        #     model_count: int = 1,
-        #     distribution: "Distribution",
-        #     box: "Box" = None,
-        #     cylinder: "Cylinder" = None,
-        #     model: Model,
-        #     frames: List[Frame] = None,
-        # ) -> None:
-        #     super().__init__(name=name, pose=pose)
-        #     self.name=name
-        #     self.model_count = model_count
-        #     self.distribution = distribution
-        #     self.box = box
-        #     self.cylinder = cylinder
-        #     self.model = model
-        #     self.frames = frames
-
-        #     if frames is None:
-        #         self.frames = list()
-
-        class Distribution(ElementBase):
-            def __init__(
-                self,
-                *,
-                kind: str = "random",
-                rows: int = 1,
-                cols: int = 1,
-                step: Tuple[float] = (0.5, 0.5, 0),
-            ):
-                self.type = kind
-                self.rows = rows
-                self.cols = cols
-                self.step = step
-
-        class Box(ElementBase):
-            def __init__(self, *, size: Tuple[float] = (1, 1, 1)) -> None:
-                self.size = size
-
-        class Cylinder(ElementBase):
-            def __init__(self, *, radius: float = 1, length: float = 1) -> None:
-                self.radius = radius
-                self.length = length
+        """A population of models in a world.
+
+        See :class:`Population` for details.
+
+        """
@@ -1,8 +1,9 @@
 from . import sdformat
+from .cache import cache_key, cached_parse
 from .generic_sdf.sdf import Sdf
 
 
-def loads_generic(sdf: str):
+def loads_generic(sdf: str, *, use_cache: bool = True, cache_dir: str = None):
     """Turn a SDFormat string into an object tree.
 
     The returned object tree is oppinionated. In addition to converting the
@@ -27,6 +28,12 @@ def loads_generic(sdf: str):
     ----------
     sdf : str
         A string containing SDFormat XML.
+    use_cache : bool
+        If ``True`` (default), memoize the generic tree in scikit-bot's
+        in-memory cache. See :func:`skbot.ignition.sdformat.loads`.
+    cache_dir : str
+        If not ``None``, additionally store the generic tree in this folder.
+        See :func:`skbot.ignition.sdformat.loads`.
 
     Returns
     -------
@@ -36,7 +43,11 @@ def loads_generic(sdf: str):
     """
 
     version = sdformat.get_version(sdf)
-    specific_tree = sdformat.loads(sdf)
-    generic_tree = Sdf.from_specific(specific_tree, version=version)
 
-    return generic_tree
+    def parse():
+        # the generic tree is cached; no need to cache the specific tree, too
+        specific_tree = sdformat.loads(sdf, use_cache=False)
+        return Sdf.from_specific(specific_tree, version=version)
+
+    key = cache_key(sdf, "generic", version)
+    return cached_parse(key, parse, use_cache=use_cache, cache_dir=cache_dir)
@@ -0,0 +1,113 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Union
+
+from ...ros import create_frame_graph
+from . import sdformat
+from .load_as_generic import loads_generic
+from .transform_factory import to_frame_graph
+
+_loaders = {
+    "specific": sdformat.loads,
+    "generic": loads_generic,
+    "frame_graph": to_frame_graph,
+}
+
+
+def _load_file(path: Path, output: str, kwargs: Dict[str, Any]) -> Any:
+    text = path.read_text()
+
+    if path.suffix.lower() == ".urdf":
+        return create_frame_graph(text)
+
+    return _loaders[output](text, **kwargs)
+
+
+def load_many(
+    paths: Iterable[Union[str, os.PathLike]],
+    *,
+    output: str = "generic",
+    n_jobs: int = None,
+    chunksize: int = None,
+    **kwargs,
+) -> List[Any]:
+    """Load many SDFormat (and URDF) files in parallel.
+
+    Files are parsed in a pool of worker processes and the results are sent
+    back to the calling process. This scales with the number of CPU cores
+    (parsing is CPU bound and holds the GIL, so threads wouldn't help).
+
+    Parameters
+    ----------
+    paths : Iterable[Union[str, os.PathLike]]
+        The files to load. Files with a ``.urdf`` suffix are loaded using
+        :func:`skbot.ros.create_frame_graph`; all other files are treated as
+        SDFormat.
+    output : str
+        What to create from each SDFormat file. Possible values are:
+
+            "generic"
+                A generic SDF tree (default). See
+                :func:`skbot.ignition.sdformat.loads_generic`.
+            "specific"
+                A version-specific SDF tree. See
+                :func:`skbot.ignition.sdformat.loads`.
+            "frame_graph"
+                A frame graph. See
+                :func:`skbot.ignition.sdformat.to_frame_graph`.
+
+        URDF files can only be loaded as frame graphs.
+    n_jobs : int
+        The number of worker processes. If None or -1 (default), use one
+        process per CPU core. If 1, load the files in the calling process.
+    chunksize : int
+        The number of files sent to a worker at a time. If None, split the
+        files into about four chunks per worker.
+    kwargs : Any
+        Additional keyword arguments passed to the function that loads each
+        SDFormat file, e.g., ``shape`` for ``output="frame_graph"`` or
+        ``cache_dir`` for ``output="generic"``.
+
+    Returns
+    -------
+    results : List[Any]
+        The loaded files in the order of ``paths``.
+
+    Notes
+    -----
+    Each worker process has its own copy of the module-level parser state
+    (``xml_ctx`` and the in-memory parse cache). Use ``cache_dir`` to share
+    parsed trees between workers and runs.
+
+    Warnings raised while loading a file in a worker process are not
+    forwarded to the calling process.
+
+    """
+
+    paths = [Path(x) for x in paths]
+
+    if output not in _loaders:
+        raise ValueError(f"Unknown output: `{output}`.")
+
+    if output != "frame_graph":
+        for path in paths:
+            if path.suffix.lower() == ".urdf":
+                raise ValueError(f"URDF can only be loaded as frame graph: {path}")
+
+    if n_jobs is None or n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    n_jobs = min(n_jobs, len(paths))
+
+    if n_jobs <= 1:
+        return [_load_file(path, output, kwargs) for path in paths]
+
+    if chunksize is None:
+        chunksize = max(1, len(paths) // (4 * n_jobs))
+
+    with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+        results = pool.map(
+            _load_file, paths, repeat(output), repeat(kwargs), chunksize=chunksize
+        )
+        return list(results)
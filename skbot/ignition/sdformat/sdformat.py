@@ -5,13 +5,16 @@ from xsdata.formats.dataclass.parsers import XmlParser
 from xsdata.formats.dataclass.parsers.config import ParserConfig
 from xsdata.formats.dataclass.serializers import XmlSerializer
 from xsdata.formats.dataclass.serializers.config import SerializerConfig
+from xsdata.formats.dataclass.serializers.writers import XmlEventWriter
 from xsdata.formats.dataclass.parsers import handlers
 from xsdata.exceptions import ParserError as XSDataParserError
 import io
-from typing import Dict, Callable, Type, TypeVar
+from typing import BinaryIO, Dict, Callable, TextIO, Type, TypeVar, Union
 import importlib
 import warnings
 from .exceptions import ParseError
+from .cache import cache_key, cached_parse
+from . import fast_parser
 
 
 T = TypeVar("T")
@@ -30,6 +33,8 @@ _parser_roots = {
 
 # recommended to reuse the same parser context
 # see: https://xsdata.readthedocs.io/en/latest/xml.html
+# The context only caches the (immutable) metadata of binding classes. Threads
+# that race on a cache miss build identical entries, so sharing it is safe.
 xml_ctx = XmlContext()
 
 
@@ -56,7 +61,11 @@ def get_version(sdf: str) -> str:
 
     """
 
-    parser = ElementTree.iterparse(io.StringIO(sdf), events=("start",))
+    return _read_version(io.StringIO(sdf))
+
+
+def _read_version(stream: Union[TextIO, BinaryIO]) -> str:
+    parser = ElementTree.iterparse(stream, events=("start",))
 
     _, root = next(parser)
 
@@ -78,6 +87,8 @@ def loads(
     version: str = None,
     custom_constructor: Dict[Type[T], Callable] = None,
     handler: str = None,
+    use_cache: bool = True,
+    cache_dir: str = None,
 ):
     """Convert an XML string into a sdformat.models tree.
 
@@ -95,13 +106,24 @@ def loads(
         bound classes or to replace them entirely.
     handler : str
         The handler that the parser should use when traversing the XML. If
-        unspecified the default xsData parser will be used (lxml if it is
+        unspecified scikit-bot's fast parser will be used (see
+        :mod:`skbot.ignition.sdformat.fast_parser`), and documents it can't
+        handle are parsed by the default xsData parser (lxml if it is
         installed, otherwise xml.etree). Possible values are:
 
             "XmlEventHandler"
                 A xml.etree event-based handler.
             "LxmlEventHandler"
                 A lxml.etree event-based handler.
+    use_cache : bool
+        If ``True`` (default), memoize the parsed tree in scikit-bot's
+        in-memory cache (``skbot.ignition.sdformat.cache.parse_cache``). The
+        cache is keyed by the hash of the SDF string, the version, and the
+        handler. Each call returns an independent copy of the tree.
+    cache_dir : str
+        If not ``None``, additionally store the parsed tree in this folder so
+        that subsequent runs of the program can skip parsing. See
+        :class:`skbot.ignition.sdformat.cache.FileParseCache`.
 
     Returns
     -------
@@ -112,7 +134,16 @@ def loads(
     Notes
     -----
     ``custom_constructure`` is currently disabled and has no effect. It will
-    become available with xsData v21.8.
+    become available with xsData v21.8. Trees are not cached if a
+    ``custom_constructor`` is given.
+
+    To manually reset the in-memory cache call
+    ``skbot.ignition.sdformat.cache.parse_cache.clear()``.
+
+    This function is thread-safe; however, parsing holds the GIL, so threads
+    won't speed up loading many files. Use
+    :func:`skbot.ignition.sdformat.load_many` instead, which parses in a
+    process pool.
 
     Examples
     --------
@@ -120,18 +151,96 @@ def loads(
 
     """
 
-    if custom_constructor is None:
+    if custom_constructor:
+        # can't hash the constructors reliably
+        use_cache = False
+        cache_dir = None
+    else:
         custom_constructor = dict()
 
-    def custom_class_factory(clazz, params):
-        if clazz in custom_constructor:
-            return custom_constructor[clazz](**params)
+    if version is None:
+        version = get_version(sdf)
 
-        return clazz(**params)
+    handler_class = _handler_class(handler)
+
+    def parse():
+        return _parse(sdf, version, handler, custom_constructor)
+
+    key = cache_key(sdf, "specific", version, handler_class.__name__)
+    return cached_parse(key, parse, use_cache=use_cache, cache_dir=cache_dir)
+
+
+def load(
+    fp: Union[TextIO, BinaryIO],
+    *,
+    version: str = None,
+    handler: str = None,
+):
+    """Convert a file containing SDFormat XML into a sdformat.models tree.
+
+    Unlike :func:`loads`, this function reads the file incrementally instead of
+    loading it into a string first.
+
+    Parameters
+    ----------
+    fp : Union[TextIO, BinaryIO]
+        A seekable file-like object (text or binary) positioned at the start
+        of the SDFormat XML. Text is encoded as UTF-8 before parsing.
+    version : str
+        The SDFormat version to use while parsing. If None (default) it will
+        automatically determine the version from the <sdf> element.
+    handler : str
+        The handler that the parser should use when traversing the XML. See
+        :func:`loads` for details.
+
+    Returns
+    -------
+    SdfRoot : object
+        An instance of ``skbot.ignition.models.vXX.Sdf`` where XX corresponds to the
+        version of the SDFormat XML.
+
+    Notes
+    -----
+    Parsed trees are not cached, because computing the cache key requires
+    the entire file.
+
+    """
+
+    stream = _EncodedReader(fp) if isinstance(fp, io.TextIOBase) else fp
+    start = stream.tell()
 
     if version is None:
-        version = get_version(sdf)
+        version = _read_version(stream)
+        stream.seek(start)
 
+    return _parse(stream, version, handler, dict())
+
+
+class _EncodedReader(io.RawIOBase):
+    """Binary (UTF-8) view of a text stream."""
+
+    def __init__(self, stream: TextIO) -> None:
+        self._stream = stream
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return self._stream.seekable()
+
+    def read(self, size: int = -1) -> bytes:
+        # a character is at most 4 bytes long
+        size = -1 if size is None or size < 0 else max(1, size // 4)
+        return self._stream.read(size).encode("utf-8")
+
+    def tell(self) -> int:
+        return self._stream.tell()
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        return self._stream.seek(offset, whence)
+
+
+def _handler_class(handler: str = None) -> Type:
     if handler in ["XmlSaxHandler", "LxmlSaxHandler"]:
         warnings.warn(
             "SAX handlers have been deprecated in xsData >= 21.9;"
@@ -145,16 +254,39 @@ def loads(
     elif handler == "LxmlSaxHandler":
         handler = "LxmlEventHandler"
 
-    handler_class = {
+    return {
         None: handlers.default_handler(),
         "XmlEventHandler": handlers.XmlEventHandler,
         "LxmlEventHandler": handlers.LxmlEventHandler,
     }[handler]
 
+
+def _parse(
+    source: Union[str, BinaryIO],
+    version: str,
+    handler: str,
+    custom_constructor: Dict[Type[T], Callable],
+):
+    def custom_class_factory(clazz, params):
+        if clazz in custom_constructor:
+            return custom_constructor[clazz](**params)
+
+        return clazz(**params)
+
+    handler_class = _handler_class(handler)
     binding_location = _parser_roots[version]
 
     bindings = importlib.import_module(binding_location, __name__)
 
+    if handler is None and not custom_constructor:
+        start = None if isinstance(source, str) else source.tell()
+        try:
+            return fast_parser.parse(source, bindings.Sdf, xml_ctx)
+        except fast_parser.FastPathError:
+            # xsData either parses the document or reports the error
+            if start is not None:
+                source.seek(start)
+
     sdf_parser = XmlParser(
         ParserConfig(class_factory=custom_class_factory),
         context=xml_ctx,
@@ -162,7 +294,10 @@ def loads(
     )
 
     try:
-        root_el = sdf_parser.from_string(sdf, bindings.Sdf)
+        if isinstance(source, str):
+            root_el = sdf_parser.from_string(source, bindings.Sdf)
+        else:
+            root_el = sdf_parser.parse(source, bindings.Sdf)
     except XSDataParserError as e:
         raise ParseError("Invalid SDFormat XML.") from e
 
@@ -195,3 +330,42 @@ def dumps(root_element, *, format=False) -> str:
     serializer = XmlSerializer(config=SerializerConfig(pretty_print=format))
 
     return serializer.render(root_element)
+
+
+def dump(root_element, fp: Union[TextIO, BinaryIO], *, format=False) -> None:
+    """Serialize a SDFormat object into a file.
+
+    Unlike :func:`dumps`, the XML is written incrementally while the tree is
+    traversed, i.e., the serialized document is never held in memory.
+
+    Parameters
+    ----------
+    root_element : object
+        An instance of ``skbot.ignition.models.vXX.Sdf``. XX represents the SDFormat
+        version and can be any version currently supported by scikit-bot.
+    fp : Union[TextIO, BinaryIO]
+        The file-like object (text or binary) to write to. Binary files are
+        written as UTF-8.
+    format : bool
+        If true, add indentation and linebreaks to the output to increase human
+        readability. If false (default) the entire XML will appear as a single
+        line with no spaces between elements.
+
+    """
+
+    # unlike the default (lxml) writer, XmlEventWriter doesn't build a tree
+    serializer = XmlSerializer(
+        config=SerializerConfig(pretty_print=format), writer=XmlEventWriter
+    )
+
+    if isinstance(fp, io.TextIOBase):
+        serializer.write(fp, root_element)
+        return
+
+    text_fp = io.TextIOWrapper(fp, encoding="utf-8")
+    try:
+        serializer.write(text_fp, root_element)
+    finally:
+        text_fp.flush()
+        # don't close fp when text_fp is garbage collected
+        text_fp.detach()
@@ -12,10 +12,17 @@ def to_frame_graph(
     unwrap: bool = True,
     insert_world_frame: bool = True,
     shape: Tuple[int] = (3,),
-    axis: int = -1
-) -> Union[tf.Frame, List[tf.Frame]]:
+    axis: int = -1,
+    fuse_static: bool = False,
+    as_kinematic_tree: bool = False,
+    seed: int = None
+) -> Union[tf.Frame, List[tf.Frame], tf.KinematicTree, List[tf.KinematicTree]]:
     """Create a frame graph from a sdformat string.
 
+    .. versionadded:: 0.15.0
+        Added the ability to fuse static links (``fuse_static``) and to
+        export kinematic trees (``as_kinematic_tree``), and the ``seed`` used
+        to expand populations.
     .. versionadded:: 0.8.0
         Added the ability to limit loading to worlds
     .. versionadded:: 0.6.0
@@ -56,12 +63,31 @@ def to_frame_graph(
         The axis along which elements are stored. The axis must have length 3
         (since SDFormat describes 3 dimensional worlds), and all other axis are
         considered batch dimensions. Defaults to -1.
+    fuse_static : bool
+        If ``True``, each chain of static links between two dynamic frames,
+        e.g., the poses between a link and a joint, is fused into a single
+        :class:`skbot.transform.AffineMatrix`. This makes evaluating the graph
+        (e.g., forward kinematics) cheaper, but the fused links no longer
+        expose their components, e.g., the ``EulerRotation`` of a pose.
+        Defaults to ``False``.
+    as_kinematic_tree : bool
+        If ``True``, convert each frame graph into a
+        :class:`skbot.transform.KinematicTree` rooted at the graph's root frame
+        and return the trees instead. Joints are ordered as they are found
+        (breadth-first) in the graph. This requires ``shape=(3,)`` and a graph
+        without kinematic loops. Defaults to ``False``.
+    seed : int
+        The seed to use when procedurally generating elements of the
+        simulation, i.e., when sampling the positions of the models of a
+        :class:`Population <skbot.ignition.sdformat.generic_sdf.population.Population>`.
+        If None (default), fresh entropy is used.
 
     Returns
     -------
-    frame_graph : Union[Frame, List[Frame]]
+    frame_graph : Union[Frame, List[Frame], KinematicTree, List[KinematicTree]]
         A :class:`skbot.transform.Frame` or list of Frames depending on the value of
-        ``unwrap`` and the number of elements in the SDF's root element.
+        ``unwrap`` and the number of elements in the SDF's root element. If
+        ``as_kinematic_tree`` is set, KinematicTrees instead of Frames.
 
     See Also
     --------
@@ -86,7 +112,9 @@ def to_frame_graph(
 
     root = loads_generic(sdf)
     declared_frames = root.declared_frames()
-    dynamic_graphs = root.to_dynamic_graph(declared_frames, shape=shape, axis=axis)
+    dynamic_graphs = root.to_dynamic_graph(
+        declared_frames, seed=seed, shape=shape, axis=axis, fuse_static=fuse_static
+    )
 
     if insert_world_frame:
         candidates = dynamic_graphs.values()
@@ -100,6 +128,9 @@ def to_frame_graph(
     if len(graphs) == 0:
         raise ValueError("No graphs could be loaded from the provided SDF.")
 
+    if as_kinematic_tree:
+        graphs = [tf.KinematicTree.from_frame_graph(x) for x in graphs]
+
     if unwrap and len(graphs) == 1:
         return graphs[0]
     else:
@@ -1,10 +1,60 @@
+import asyncio
+import betterproto
+import threading
+import time
 import zmq
-import subprocess
-import socket
-import os
-import getpass
+import zmq.asyncio
+import uuid
+from typing import Dict, List, Tuple
 
 from . import messages
+from .discovery import DiscoveryClient, shared_client
+
+
+def default_parser(msg: List[bytes]) -> betterproto.Message:
+    """Decode a ZMQ message into a ``skbot.ignition.messages`` object."""
+    message_type = bytes(msg[3]).decode("utf-8").split(".")[-1]
+    return getattr(messages, message_type)().parse(bytes(msg[2]))
+
+
+def notify_publisher(
+    publisher: messages.DiscoveryPublisher,
+    process_uuid: str,
+    node_uuid: str,
+    connection_type: messages.DiscoveryType,
+) -> None:
+    """Register (or unregister) a remote subscriber with a publisher.
+
+    ign-transport only sends messages to processes that registered as remote
+    subscriber via the publisher's control socket. Tracking issue:
+    https://github.com/ignitionrobotics/ign-transport/issues/225
+
+    Parameters
+    ----------
+    publisher : messages.DiscoveryPublisher
+        The publisher as announced during discovery.
+    process_uuid : str
+        The UUID of the subscribing process (the discovery client).
+    node_uuid : str
+        The UUID of the subscribing node.
+    connection_type : messages.DiscoveryType
+        Either ``NEW_CONNECTION`` or ``END_CONNECTION``.
+
+    """
+
+    control = zmq.Context.instance().socket(zmq.DEALER)
+    control.setsockopt(zmq.LINGER, 200)
+    control.connect(publisher.msg_pub.ctrl)
+    control.send_multipart(
+        [
+            publisher.topic.encode("utf-8"),
+            process_uuid.encode("utf-8"),
+            node_uuid.encode("utf-8"),
+            publisher.msg_pub.msg_type.encode("utf-8"),
+            str(int(connection_type)).encode("utf-8"),
+        ]
+    )
+    control.close()
 
 
 class Subscriber:
@@ -22,7 +72,15 @@ class Subscriber:
     .. _`Ign-Transport documentation`: https://ignitionrobotics.org/api/transport/9.1/index.html
     """
 
-    def __init__(self, topic: str, *, parser=None):
+    def __init__(
+        self,
+        topic: str,
+        *,
+        parser=None,
+        discovery: DiscoveryClient = None,
+        discovery_timeout: float = 1.0,
+        copy: bool = True,
+    ):
         """Initialize a new subscriber for the given topic.
 
         Creates an object that uses a context manager to subscribe to
@@ -38,6 +96,19 @@ class Subscriber:
             (zmq_topic, protobuf_message, message_type). If None, the subscriber
             will use a default parser that converts ``protobuf_message`` into a
             ``skbot.ignition.message.<message_type>`` data object.
+        discovery : DiscoveryClient
+            The client used to look up the publisher of the topic. If None, use
+            the process-wide client of the default partition (see
+            :func:`skbot.ignition.discovery.shared_client`).
+        discovery_timeout : float
+            Time (in s) to wait for a publisher of the topic to announce itself
+            when entering the context.
+        copy : bool
+            If False, receive messages without copying them out of ZMQ's
+            buffers. The parser then receives ``zmq.Frame`` objects instead of
+            ``bytes``. Use this together with the parsers in
+            :mod:`skbot.ignition.parsers` to access bulk data without copying
+            it.
 
         Returns
         -------
@@ -46,21 +117,15 @@ class Subscriber:
             manager
 
         """
-        context = zmq.Context()
-        self.socket = context.socket(zmq.SUB)
+        self.socket = zmq.Context.instance().socket(zmq.SUB)
         self.topic = topic
+        self.discovery = shared_client() if discovery is None else discovery
+        self.discovery_timeout = discovery_timeout
+        self.node_uuid = str(uuid.uuid4())
+        self.copy = copy
+        self.socket.subscribe(self.discovery.fully_qualified(topic))
 
-        # this could be streamlined by speaking the ign-transport discovery protcol
-        host_name = socket.gethostname()
-        user_name = getpass.getuser()
-        self.socket.subscribe(f"@/{host_name}:{user_name}@{topic}")
-
-        if parser is None:
-            self.parser = lambda msg: getattr(
-                messages, msg[3].decode("utf-8").split(".")[-1]
-            )().parse(msg[2])
-        else:
-            self.parser = parser
+        self.parser = default_parser if parser is None else parser
 
     def recv(self, blocking=True, timeout=1000) -> tuple:
         """Receive a message from the topic
@@ -87,9 +152,9 @@ class Subscriber:
 
         try:
             if blocking:
-                msg = self.socket.recv_multipart()
+                msg = self.socket.recv_multipart(copy=self.copy)
             else:
-                msg = self.socket.recv_multipart(zmq.NOBLOCK)
+                msg = self.socket.recv_multipart(zmq.NOBLOCK, copy=self.copy)
         except zmq.Again:
             raise IOError(f"Topic {self.topic} did not send a message.")
 
@@ -98,33 +163,355 @@ class Subscriber:
         return result
 
     def __enter__(self):
-        # weird hack to encourage ign-transport to actually publish camera
-        # messages start an echo subscriber and print the messages into the void
-        # to make ign realize that something is listening to the topic tracking
-        # issue: https://github.com/ignitionrobotics/ign-transport/issues/225
-        self.echo_subscriber = subprocess.Popen(
-            ["ign", "topic", "-e", "-t", self.topic], stdout=open(os.devnull, "w")
+        self.discovery.start()
+        self.publisher = self.discovery.wait_for_publisher(
+            self.topic, timeout=self.discovery_timeout
         )
+        self.address = self.publisher.address
 
-        # this is a bad hack and should be implemented by talking the
-        # ign-transport discovery protocol
-        result = subprocess.check_output(f"ign topic -i -t {self.topic}", shell=True)
-        self.address = (
-            result.decode("utf-8")
-            .split("\n")[1]
-            .split(",")[0]
-            .replace("\t", "")
-            .replace(" ", "")
+        self.socket.connect(self.address)
+        notify_publisher(
+            self.publisher,
+            self.discovery.process_uuid,
+            self.node_uuid,
+            messages.DiscoveryType.NEW_CONNECTION,
         )
 
-        if not self.address:
-            self.echo_subscriber.terminate()
-            raise IOError(f"Could not identify socket for {self.topic}.")
+        return self
 
-        self.socket.connect(self.address)
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        notify_publisher(
+            self.publisher,
+            self.discovery.process_uuid,
+            self.node_uuid,
+            messages.DiscoveryType.END_CONNECTION,
+        )
+        self.socket.disconnect(self.address)
+
+
+class ConflatingSubscriber(Subscriber):
+    """Keep only the latest message of an Ignition topic.
+
+    A background thread continuously drains the subscription and keeps only
+    the most recent (raw) message. Messages are parsed lazily, i.e., only when
+    they are requested and at most once, so messages that nobody reads are
+    never parsed. This bounds the latency of control loops that only care
+    about the newest state (e.g., the latest camera frame or pose).
+
+    Attributes
+    ----------
+    received_count : int
+        The number of messages received since entering the context.
+    dropped_count : int
+        The number of received messages that were replaced by a newer message
+        before being read. Messages dropped by ZMQ due to the high water mark
+        are not counted.
+
+    Notes
+    -----
+    ZMQ's ``ZMQ_CONFLATE`` option does not support multipart messages (which
+    ign-transport uses), so the subscriber limits ZMQ's queue via
+    ``ZMQ_RCVHWM`` instead and conflates in the background thread.
+
+    """
+
+    def __init__(
+        self,
+        topic: str,
+        *,
+        parser=None,
+        discovery: DiscoveryClient = None,
+        discovery_timeout: float = 1.0,
+        copy: bool = True,
+        receive_hwm: int = 1,
+    ):
+        """Initialize a new subscriber for the given topic.
+
+        Parameters
+        ----------
+        topic : str
+            The name of the topic to subscribe to as shown by `ign topic -l`.
+        parser : function
+            A function that deserializes the message. See :class:`Subscriber`
+            for details. If None, use the default parser.
+        discovery : DiscoveryClient
+            The client used to look up the publisher of the topic. If None, use
+            the process-wide client of the default partition.
+        discovery_timeout : float
+            Time (in s) to wait for a publisher of the topic to announce itself
+            when entering the context.
+        copy : bool
+            If False, receive messages without copying them out of ZMQ's
+            buffers. See :class:`Subscriber` for details.
+        receive_hwm : int
+            The maximum number of messages ZMQ queues for this subscriber.
+
+        """
+
+        super().__init__(
+            topic,
+            parser=parser,
+            discovery=discovery,
+            discovery_timeout=discovery_timeout,
+            copy=copy,
+        )
+        self.socket.setsockopt(zmq.RCVHWM, receive_hwm)
+
+        self.received_count = 0
+        self.dropped_count = 0
+        self._raw = None
+        self._parsed = None
+        self._timestamp = None
+        self._is_read = True
+        self._last_returned = 0
+        self._new_message = threading.Condition()
+        self._running = threading.Event()
+        self._thread = None
+
+    def _run(self) -> None:
+        while self._running.is_set():
+            if not self.socket.poll(50):
+                continue
+
+            msg = self.socket.recv_multipart(copy=self.copy)
+            timestamp = time.monotonic()
+
+            with self._new_message:
+                if not self._is_read:
+                    self.dropped_count += 1
+                self.received_count += 1
+                self._raw = msg
+                self._parsed = None
+                self._timestamp = timestamp
+                self._is_read = False
+                self._new_message.notify_all()
+
+    def _wait(self, predicate, timeout: float) -> Tuple[object, float]:
+        with self._new_message:
+            if not self._new_message.wait_for(predicate, timeout):
+                raise IOError(f"Topic {self.topic} did not send a message.")
+            raw, parsed = self._raw, self._parsed
+            sequence, timestamp = self.received_count, self._timestamp
+            self._is_read = True
+
+        if parsed is None:
+            # parse outside the lock to not block the receiver
+            parsed = self.parser(raw)
+            with self._new_message:
+                if sequence == self.received_count:
+                    self._parsed = parsed
+
+        self._last_returned = sequence
+        return parsed, timestamp
+
+    def latest(self, timeout: float = None) -> Tuple[object, float]:
+        """Get the most recent message.
+
+        Parameters
+        ----------
+        timeout : float
+            Time (in s) to wait if no message has been received yet. If the
+            time is exceeded, an IOError will be raised. If None (default),
+            wait indefinitely.
+
+        Returns
+        -------
+        msg : PyObject
+            The most recent message as returned by the parser. Calling this
+            repeatedly without a new message arriving returns the same object.
+        timestamp : float
+            The time (``time.monotonic()``) at which the message was received.
+
+        """
+
+        return self._wait(lambda: self._raw is not None, timeout)
+
+    def recv(self, blocking=True, timeout=1000) -> tuple:
+        """Receive the most recent message that hasn't been returned yet.
+
+        Parameters
+        ----------
+        blocking : bool
+            If True (default) block until a new message is received. If False,
+            raise an IOError if no new message is available.
+        timeout : int
+            Time (in ms) to wait for a message to arrive. If the time is
+            exceeded, an IOError will be raised. Will wait indefinitely if set
+            to `-1`. This only works if ``blocking=True``.
+
+        Returns
+        -------
+        msg : PyObject
+            The result of the parser.
+
+        """
+
+        if not blocking:
+            timeout = 0
+        timeout = None if timeout == -1 else timeout / 1000
+
+        msg, _ = self._wait(lambda: self.received_count > self._last_returned, timeout)
+        return msg
+
+    def __enter__(self):
+        super().__enter__()
+        self._running.set()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
 
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.socket.disconnect(self.address)
-        self.echo_subscriber.terminate()
+        self._running.clear()
+        self._thread.join()
+        super().__exit__(exc_type, exc_val, exc_tb)
+
+
+class AsyncSubscriber:
+    """Subscribe and listen to many Ignition topics using asyncio.
+
+    Receives messages from all given topics through a single ZMQ socket
+    created from the process-wide ``zmq.asyncio`` context. Messages are
+    delivered in the order in which they arrive, regardless of their topic,
+    which allows a single coroutine to listen to many topics without
+    dedicating a thread to each of them.
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+        async with AsyncSubscriber(["/clock", "/camera"]) as sub:
+            async for topic, msg in sub:
+                ...
+
+    """
+
+    def __init__(
+        self,
+        topics: List[str],
+        *,
+        parser=None,
+        discovery: DiscoveryClient = None,
+        discovery_timeout: float = 1.0,
+        copy: bool = True,
+    ):
+        """Initialize a new subscriber for the given topics.
+
+        Parameters
+        ----------
+        topics : List[str]
+            The names of the topics to subscribe to as shown by `ign topic -l`.
+            A single topic may be passed as a string.
+        parser : function
+            A function that deserializes the message. See
+            :class:`Subscriber` for details. If None, use the default parser.
+        discovery : DiscoveryClient
+            The client used to look up the publishers of the topics. If None,
+            use the process-wide client of the default partition.
+        discovery_timeout : float
+            Time (in s) to wait for a publisher of each topic to announce itself
+            when entering the context.
+        copy : bool
+            If False, receive messages without copying them out of ZMQ's
+            buffers. See :class:`Subscriber` for details.
+
+        """
+
+        if isinstance(topics, str):
+            topics = [topics]
+
+        self.topics = list(topics)
+        self.parser = default_parser if parser is None else parser
+        self.discovery = shared_client() if discovery is None else discovery
+        self.discovery_timeout = discovery_timeout
+        self.node_uuid = str(uuid.uuid4())
+        self.copy = copy
+        self.publishers: Dict[str, messages.DiscoveryPublisher] = dict()
+        self._addresses = set()
+
+        # map wire names back to topic names
+        self._names = {self.discovery.fully_qualified(t): t for t in self.topics}
+
+        self.socket = zmq.asyncio.Context.instance().socket(zmq.SUB)
+        for name in self._names:
+            self.socket.subscribe(name)
+
+    async def recv(self, timeout: float = None) -> Tuple[str, object]:
+        """Receive the next message from any of the topics.
+
+        Parameters
+        ----------
+        timeout : float
+            Time (in s) to wait for a message to arrive. If the time is
+            exceeded, an IOError will be raised. If None (default), wait
+            indefinitely.
+
+        Returns
+        -------
+        topic : str
+            The topic on which the message was received.
+        msg : PyObject
+            The result of the parser.
+
+        """
+
+        try:
+            msg = await asyncio.wait_for(
+                self.socket.recv_multipart(copy=self.copy), timeout
+            )
+        except asyncio.TimeoutError:
+            raise IOError(f"Topics {self.topics} did not send a message.")
+
+        return self._names[bytes(msg[0]).decode("utf-8")], self.parser(msg)
+
+    def __aiter__(self) -> "AsyncSubscriber":
+        return self
+
+    async def __anext__(self) -> Tuple[str, object]:
+        return await self.recv()
+
+    async def __aenter__(self) -> "AsyncSubscriber":
+        self.discovery.start()
+        loop = asyncio.get_running_loop()
+        publishers = await asyncio.gather(
+            *[
+                loop.run_in_executor(
+                    None,
+                    self.discovery.wait_for_publisher,
+                    topic,
+                    self.discovery_timeout,
+                )
+                for topic in self.topics
+            ]
+        )
+
+        for topic, publisher in zip(self.topics, publishers):
+            self.publishers[topic] = publisher
+            # one connection per publisher; topics are filtered by subscription
+            if publisher.address not in self._addresses:
+                self.socket.connect(publisher.address)
+                self._addresses.add(publisher.address)
+            notify_publisher(
+                publisher,
+                self.discovery.process_uuid,
+                self.node_uuid,
+                messages.DiscoveryType.NEW_CONNECTION,
+            )
+
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        for publisher in self.publishers.values():
+            notify_publisher(
+                publisher,
+                self.discovery.process_uuid,
+                self.node_uuid,
+                messages.DiscoveryType.END_CONNECTION,
+            )
+
+        for address in self._addresses:
+            self.socket.disconnect(address)
+
+        self.publishers.clear()
+        self._addresses.clear()
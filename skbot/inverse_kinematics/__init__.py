@@ -33,11 +33,36 @@ IK Algorithms
 
     skbot.inverse_kinematics.ccd
     skbot.inverse_kinematics.gd
+    skbot.inverse_kinematics.dls
+
+Utilities
+---------
+
+.. autosummary::
+    :toctree:
+
+    IKResult
+    SolutionCache
+    ReachabilityMap
 
 """
 
 from .targets import Target, PositionTarget, RotationTarget
 from .cyclic_coordinate_descent import ccd
 from .gradient_descent import gd
+from .damped_least_squares import dls
+from .result import IKResult
+from .cache import SolutionCache
+from .reachability import ReachabilityMap
 
-__all__ = ["ccd", "gd", "Target", "PositionTarget", "RotationTarget"]
+__all__ = [
+    "ccd",
+    "gd",
+    "dls",
+    "Target",
+    "PositionTarget",
+    "RotationTarget",
+    "IKResult",
+    "SolutionCache",
+    "ReachabilityMap",
+]
@@ -0,0 +1,228 @@
+from .. import transform as tf
+from .targets import Target, PositionTarget, RotationTarget
+from .targets import _apply_rotation_chain
+from typing import List, Optional
+import numpy as np
+from scipy.spatial import cKDTree
+
+
+class SolutionCache:
+    """Nearest-neighbor cache of IK solutions.
+
+    .. versionadded:: 0.15.0
+
+    The cache maps the goal of a set of targets - the desired positions and
+    rotations - to the joint values that reached it. IK solvers that are given
+    a cache (see e.g. :func:`ccd <skbot.inverse_kinematics.ccd>`) look up the
+    solution of the nearest previously solved goal and use it as initial
+    guess if it scores better than the current joint values. On success, they
+    add their solution to the cache. This speeds up repeated queries in the
+    same region of the workspace, e.g., IK along a dense path.
+
+    A cache belongs to one IK problem, i.e., it must always be used with the
+    same joints and the same kind and number of targets until it is cleared.
+
+    Parameters
+    ----------
+    maxsize : int
+        The maximum number of solutions to store. If the cache is full, the
+        least recently used solution is evicted.
+
+    Notes
+    -----
+    The goal of a :class:`PositionTarget
+    <skbot.inverse_kinematics.PositionTarget>` is its ``static_position`` and
+    ``dynamic_position``, and the goal of a :class:`RotationTarget
+    <skbot.inverse_kinematics.RotationTarget>` is its desired rotation matrix.
+    Goals are compared using the euclidean distance.
+
+    Lookups use a KD-tree. New solutions are added to a small buffer that is
+    searched exhaustively, and the tree is rebuilt once the buffer is full.
+
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+
+        self._joints: List[tf.Joint] = None
+        self._keys: np.ndarray = None
+        self._values: np.ndarray = None
+        self._last_used = np.zeros(maxsize, dtype=np.int_)
+        self._size = 0
+        self._clock = 0
+
+        self._tree: cKDTree = None
+        # slots that changed since the tree was built
+        self._pending = set()
+        self._max_pending = max(16, int(np.sqrt(maxsize)))
+
+    def __len__(self) -> int:
+        return self._size
+
+    def clear(self) -> None:
+        """Remove all solutions from the cache.
+
+        Afterwards, the cache can be used with a different IK problem.
+
+        """
+
+        self._joints = None
+        self._keys = None
+        self._values = None
+        self._last_used[:] = 0
+        self._size = 0
+        self._clock = 0
+
+        self._tree = None
+        self._pending.clear()
+
+    def add(self, targets: List[Target], joints: List[tf.Joint]) -> None:
+        """Store the current joint values as the solution for ``targets``.
+
+        Parameters
+        ----------
+        targets : List[Target]
+            The targets that the joint values solve.
+        joints : List[tf.Joint]
+            The joints whose current values are stored.
+
+        """
+
+        key = self._key(targets)
+        self._check_joints(joints)
+
+        if self._keys is None:
+            self._keys = np.empty((self.maxsize, key.size))
+            self._values = np.empty((self.maxsize, len(joints)))
+
+        if self._size < self.maxsize:
+            slot = self._size
+            self._size += 1
+        else:
+            slot = np.argmin(self._last_used[: self._size])
+
+        self._keys[slot] = key
+        self._values[slot] = [x.param for x in joints]
+        self._touch(slot)
+
+        self._pending.add(slot)
+        if len(self._pending) > self._max_pending:
+            self._tree = cKDTree(self._keys[: self._size])
+            self._pending.clear()
+
+    def lookup(self, targets: List[Target]) -> Optional[np.ndarray]:
+        """Find the solution of the nearest goal.
+
+        Parameters
+        ----------
+        targets : List[Target]
+            The targets for which to find a solution.
+
+        Returns
+        -------
+        joint_values : np.ndarray
+            The stored joint values of the nearest goal, or None if the cache
+            is empty.
+
+        """
+
+        if self._size == 0:
+            return None
+
+        key = self._key(targets)
+
+        best_slot = None
+        best_distance = np.inf
+
+        if self._tree is not None:
+            # pending slots may be stale; query enough neighbors to skip them
+            count = min(self._tree.n, len(self._pending) + 1)
+            distances, slots = self._tree.query(key, k=count)
+            for distance, slot in zip(np.atleast_1d(distances), np.atleast_1d(slots)):
+                if slot not in self._pending:
+                    best_slot, best_distance = slot, distance
+                    break
+
+        if self._pending:
+            pending = np.fromiter(self._pending, dtype=np.int_)
+            distances = np.linalg.norm(self._keys[pending] - key, axis=-1)
+            idx = np.argmin(distances)
+            if distances[idx] < best_distance:
+                best_slot = pending[idx]
+
+        self._touch(best_slot)
+        return self._values[best_slot].copy()
+
+    def seed(self, targets: List[Target], joints: List[tf.Joint]) -> bool:
+        """Initialize joints from the cache.
+
+        The joints are set to the solution of the nearest goal if it scores
+        better than their current values.
+
+        Parameters
+        ----------
+        targets : List[Target]
+            The targets that should be solved.
+        joints : List[tf.Joint]
+            The joints to initialize.
+
+        Returns
+        -------
+        seeded : bool
+            True if the joints were modified.
+
+        """
+
+        self._check_joints(joints)
+
+        cached = self.lookup(targets)
+        if cached is None:
+            return False
+
+        current = [x.param for x in joints]
+        current_score = sum(x.score() / x.atol for x in targets)
+
+        for joint, value in zip(joints, cached):
+            joint.param = value
+
+        if sum(x.score() / x.atol for x in targets) < current_score:
+            return True
+
+        for joint, value in zip(joints, current):
+            joint.param = value
+
+        return False
+
+    def _touch(self, slot: int) -> None:
+        self._last_used[slot] = self._clock
+        self._clock += 1
+
+    def _check_joints(self, joints: List[tf.Joint]) -> None:
+        if self._joints is None:
+            self._joints = list(joints)
+        elif len(self._joints) != len(joints) or any(
+            x is not y for x, y in zip(self._joints, joints)
+        ):
+            raise ValueError("The cache belongs to a different set of joints.")
+
+    def _key(self, targets: List[Target]) -> np.ndarray:
+        parts = list()
+        for target in targets:
+            if isinstance(target, PositionTarget):
+                parts.append(np.ravel(target.static_position))
+                parts.append(np.ravel(target.dynamic_position))
+            elif isinstance(target, RotationTarget):
+                desired, _ = target._reduced_chains()
+                basis = np.eye(target.static_frame.ndim)
+                parts.append(np.ravel(_apply_rotation_chain(desired, basis)))
+            else:
+                raise NotImplementedError(
+                    f"Can't cache solutions for `{type(target).__name__}`."
+                )
+
+        key = np.concatenate(parts).astype(float)
+
+        if self._keys is not None and key.size != self._keys.shape[1]:
+            raise ValueError("The cache belongs to a different set of targets.")
+
+        return key
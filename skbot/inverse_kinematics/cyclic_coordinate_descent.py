@@ -1,11 +1,14 @@
 from .. import transform as tf
 from ..transform._utils import scalar_project, angle_between
 from numpy.typing import ArrayLike
-from typing import List, Callable
+from typing import List, Callable, Tuple, Union
 import numpy as np
 from scipy.optimize import minimize_scalar
 from scipy.optimize import OptimizeResult
 from .targets import Target, PositionTarget, RotationTarget
+from .cache import SolutionCache
+from .result import IKResult, _Monitor
+from .targets import _apply_matrix, _apply_rotation_chain, _is_affine, _is_joint
 
 import warnings
 
@@ -46,10 +49,12 @@ def analytic_rotation(
     This computes the optimal joint value analytically instead of solving
     a sub-optimization problem.
 
+    .. versionchanged:: 0.15.0
+        Supports joints that appear inverted in the target's chain.
     .. versionadded:: 0.10.0
 
     """
-    joint_idx = target._chain.index(joint)
+    joint_idx, inverted = _joint_index(target._chain, joint)
 
     basis1 = np.array((1, 0), dtype=float)
     basis2 = np.array((0, 1), dtype=float)
@@ -60,9 +65,7 @@ def analytic_rotation(
         if target.score() < target.atol:
             return  # nothing to do
 
-        target_point = target.dynamic_position
-        for link in reversed(target._chain[joint_idx:]):
-            target_point = link.__inverse_transform__(target_point)
+        target_point = target._dynamic_position_at(joint_idx)
         target_projected = np.array(
             [
                 scalar_project(target_point, joint._u),
@@ -70,9 +73,7 @@ def analytic_rotation(
             ]
         )
 
-        current_position = target.static_position
-        for link in target._chain[:joint_idx]:
-            current_position = link.transform(current_position)
+        current_position = target._static_position_at(joint_idx)
         current_projected = np.array(
             [
                 scalar_project(current_position, joint._u),
@@ -96,11 +97,169 @@ def analytic_rotation(
 
         # it is a bit odd that I have to use - angle here instead of using
         # + angle. There may be a bug regarding left/right handedness somewhere
+        if inverted:
+            angle = -angle
         joint.param = np.clip(joint.param - angle, joint.lower_limit, joint.upper_limit)
 
     return inner
 
 
+def analytic_prismatic(
+    joint: tf.PrismaticJoint, target: PositionTarget
+) -> Callable[[], None]:
+    """Fast-path for prismatic joints and position targets.
+
+    The links after the joint must be affine. Then the transformed
+    ``static_position`` moves along a line as the joint slides, and the optimal
+    joint value is the projection of ``dynamic_position`` onto this line.
+
+    .. versionadded:: 0.15.0
+
+    """
+    joint_idx, inverted = _joint_index(target._chain, joint)
+    direction = -joint.direction if inverted else joint.direction
+    n_links = len(target._chain)
+
+    eps = 1e-10
+
+    def inner() -> None:
+        if target.score() < target.atol:
+            return  # nothing to do
+
+        # static_position before the joint
+        position = target._static_position_at(joint_idx)
+        if joint_idx + 1 < n_links:
+            suffix = target._suffix_at(joint_idx + 1)
+            origin = _apply_matrix(suffix, position)
+            slide = suffix[:-1, :-1] @ direction
+        else:
+            origin = position
+            slide = direction
+
+        # skip adjustment if the joint can't move the position
+        length = slide @ slide
+        if length < eps:
+            return
+
+        amount = (target.dynamic_position - origin) @ slide / length
+        joint.param = np.clip(amount, joint.lower_limit, joint.upper_limit)
+
+    return inner
+
+
+def analytic_orientation(joint: tf.Joint, target: RotationTarget) -> Callable[[], None]:
+    """Fast-path for rotation joints and rotation targets.
+
+    Rotating a joint by ``theta`` changes the trace of the relative rotation
+    between the current and desired orientation as ``a + b cos(theta) + c
+    sin(theta)``. The optimal joint value is the angle that maximizes this
+    trace, i.e., the single-axis solution of Wahba's problem, ``atan2(c, b)``.
+
+    .. versionadded:: 0.15.0
+
+    """
+
+    ndim = target.static_frame.ndim
+    basis = np.eye(ndim)
+
+    _, reduced = target._reduced_chains()
+    joint_idx, _ = _joint_index(reduced, joint)
+    element = reduced[joint_idx]
+
+    # the joint's rotation matrix is constant + cos(theta) * B + sin(theta) * C
+    param = joint.param
+    samples = list()
+    for angle in (0, np.pi / 2, np.pi):
+        joint.param = angle
+        samples.append(element.transform(basis))
+    joint.param = param
+    constant = (samples[0] + samples[2]) / 2
+    cos_part = (samples[0] - samples[2]) / 2
+    sin_part = samples[1] - constant
+
+    eps = 1e-10
+
+    def inner() -> None:
+        if target.score() < target.atol:
+            return  # nothing to do
+
+        desired, reduced = target._reduced_chains()
+        prefix = _apply_rotation_chain(reduced[:joint_idx], basis)
+        suffix = _apply_rotation_chain(reduced[joint_idx + 1 :], basis)
+        desired_basis = _apply_rotation_chain(desired, basis)
+
+        # trace(desired @ (prefix @ joint @ suffix).T) == sum(weights * joint)
+        weights = prefix.T @ desired_basis @ suffix.T
+        cos_weight = np.sum(weights * cos_part)
+        sin_weight = np.sum(weights * sin_part)
+
+        # skip adjustment if the joint can't change the orientation
+        if np.hypot(cos_weight, sin_weight) < eps:
+            return
+
+        best = np.arctan2(sin_weight, cos_weight)
+        joint.param = _closest_angle(
+            best, joint.param, joint.lower_limit, joint.upper_limit
+        )
+
+    return inner
+
+
+def _joint_index(chain: List[tf.Link], joint: tf.Joint) -> Tuple[int, bool]:
+    """The index of a joint in a chain and whether it is inverted."""
+
+    for idx, link in enumerate(chain):
+        if link is joint:
+            return idx, False
+        elif isinstance(link, tf.InvertLink) and link._forward_link is joint:
+            return idx, True
+
+    raise ValueError("The joint is not part of the chain.")
+
+
+def _closest_angle(best: float, current: float, lower: float, upper: float) -> float:
+    """The angle within limits that is closest to ``best`` (modulo 2pi)."""
+
+    turn = 2 * np.pi
+
+    # the full turn that keeps the joint closest to its current value
+    lowest = np.ceil((lower - best) / turn)
+    highest = np.floor((upper - best) / turn)
+    if lowest <= highest:
+        turns = np.clip(np.round((current - best) / turn), lowest, highest)
+        return best + turns * turn
+
+    # best is out of reach; the limit closest to it (on the circle) is optimal
+    lower_distance = np.abs(np.angle(np.exp(1j * (lower - best))))
+    upper_distance = np.abs(np.angle(np.exp(1j * (upper - best))))
+    return lower if lower_distance <= upper_distance else upper
+
+
+def _affine_after(chain: List[tf.Link], joint: tf.Joint) -> bool:
+    """Check if all links after ``joint`` are (unbatched) affine links."""
+
+    joint_idx, _ = _joint_index(chain, joint)
+    return all(_is_affine(link) for link in chain[joint_idx + 1 :])
+
+
+def _linear_rotation_chain(target: RotationTarget) -> bool:
+    """Check if the reduced chain of a target only contains rotations."""
+
+    _, reduced = target._reduced_chains()
+    for element in reduced:
+        if isinstance(element, np.ndarray):
+            continue
+
+        forward = element
+        if isinstance(element, tf.InvertLink):
+            forward = element._forward_link
+
+        if not (_is_joint(element) and isinstance(forward, tf.Rotation)):
+            return False
+
+    return True
+
+
 def ccd(
     targets: List[Target],
     joints: List[tf.Joint] = None,
@@ -116,7 +275,11 @@ def ccd(
     frameA: tf.Frame = None,
     frameB: tf.Frame = None,
     metric: Callable[[np.ndarray, np.ndarray], float] = None,
-) -> List[np.ndarray]:
+    cache: SolutionCache = None,
+    time_budget: float = None,
+    callback: Callable[[IKResult], bool] = None,
+    return_result: bool = False,
+) -> Union[List[np.ndarray], IKResult]:
     """Cyclic Coordinate Descent.
 
     .. note::
@@ -127,6 +290,13 @@ def ccd(
     of the target. If all targets are reached, this function returns the the
     corresponding joint parameters; otherwise an exception is raised.
 
+    .. versionchanged:: 0.15.0
+        Added fast-paths for prismatic joints and for rotation targets.
+    .. versionchanged:: 0.15.0
+        Added the ``cache`` parameter.
+    .. versionchanged:: 0.15.0
+        Added the ``time_budget``, ``callback``, and ``return_result``
+        parameters.
     .. versionchanged:: 0.10.0
         CCD has a new signature and now makes use of Targets.
     .. versionchanged:: 0.10.0
@@ -205,16 +375,43 @@ def ccd(
         and that computs the distance between them. Its signature is
         ``metric(transformed_point, pointB) -> distance``. If None, the
         euclidian distance will be used.
+    cache : SolutionCache
+        If not None, the joints are initialized from the cache's nearest
+        solution (if it is better than their current value), and the solution
+        is added to the cache on success.
+    time_budget : float
+        The maximum time (in seconds) to spend optimizing. If it is exceeded,
+        the solver stops and fails unless the best joint values found so far
+        reach all targets. If None, there is no limit.
+    callback : Callable[[IKResult], bool]
+        A function that is called after each cycle over all target+joint pairs
+        with the progress so far. If it returns True, the solver stops early.
+    return_result : bool
+        If True, return an :class:`IKResult
+        <skbot.inverse_kinematics.IKResult>` instead of raising an exception
+        on failure.
 
     Returns
     -------
     joint_values : List[float]
-        The final parameters of each joint.
+        The final parameters of each joint. On failure, the joints are set to
+        the best values found so far.
+    result : IKResult
+        The best joint values, their scores, and whether they reach all
+        targets. Returned instead of ``joint_values`` if ``return_result`` is
+        True.
 
     Notes
     -----
     Joint limits (min/max) are enforced as hard constraints.
 
+    Fast-paths exist for rotational joints and :class:`PositionTargets
+    <skbot.inverse_kinematics.PositionTarget>` (3D), prismatic joints and
+    :class:`PositionTargets <skbot.inverse_kinematics.PositionTarget>`, and
+    rotational joints and :class:`RotationTargets
+    <skbot.inverse_kinematics.RotationTarget>`. They require that the joint is
+    used exactly once by the target.
+
     The current implementation is a naive python implementation and not very
     optimized. PRs improving performance are welcome :)
 
@@ -270,6 +467,9 @@ def ccd(
     for target in targets:
         target._chain = tf.simplify_links(target._chain, keep_links=joints)
 
+    if cache is not None:
+        cache.seed(targets, joints)
+
     joint_values = [l.param for l in joints]
 
     if tol is not None:
@@ -298,12 +498,32 @@ def ccd(
                 and target.usage_count(joint) == 1
             ):
                 stepper = analytic_rotation(joint, target)
+            elif (
+                isinstance(target, PositionTarget)
+                and isinstance(joint, tf.PrismaticJoint)
+                and target.static_frame.ndim == target.dynamic_frame.ndim
+                and np.ndim(joint.direction) == 1
+                and target.usage_count(joint) == 1
+                and _affine_after(target._chain, joint)
+            ):
+                stepper = analytic_prismatic(joint, target)
+            elif (
+                isinstance(target, RotationTarget)
+                and isinstance(joint, (tf.RotationalJoint, tf.AngleJoint))
+                and np.ndim(joint._u) == 1
+                and target.usage_count(joint) == 1
+                and _linear_rotation_chain(target)
+            ):
+                stepper = analytic_orientation(joint, target)
 
             if stepper is None:
                 stepper = step_generic_joint(joint, target, line_search_maxiter)
 
             step_fn.append(stepper)
 
+    monitor = _Monitor(targets, joints, time_budget, callback)
+    message = ""
+
     old_scores = np.array([float("inf")] * len(targets))
     atols = np.array([x.atol for x in targets])
     for step in range(maxiter * len(targets) * len(joints)):
@@ -313,24 +533,45 @@ def ccd(
         iteration = step // (len(joints) * len(targets))
 
         if target_idx == 0 and joint_idx == 0:
-            scores = np.array([x.score() for x in targets])
+            scores = monitor.update()
+
+            if iteration > 0:
+                message = monitor.iteration()
 
-            if np.all(scores < atols):
+            if np.all(scores < atols) or message:
                 break
 
             if not any(old_scores - scores > rtol):
-                raise RuntimeError(
+                message = (
                     "IK failed. Reason:"
                     " Loss in the local minimum is greater than `atol`."
                 )
+                break
 
             old_scores = scores
+        elif monitor.timeout():
+            monitor.update()
+            message = "IK failed. Reason: Time budget exceeded."
+            break
 
         step_fn[len(joints) * target_idx + joint_idx]()
     else:
-        raise RuntimeError(f"IK failed: maxiter exceeded.")
+        monitor.update()
+        message = f"IK failed: maxiter exceeded."
+
+    result = monitor.finish(message)
+    if not result.success:
+        if return_result:
+            return result
+        raise RuntimeError(result.message)
 
     for idx in range(len(joints)):
         joint_values[idx] = joints[idx].param
 
+    if cache is not None:
+        cache.add(targets, joints)
+
+    if return_result:
+        return result
+
     return joint_values
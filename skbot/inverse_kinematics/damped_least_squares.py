@@ -0,0 +1,467 @@
+from .. import transform as tf
+from .targets import Target, PositionTarget, RotationTarget
+from .targets import _affine_matrix, _apply_rotation_chain, _is_affine
+from .cache import SolutionCache
+from .result import IKResult, _Monitor
+from typing import Callable, List, Tuple, Union
+import weakref
+import numpy as np
+from scipy.spatial.transform import Rotation as scipy_rotation
+
+# (residual, jacobian, score) of a target at the given joint values
+Terms = Callable[[np.ndarray], Tuple[np.ndarray, np.ndarray, float]]
+
+# target -> (chain, joints, segments) that the target's chain was converted to
+_segment_cache = weakref.WeakKeyDictionary()
+
+
+def dls(
+    targets: List[Target],
+    joints: List[tf.Joint] = None,
+    *,
+    damping: float = 1e-3,
+    rtol: float = 1e-6,
+    maxiter: int = 100,
+    nullspace_gain: float = 0,
+    cache: SolutionCache = None,
+    time_budget: float = None,
+    callback: Callable[[IKResult], bool] = None,
+    return_result: bool = False,
+) -> Union[List[float], IKResult]:
+    """Damped Least Squares (Levenberg-Marquardt).
+
+    .. note::
+        This function will modify the objects in ``joints`` as a side effect.
+
+    .. versionadded:: 0.15.0
+
+    Each target is expressed as a residual vector - the difference between the
+    desired and current position for :class:`PositionTargets
+    <skbot.inverse_kinematics.PositionTarget>` and the rotation vector between
+    the current and desired rotation for :class:`RotationTargets
+    <skbot.inverse_kinematics.RotationTarget>` - and the residuals of all
+    targets are stacked. Each iteration linearizes the residuals around the
+    current joint values using the Jacobian and solves the damped
+    least-squares problem ``min |J dq - e|^2 + damping^2 |dq|^2`` for a step
+    ``dq``. The damping adapts after each iteration (Levenberg-Marquardt): it
+    is decreased if the step reduces the residual and increased (and the step
+    rejected) otherwise.
+
+    Parameters
+    ----------
+    targets : List[Target]
+        A list of quality measures that a successful pose minimizes.
+    joints : List[joint]
+        A list of 1DoF joints which should be adjusted to minimize ``targets``.
+        If None, all joints between the static and dynamic frame of each
+        target are used (see :func:`Frame.joints_between
+        <skbot.transform.Frame.joints_between>`).
+    damping : float
+        The initial damping. Larger values make the solver more robust near
+        singularities at the expense of (initially) smaller steps.
+    rtol : float
+        Relative tolerance for termination. If a step doesn't reduce the
+        residual by more than rtol the algorithm terminates and assumes that a
+        local optimum has been found.
+    maxiter : int
+        The maximum number of iterations to perform.
+    nullspace_gain : float
+        If positive, each step additionally moves redundant joints towards the
+        center of their range. The motion is projected into the null space of
+        the Jacobian, i.e., it doesn't affect the targets (to first order).
+        Joints without finite limits are not affected. Default: ``0``.
+    cache : SolutionCache
+        If not None, the joints are initialized from the cache's nearest
+        solution (if it is better than their current value), and the solution
+        is added to the cache on success.
+    time_budget : float
+        The maximum time (in seconds) to spend optimizing. If it is exceeded,
+        the solver stops and fails unless the best joint values found so far
+        reach all targets. If None, there is no limit.
+    callback : Callable[[IKResult], bool]
+        A function that is called after each iteration with the progress so
+        far. If it returns True, the solver stops early.
+    return_result : bool
+        If True, return an :class:`IKResult
+        <skbot.inverse_kinematics.IKResult>` instead of raising an exception
+        on failure.
+
+    Returns
+    -------
+    joint_values : List[float]
+        The final parameters of each joint. On failure, the joints are set to
+        the best values found so far.
+    result : IKResult
+        The best joint values, their scores, and whether they reach all
+        targets. Returned instead of ``joint_values`` if ``return_result`` is
+        True.
+
+    Notes
+    -----
+    Joint limits (min/max) are enforced by clamping after each step.
+
+    The current value of each joint is used as the initial guess. Queries
+    that are solved repeatedly, e.g., while tracking a moving target, converge
+    in a few iterations when starting from the previous solution (warm start).
+
+    For :class:`tf.RotationalJoint <skbot.transform.RotationalJoint>`,
+    :class:`tf.AngleJoint <skbot.transform.AngleJoint>`, and
+    :class:`tf.PrismaticJoint <skbot.transform.PrismaticJoint>`, the Jacobian
+    is computed analytically from the joint's axis. To do so, the chain of
+    each target is converted into a sequence of constant matrices and joints
+    once and cached on the target; links that are not in ``joints`` are
+    assumed to be constant until the target's chain is replaced. Targets
+    whose chain contains other joints or non-affine links, and targets that
+    are neither a PositionTarget nor a RotationTarget, use finite differences
+    instead (the latter using their score as residual).
+
+    """
+
+    if joints is None:
+        joints = list()
+        for target in targets:
+            for joint in target.static_frame.joints_between(target.dynamic_frame):
+                if not any(joint is x for x in joints):
+                    joints.append(joint)
+
+    terms = [_target_terms(target, joints) for target in targets]
+    atols = np.array([x.atol for x in targets])
+
+    lower = np.array([x.lower_limit for x in joints], dtype=float)
+    upper = np.array([x.upper_limit for x in joints], dtype=float)
+    limited = np.isfinite(lower) & np.isfinite(upper)
+    center = np.where(limited, (lower + upper) / 2, 0)
+
+    def evaluate(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        residuals = list()
+        jacobians = list()
+        scores = np.empty(len(targets))
+        for idx, fn in enumerate(terms):
+            residual, jacobian, scores[idx] = fn(values)
+            residuals.append(residual / atols[idx])
+            jacobians.append(jacobian / atols[idx])
+
+        return np.concatenate(residuals), np.concatenate(jacobians), scores
+
+    values = np.array([x.param for x in joints], dtype=float)
+    residual, jacobian, scores = evaluate(values)
+    cost = residual @ residual
+
+    if cache is not None:
+        # like SolutionCache.seed, but using the solver's own evaluation
+        cache._check_joints(joints)
+        cached = cache.lookup(targets)
+        if cached is not None:
+            cached = np.clip(cached, lower, upper)
+            cached_terms = evaluate(cached)
+            cached_cost = cached_terms[0] @ cached_terms[0]
+            if cached_cost < cost:
+                values = cached
+                residual, jacobian, scores = cached_terms
+                cost = cached_cost
+
+    monitor = _Monitor(targets, joints, time_budget, callback)
+    monitor.record(values, scores)
+    message = ""
+
+    for _ in range(maxiter):
+        if np.all(scores < atols):
+            break
+
+        # damped pseudo-inverse: J^T (J J^T + damping^2 I)^-1
+        system = jacobian @ jacobian.T
+        system[np.diag_indices_from(system)] += damping**2
+        pseudo_inverse = np.linalg.solve(system, jacobian).T
+        step = pseudo_inverse @ residual
+
+        if nullspace_gain > 0:
+            secondary = np.where(limited, nullspace_gain * (center - values), 0)
+            step += secondary - pseudo_inverse @ (jacobian @ secondary)
+
+        candidate = np.clip(values + step, lower, upper)
+        new_residual, new_jacobian, new_scores = evaluate(candidate)
+        new_cost = new_residual @ new_residual
+
+        improvement = (cost - new_cost) / cost
+        accepted = new_cost < cost
+        if accepted:
+            values = candidate
+            residual, jacobian, scores, cost = (
+                new_residual,
+                new_jacobian,
+                new_scores,
+                new_cost,
+            )
+            damping = max(damping / 10, 1e-12)
+            monitor.record(values, scores)
+        else:
+            damping *= 10
+
+        message = monitor.iteration()
+        if message or damping > 1e10:
+            break
+
+        if accepted and improvement < rtol:
+            break
+
+    result = monitor.finish(
+        message or "IK failed. Reason: Local minimum doesn't reach one or more targets."
+    )
+    if not result.success:
+        if return_result:
+            return result
+        raise RuntimeError(result.message)
+
+    if cache is not None:
+        cache.add(targets, joints)
+
+    if return_result:
+        return result
+
+    return list(result.joint_values)
+
+
+def _target_terms(target: Target, joints: List[tf.Joint]) -> Terms:
+    """Compute the residual, Jacobian, and score of a target."""
+
+    if isinstance(target, (PositionTarget, RotationTarget)):
+        # the converted chain is cached until the target's chain is replaced
+        chain, cached_joints, segments = _segment_cache.get(target, (None,) * 3)
+        if (
+            chain is not target._chain
+            or len(cached_joints) != len(joints)
+            or any(x is not y for x, y in zip(cached_joints, joints))
+        ):
+            target._chain = tf.simplify_links(target._chain, keep_links=joints)
+            segments = _chain_segments(target._chain, joints)
+            _segment_cache[target] = (target._chain, list(joints), segments)
+
+        if segments is not None and isinstance(target, PositionTarget):
+            return _position_terms(target, segments)
+        elif segments is not None:
+            return _rotation_terms(target, segments)
+    else:
+        target._chain = tf.simplify_links(target._chain, keep_links=joints)
+
+    return _finite_differences(target, joints)
+
+
+def _chain_segments(chain: List[tf.Link], joints: List[tf.Joint]) -> List[Tuple]:
+    """Convert a chain into constant matrices and joints.
+
+    Each segment is a tuple ``(joint_idx, matrix, generator, slide)``. Constant
+    segments have ``joint_idx=-1`` and a homogeneous ``matrix``. Rotational
+    joints have the generator ``G`` of their rotation (stacked with ``G^2``),
+    i.e., the joint maps ``x`` to ``(I + sin(q) G + (1 - cos(q)) G^2) x``.
+    Prismatic joints map ``x`` to ``x + q * slide``. Returns None if the chain
+    can't be converted.
+    """
+
+    segments = list()
+    matrix = None
+    for link in chain:
+        inverted = isinstance(link, tf.InvertLink)
+        forward = link._forward_link if inverted else link
+        sign = -1 if inverted else 1
+
+        joint_idx = -1
+        for idx, joint in enumerate(joints):
+            if forward is joint:
+                joint_idx = idx
+                break
+
+        if joint_idx == -1:
+            if not _is_affine(link):
+                return None
+
+            link_matrix = _affine_matrix(link)
+            if link_matrix.ndim != 2:
+                return None  # batched links
+
+            matrix = link_matrix if matrix is None else link_matrix @ matrix
+            continue
+
+        if matrix is not None:
+            segments.append((-1, matrix, None, None))
+            matrix = None
+
+        if isinstance(forward, tf.Rotation) and np.ndim(forward._u) == 1:
+            u = forward._u
+            u_ortho = forward._u_ortho
+            generator = sign * (np.outer(u, u_ortho) - np.outer(u_ortho, u))
+            generator = np.stack((generator, generator @ generator))
+            segments.append((joint_idx, None, generator, None))
+        elif isinstance(forward, tf.Translation) and np.ndim(forward.direction) == 1:
+            slide = sign * np.asarray(forward.direction, dtype=float)
+            segments.append((joint_idx, None, None, slide))
+        else:
+            return None
+
+    if matrix is not None:
+        segments.append((-1, matrix, None, None))
+
+    return segments
+
+
+def _segment_transforms(
+    segments: List[Tuple], values: np.ndarray, ndim: int
+) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """The linear part, offset, and derivative of each segment."""
+
+    identity = np.eye(ndim)
+
+    transforms = list()
+    for joint_idx, matrix, generator, slide in segments:
+        if joint_idx == -1:
+            transforms.append((matrix[:-1, :-1], matrix[:-1, -1], None))
+        elif generator is not None:
+            sin = np.sin(values[joint_idx])
+            cos = np.cos(values[joint_idx])
+            linear = identity + sin * generator[0] + (1 - cos) * generator[1]
+            derivative = cos * generator[0] + sin * generator[1]
+            transforms.append((linear, None, derivative))
+        else:
+            transforms.append((None, values[joint_idx] * slide, None))
+
+    return transforms
+
+
+def _position_terms(target: PositionTarget, segments: List[Tuple]) -> Terms:
+    ndim = target.static_frame.ndim
+
+    def inner(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, float]:
+        transforms = _segment_transforms(segments, values, ndim)
+
+        # the position before each segment
+        position = np.asarray(target.static_position, dtype=float)
+        positions = list()
+        for linear, offset, _ in transforms:
+            positions.append(position)
+            if linear is not None:
+                position = linear @ position
+            if offset is not None:
+                position = position + offset
+
+        residual = target.dynamic_position - position
+
+        jacobian = np.zeros((residual.size, len(values)))
+        suffix = np.eye(residual.size)
+        for idx in reversed(range(len(segments))):
+            joint_idx, _, _, slide = segments[idx]
+            linear, _, derivative = transforms[idx]
+
+            if derivative is not None:
+                jacobian[:, joint_idx] += suffix @ (derivative @ positions[idx])
+            elif slide is not None:
+                jacobian[:, joint_idx] += suffix @ slide
+
+            if linear is not None:
+                suffix = suffix @ linear
+
+        return residual, jacobian, target.norm(residual)
+
+    return inner
+
+
+def _rotation_terms(target: RotationTarget, segments: List[Tuple]) -> Terms:
+    ndim = target.static_frame.ndim
+    basis = np.eye(ndim)
+
+    desired, _ = target._reduced_chains()
+    desired_rotation = _apply_rotation_chain(desired, basis).T
+
+    def inner(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, float]:
+        transforms = _segment_transforms(segments, values, ndim)
+
+        # the rotation before each segment
+        rotation = basis
+        rotations = list()
+        for linear, _, _ in transforms:
+            rotations.append(rotation)
+            if linear is not None:
+                rotation = linear @ rotation
+
+        residual = _rotation_error(desired_rotation @ rotation.T)
+
+        jacobian = np.zeros((residual.size, len(values)))
+        suffix = basis
+        for idx in reversed(range(len(segments))):
+            joint_idx = segments[idx][0]
+            linear, _, derivative = transforms[idx]
+
+            if derivative is not None:
+                rate = suffix @ derivative @ rotations[idx]
+                # skew-symmetric matrix of the angular velocity
+                velocity = rate @ rotation.T
+                if ndim == 3:
+                    jacobian[:, joint_idx] += (
+                        velocity[2, 1],
+                        velocity[0, 2],
+                        velocity[1, 0],
+                    )
+                else:
+                    jacobian[:, joint_idx] += velocity[1, 0]
+
+            if linear is not None:
+                suffix = suffix @ linear
+
+        return residual, jacobian, np.linalg.norm(residual)
+
+    return inner
+
+
+def _rotation_error(error: np.ndarray) -> np.ndarray:
+    """The rotation vector (3D) or angle (2D) of a rotation matrix."""
+
+    if error.shape == (3, 3):
+        return scipy_rotation.from_matrix(error).as_rotvec()
+    else:
+        return np.array([np.arctan2(error[1, 0], error[0, 0])])
+
+
+def _finite_differences(
+    target: Target, joints: List[tf.Joint], eps: float = 1e-7
+) -> Terms:
+    """Residual and Jacobian of a target using finite differences.
+
+    Like the analytic terms, the Jacobian is the negative derivative of the
+    residual, i.e., the rate at which the current value approaches the
+    desired value.
+    """
+
+    if isinstance(target, PositionTarget):
+
+        def residual() -> np.ndarray:
+            current = target._static_position_at(len(target._chain))
+            return target.dynamic_position - current
+
+    elif isinstance(target, RotationTarget):
+
+        def residual() -> np.ndarray:
+            desired, reduced = target._reduced_chains()
+            basis = np.eye(target.static_frame.ndim)
+            desired_rotation = _apply_rotation_chain(desired, basis).T
+            rotation = _apply_rotation_chain(reduced, basis).T
+            return _rotation_error(desired_rotation @ rotation.T)
+
+    else:
+
+        def residual() -> np.ndarray:
+            return np.atleast_1d(target.score())
+
+    def inner(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, float]:
+        for joint, value in zip(joints, values):
+            joint.param = value
+
+        value = np.asarray(residual(), dtype=float)
+        score = target.score()
+
+        jacobian = np.empty((value.size, len(joints)))
+        for idx, joint in enumerate(joints):
+            joint.param = values[idx] + eps
+            jacobian[:, idx] = (value - residual()) / eps
+            joint.param = values[idx]
+
+        return value, jacobian, score
+
+    return inner
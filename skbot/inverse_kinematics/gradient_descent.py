@@ -1,6 +1,8 @@
 from .. import transform as tf
 from .targets import Target
-from typing import List
+from .cache import SolutionCache
+from .result import IKResult, _Monitor
+from typing import Callable, List, Union
 import numpy as np
 from scipy.optimize import minimize, OptimizeResult, Bounds
 import warnings
@@ -12,7 +14,11 @@ def gd(
     *,
     rtol: float = 1e-6,
     maxiter: int = 500,
-):
+    cache: SolutionCache = None,
+    time_budget: float = None,
+    callback: Callable[[IKResult], bool] = None,
+    return_result: bool = False,
+) -> Union[np.ndarray, IKResult]:
     """L-BFGS-B based Gradient Descent.
 
     .. note::
@@ -22,6 +28,12 @@ def gd(
     scores is minimal. L-BFGS-B is a quasi-Newton method that approximates both
     the targets Jacobian and Hessian.
 
+    .. versionchanged:: 0.15.0
+        Added the ``cache`` parameter.
+    .. versionchanged:: 0.15.0
+        Added the ``time_budget``, ``callback``, and ``return_result``
+        parameters.
+
     Parameters
     ----------
     targets : List[Target]
@@ -34,11 +46,31 @@ def gd(
         assumes that a local optimum has been found.
     maxiter : int
         The maximum number of iterations to perform.
+    cache : SolutionCache
+        If not None, the joints are initialized from the cache's nearest
+        solution (if it is better than their current value), and the solution
+        is added to the cache on success.
+    time_budget : float
+        The maximum time (in seconds) to spend optimizing. If it is exceeded,
+        the solver stops and fails unless the best joint values found so far
+        reach all targets. If None, there is no limit.
+    callback : Callable[[IKResult], bool]
+        A function that is called after each iteration with the progress so
+        far. If it returns True, the solver stops early.
+    return_result : bool
+        If True, return an :class:`IKResult
+        <skbot.inverse_kinematics.IKResult>` instead of raising an exception
+        on failure.
 
     Returns
     -------
     joint_values : List[float]
-        The final parameters of each joint.
+        The final parameters of each joint. On failure, the joints are set to
+        the best values found so far.
+    result : IKResult
+        The best joint values, their scores, and whether they reach all
+        targets. Returned instead of ``joint_values`` if ``return_result`` is
+        True.
 
     Notes
     -----
@@ -52,11 +84,14 @@ def gd(
 
     """
 
-    joint_values = np.array([l.param for l in joints])
-
     for target in targets:
         target._chain = tf.simplify_links(target._chain, keep_links=joints)
 
+    if cache is not None:
+        cache.seed(targets, joints)
+
+    joint_values = np.array([l.param for l in joints])
+
     atols = np.array([x.atol for x in targets])
     bounds = Bounds(
         [x.lower_limit for x in joints],
@@ -64,13 +99,27 @@ def gd(
         keep_feasible=True,
     )
 
+    monitor = _Monitor(targets, joints, time_budget, callback)
+    message = "IK failed. Reason: Local minimum doesn't reach one or more targets."
+
     def objective_function(joint_config: np.ndarray) -> float:
         for joint, value in zip(joints, joint_config):
             joint.param = value
-        normalized_scores = np.array([x.score() / x.atol for x in targets])
+        scores = np.array([x.score() for x in targets])
+        monitor.record(joint_config, scores)
+
+        if monitor.timeout():
+            raise _Stop("IK failed. Reason: Time budget exceeded.")
+
+        normalized_scores = scores / atols
         return np.sum(normalized_scores)
         # return np.max(normalized_scores)
 
+    def on_iteration(joint_config: np.ndarray) -> None:
+        reason = monitor.iteration()
+        if reason:
+            raise _Stop(reason)
+
     # check if optimization is needed
     skip = False
     for target in targets:
@@ -79,29 +128,41 @@ def gd(
     else:
         skip = True
 
-    if not skip:
-        result: OptimizeResult = minimize(
-            objective_function,
-            joint_values,
-            bounds=bounds,
-            method="L-BFGS-B",
-            options={"maxiter": maxiter, "ftol": rtol},
-        )
-
-        if not result.success:
-            warnings.warn(
-                f"L-BFGS-B terminated abnormally with message `{result.message}`."
-            )
-
-        scores = np.array([x.score() for x in targets])
-        if np.any(scores > atols):
-
-            raise RuntimeError(
-                f"IK failed. Reason: Local minimum doesn't reach one or more targets."
+    if skip:
+        monitor.update()
+    else:
+        try:
+            result: OptimizeResult = minimize(
+                objective_function,
+                joint_values,
+                bounds=bounds,
+                method="L-BFGS-B",
+                callback=on_iteration,
+                options={"maxiter": maxiter, "ftol": rtol},
             )
-
-        for joint, value in zip(joints, result.x):
-            joint.param = value
+        except _Stop as stop:
+            message = str(stop)
+        else:
+            if not result.success:
+                warnings.warn(
+                    f"L-BFGS-B terminated abnormally with message `{result.message}`."
+                )
+
+    ik_result = monitor.finish(message)
+    if not ik_result.success:
+        if return_result:
+            return ik_result
+        raise RuntimeError(ik_result.message)
+
+    if cache is not None:
+        cache.add(targets, joints)
+
+    if return_result:
+        return ik_result
 
     joint_values = np.array([j.param for j in joints])
     return joint_values
+
+
+class _Stop(Exception):
+    """Raised to end the optimization early."""
@@ -0,0 +1,362 @@
+import json
+from pathlib import Path
+from typing import List, Union
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .. import transform as tf
+
+# approach directions are binned on the faces of a cube; each face is split
+# into _FACE_CELLS x _FACE_CELLS cells and each cell is one bit of a uint64
+_FACE_CELLS = 3
+_DIRECTION_BINS = 6 * _FACE_CELLS**2
+
+
+class ReachabilityMap:
+    """Voxelized workspace of a robot.
+
+    .. versionadded:: 0.15.0
+
+    A reachability map divides the space around a robot's base into voxels
+    (cubes of side length ``resolution``) and records for each voxel the
+    approach directions of the tool that are reachable at positions inside
+    it. Directions are binned into 54 cells of a cube map and stored as one
+    bit of a 64 bit integer, i.e., the map is a 3D array of shape ``(nx, ny,
+    nz)`` with dtype ``uint64``.
+
+    Queries are a single lookup in this array, which makes it cheap to reject
+    infeasible goals, e.g., grasp candidates, before calling an IK solver.
+    The map is built by sampling (see :meth:`from_frame_graph`) and is thus
+    conservative: a reachable pose may be reported as unreachable if no
+    sample hit its voxel and direction, and reported poses are only
+    reachable up to the resolution of the map.
+
+    Parameters
+    ----------
+    directions : ArrayLike
+        The bitmask of reached approach directions of each voxel. Shape:
+        ``(nx, ny, nz)``.
+    origin : ArrayLike
+        The position of the corner of voxel ``(0, 0, 0)`` in the base frame.
+    resolution : float
+        The side length of a voxel.
+    tool_axis : ArrayLike
+        The approach direction expressed in the tool frame.
+
+    Attributes
+    ----------
+    directions : np.ndarray
+        See ``Parameters`` section.
+    origin : np.ndarray
+        See ``Parameters`` section.
+    resolution : float
+        See ``Parameters`` section.
+    tool_axis : np.ndarray
+        See ``Parameters`` section.
+
+    Notes
+    -----
+    Positions and directions are expressed in the base frame. To check a goal
+    that is expressed in a different frame - or to search for a base
+    placement from which a goal is reachable (inverse reachability) -
+    transform the goal into each candidate base frame and query the map.
+
+    """
+
+    def __init__(
+        self,
+        directions: ArrayLike,
+        origin: ArrayLike,
+        resolution: float,
+        tool_axis: ArrayLike = (0, 0, 1),
+    ) -> None:
+        self.directions = np.asarray(directions, dtype=np.uint64)
+        self.origin = np.asarray(origin, dtype=np.float_)
+        self.resolution = float(resolution)
+        self.tool_axis = np.asarray(tool_axis, dtype=np.float_)
+
+        if self.directions.ndim != 3:
+            raise ValueError("`directions` must be a 3D array.")
+
+    @property
+    def shape(self):
+        """The number of voxels along each axis."""
+        return self.directions.shape
+
+    @property
+    def occupancy(self) -> np.ndarray:
+        """Boolean grid of voxels in which the tool can be placed."""
+        return self.directions != 0
+
+    def reachable(
+        self, position: ArrayLike, direction: ArrayLike = None
+    ) -> Union[bool, np.ndarray]:
+        """Check if poses are reachable.
+
+        Parameters
+        ----------
+        position : ArrayLike
+            The position of the tool (in the base frame). Batch dimensions are
+            supported. Shape: ``(..., 3)``.
+        direction : ArrayLike
+            The approach direction of the tool (in the base frame). If None,
+            check if the position can be reached with any direction. Shape:
+            ``(..., 3)``.
+
+        Returns
+        -------
+        reachable : Union[bool, np.ndarray]
+            True if the map contains the pose. Positions outside of the map are
+            unreachable. Shape: ``(...)``.
+
+        """
+
+        mask = self._lookup(position)
+
+        if direction is not None:
+            bits = np.left_shift(np.uint64(1), _direction_bin(direction))
+            mask = mask & bits
+
+        return mask != 0
+
+    def quality(self, position: ArrayLike) -> Union[float, np.ndarray]:
+        """The fraction of approach directions that reach a position.
+
+        This is the reachability index of a voxel; it is 0 for unreachable
+        positions and 1 for positions that can be reached from any direction.
+
+        Parameters
+        ----------
+        position : ArrayLike
+            The position of the tool (in the base frame). Batch dimensions are
+            supported. Shape: ``(..., 3)``.
+
+        Returns
+        -------
+        quality : Union[float, np.ndarray]
+            The reachability index of each position. Shape: ``(...)``.
+
+        """
+
+        mask = self._lookup(position)
+
+        count = np.zeros(mask.shape, dtype=np.int_)
+        for bit in range(_DIRECTION_BINS):
+            count += (mask >> np.uint64(bit)) & np.uint64(1) != 0
+
+        return count / _DIRECTION_BINS
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the map to disk.
+
+        The map is stored as a directory that contains the grid as a ``.npy``
+        file (which can be memory-mapped by :meth:`load`) and its metadata as a
+        JSON file.
+
+        Parameters
+        ----------
+        path : Union[str, Path]
+            The directory to write to. It is created if it doesn't exist.
+
+        """
+
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+
+        np.save(path / "directions.npy", self.directions)
+        metadata = {
+            "origin": self.origin.tolist(),
+            "resolution": self.resolution,
+            "tool_axis": self.tool_axis.tolist(),
+        }
+        (path / "metadata.json").write_text(json.dumps(metadata))
+
+    @classmethod
+    def load(cls, path: Union[str, Path], *, mmap: bool = True) -> "ReachabilityMap":
+        """Read a map from disk.
+
+        Parameters
+        ----------
+        path : Union[str, Path]
+            The directory that :meth:`save` wrote to.
+        mmap : bool
+            If True (default), memory-map the grid instead of reading it into
+            memory. Only the voxels that are queried are read from disk.
+
+        Returns
+        -------
+        reach_map : ReachabilityMap
+            The loaded map.
+
+        """
+
+        path = Path(path)
+        metadata = json.loads((path / "metadata.json").read_text())
+        directions = np.load(path / "directions.npy", mmap_mode="r" if mmap else None)
+
+        return cls(directions, **metadata)
+
+    @classmethod
+    def from_frame_graph(
+        cls,
+        base_frame: tf.Frame,
+        tool_frame: tf.Frame,
+        joints: List[tf.Joint] = None,
+        *,
+        resolution: float = 0.05,
+        tool_axis: ArrayLike = (0, 0, 1),
+        n_samples: int = 100_000,
+        batch_size: int = 10_000,
+        seed: Union[int, np.random.Generator] = None,
+    ) -> "ReachabilityMap":
+        """Build a map by sampling joint space.
+
+        Joint values are sampled uniformly between each joint's limits and the
+        resulting tool poses are computed in batches using a
+        :class:`tf.KinematicTree <skbot.transform.KinematicTree>`. Joints
+        without finite limits are sampled from ``[-pi, pi]`` (rotational
+        joints); links that are not in ``joints`` keep their current value.
+
+        Parameters
+        ----------
+        base_frame : tf.Frame
+            The frame in which to express the map, e.g., the robot's base.
+        tool_frame : tf.Frame
+            The frame whose reachable poses are recorded. It must be reachable
+            from ``base_frame`` and is identified by its name.
+        joints : List[tf.Joint]
+            The joints to sample. If None, use the joints between
+            ``tool_frame`` and ``base_frame``.
+        resolution : float
+            The side length of a voxel.
+        tool_axis : ArrayLike
+            The approach direction expressed in the tool frame. Default: The
+            tool frame's z-axis.
+        n_samples : int
+            The number of joint configurations to sample.
+        batch_size : int
+            The number of configurations to evaluate at once. Larger batches
+            are faster but need more memory.
+        seed : Union[int, np.random.Generator]
+            The seed (or generator) used to sample joint values. If None,
+            fresh entropy is used.
+
+        Returns
+        -------
+        reach_map : ReachabilityMap
+            The reachability map of ``tool_frame``.
+
+        Raises
+        ------
+        ValueError
+            If the tool frame is not (uniquely) part of the graph below
+            ``base_frame`` or if a prismatic joint has infinite limits.
+
+        """
+
+        if joints is None:
+            joints = tool_frame.joints_between(base_frame)
+
+        tree = tf.KinematicTree.from_frame_graph(base_frame, joints=joints)
+        if tree.names.count(tool_frame.name) != 1:
+            raise ValueError(
+                f"Can't uniquely identify frame `{tool_frame.name}` in the graph."
+            )
+        tree = _chain_tree(tree, tree.index(tool_frame.name))
+
+        lower = tree.lower_limits.copy()
+        upper = tree.upper_limits.copy()
+        unbounded = ~(np.isfinite(lower) & np.isfinite(upper))
+        for idx in np.flatnonzero(unbounded):
+            if isinstance(joints[idx], tf.Translation):
+                raise ValueError("Prismatic joints must have finite limits.")
+            lower[idx], upper[idx] = -np.pi, np.pi
+
+        tool_axis = np.asarray(tool_axis, dtype=np.float_)
+        tool_axis = tool_axis / np.linalg.norm(tool_axis)
+        rng = np.random.default_rng(seed)
+
+        voxels = list()
+        masks = list()
+        for start in range(0, n_samples, batch_size):
+            count = min(batch_size, n_samples - start)
+            q = rng.uniform(lower, upper, (count, len(lower)))
+            poses = tree.forward_kinematics(q)[:, -1]
+
+            positions = poses[:, :3, 3]
+            directions = poses[:, :3, :3] @ tool_axis
+            bits = np.left_shift(np.uint64(1), _direction_bin(directions))
+
+            # combine samples that share a voxel early to save memory
+            voxel = np.floor(positions / resolution).astype(np.int_)
+            voxel, inverse = np.unique(voxel, axis=0, return_inverse=True)
+            mask = np.zeros(len(voxel), dtype=np.uint64)
+            np.bitwise_or.at(mask, inverse.ravel(), bits)
+
+            voxels.append(voxel)
+            masks.append(mask)
+
+        voxels = np.concatenate(voxels)
+        masks = np.concatenate(masks)
+
+        offset = voxels.min(axis=0)
+        voxels = voxels - offset
+        grid = np.zeros(voxels.max(axis=0) + 1, dtype=np.uint64)
+        np.bitwise_or.at(grid, tuple(voxels.T), masks)
+
+        return cls(grid, offset * resolution, resolution, tool_axis)
+
+    def _lookup(self, position: ArrayLike) -> np.ndarray:
+        """The direction mask of the voxel at each position."""
+
+        position = np.asarray(position, dtype=np.float_)
+        voxel = np.floor((position - self.origin) / self.resolution).astype(np.int_)
+        inside = np.all((voxel >= 0) & (voxel < self.shape), axis=-1)
+        voxel = np.where(inside[..., None], voxel, 0)
+
+        mask = self.directions[voxel[..., 0], voxel[..., 1], voxel[..., 2]]
+        return np.where(inside, mask, np.uint64(0))
+
+
+def _direction_bin(direction: ArrayLike) -> np.ndarray:
+    """The cube map cell of each direction."""
+
+    direction = np.asarray(direction, dtype=np.float_)
+    axis = np.argmax(np.abs(direction), axis=-1)
+    major = np.take_along_axis(direction, axis[..., None], axis=-1)[..., 0]
+    face = 2 * axis + (major < 0)
+
+    # the remaining two components in cyclic order; they are in [-1, 1]
+    u_idx = (axis + 1) % 3
+    v_idx = (axis + 2) % 3
+    scale = np.abs(major) + np.finfo(np.float_).tiny
+    u = np.take_along_axis(direction, u_idx[..., None], axis=-1)[..., 0] / scale
+    v = np.take_along_axis(direction, v_idx[..., None], axis=-1)[..., 0] / scale
+
+    u_cell = np.clip(np.floor((u + 1) / 2 * _FACE_CELLS), 0, _FACE_CELLS - 1)
+    v_cell = np.clip(np.floor((v + 1) / 2 * _FACE_CELLS), 0, _FACE_CELLS - 1)
+
+    cell = face * _FACE_CELLS**2 + u_cell * _FACE_CELLS + v_cell
+    return cell.astype(np.uint64)
+
+
+def _chain_tree(tree: tf.KinematicTree, node: int) -> tf.KinematicTree:
+    """The sub-tree that only contains the path from the root to ``node``."""
+
+    path = [node]
+    while tree.parents[path[-1]] != -1:
+        path.append(tree.parents[path[-1]])
+    path = path[::-1]
+
+    return tf.KinematicTree(
+        [tree.names[idx] for idx in path],
+        np.arange(len(path)) - 1,
+        tree.transforms[path],
+        tree.joint_types[path],
+        tree.joint_axes[path],
+        tree.joint_index[path],
+        tree.lower_limits,
+        tree.upper_limits,
+        tree.q0,
+    )
@@ -0,0 +1,141 @@
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Callable, List
+
+import numpy as np
+
+from .. import transform as tf
+from .targets import Target
+
+
+@dataclass
+class IKResult:
+    """The outcome of an IK solver.
+
+    .. versionadded:: 0.15.0
+
+    IK solvers return this object instead of the joint values if called with
+    ``return_result=True``. It is also passed to the ``callback`` of a solver
+    after each iteration.
+
+    Attributes
+    ----------
+    joint_values : np.ndarray
+        The best joint values found so far. Joint values that reach all targets
+        are preferred; ties are broken by the sum of normalized scores
+        (``score / atol``).
+    scores : np.ndarray
+        The score of each target at ``joint_values``.
+    success : bool
+        True if all scores are below their target's ``atol``.
+    message : str
+        Why the solver stopped. Empty while the solver is running.
+    iterations : int
+        The number of completed iterations.
+    elapsed : float
+        The time (in seconds) since the solver started.
+
+    """
+
+    joint_values: np.ndarray
+    scores: np.ndarray
+    success: bool
+    message: str
+    iterations: int
+    elapsed: float
+
+
+class _Monitor:
+    """Tracks the best pose, the time budget, and the callback of a solver."""
+
+    def __init__(
+        self,
+        targets: List[Target],
+        joints: List[tf.Joint],
+        time_budget: float = None,
+        callback: Callable[[IKResult], bool] = None,
+    ) -> None:
+        self.targets = targets
+        self.joints = joints
+        self.atols = np.array([x.atol for x in targets])
+        self.callback = callback
+
+        self.start = perf_counter()
+        self.deadline = np.inf if time_budget is None else self.start + time_budget
+        self.iterations = 0
+
+        self.best_values = np.array([x.param for x in joints], dtype=np.float_)
+        self.best_scores = np.full(len(targets), np.inf)
+        self.best_loss = (True, np.inf)
+
+    def record(self, values: np.ndarray, scores: np.ndarray) -> None:
+        """Remember ``values`` if they are the best so far."""
+
+        loss = (bool(np.any(scores > self.atols)), np.sum(scores / self.atols))
+        if loss < self.best_loss:
+            self.best_loss = loss
+            self.best_values = np.array(values, dtype=np.float_)
+            self.best_scores = np.array(scores, dtype=np.float_)
+
+    def update(self) -> np.ndarray:
+        """Score the current joint values and record them."""
+
+        scores = np.array([x.score() for x in self.targets])
+        self.record([x.param for x in self.joints], scores)
+        return scores
+
+    def timeout(self) -> bool:
+        """True if the time budget is used up."""
+        return perf_counter() > self.deadline
+
+    def iteration(self) -> str:
+        """Finish an iteration.
+
+        Returns
+        -------
+        reason : str
+            Why the solver should stop, or an empty string if it should
+            continue.
+
+        """
+
+        self.iterations += 1
+
+        if self.callback is not None and self.callback(self.result()):
+            return "IK failed. Reason: Stopped by callback."
+
+        if self.timeout():
+            return "IK failed. Reason: Time budget exceeded."
+
+        return ""
+
+    def restore(self) -> None:
+        """Set the joints to the best values found so far."""
+
+        for joint, value in zip(self.joints, self.best_values):
+            joint.param = value
+
+    def finish(self, message: str) -> IKResult:
+        """Restore the best joint values and summarize the run.
+
+        ``message`` explains a failure; it is dropped if the best joint values
+        reach all targets.
+
+        """
+
+        self.restore()
+        result = self.result()
+        if not result.success:
+            result.message = message
+
+        return result
+
+    def result(self, message: str = "") -> IKResult:
+        return IKResult(
+            joint_values=self.best_values.copy(),
+            scores=self.best_scores.copy(),
+            success=bool(np.all(self.best_scores <= self.atols)),
+            message=message,
+            iterations=self.iterations,
+            elapsed=perf_counter() - self.start,
+        )
@@ -1,7 +1,8 @@
 from numpy.typing import ArrayLike
-from typing import Callable, List, Union
+from typing import Callable, List, Tuple, Union
 import numpy as np
 from .. import transform as tf
+from ..transform.affine import AffineCompound, AffineLink
 
 
 class Target:
@@ -93,6 +94,9 @@ class PositionTarget(Target):
     between the transformed point and ``dynamic_positon`` under the desired norm
     (default: L2).
 
+    .. versionchanged:: 0.15.0
+        Scoring is incremental; only the part of the chain that changed since
+        the last call is re-evaluated.
     .. versionadded:: 0.10.0
 
     Parameters
@@ -111,6 +115,17 @@ class PositionTarget(Target):
         norm of the distance between ``target_position`` and the transformed
         ``static_position`` in ``dynamic_frame``. If None defaults to L2.
 
+    Notes
+    -----
+    The target caches ``static_position`` after each link of the chain (prefix)
+    and the affine parts of the chain as matrices that map from each link into
+    ``dynamic_frame`` (suffix). When a :class:`tf.Joint
+    <skbot.transform.Joint>` changes, only the results that depend on it are
+    recomputed; for CCD this means that each step evaluates a constant number
+    of links instead of the full chain. Joints are detected as changed when
+    the value of their ``param`` changes. All other links are assumed to be
+    constant until the chain is replaced.
+
     """
 
     def __init__(
@@ -132,13 +147,133 @@ class PositionTarget(Target):
         else:
             self.norm = norm
 
-    def score(self):
-        current_pos = self.static_position
-        for link in self._chain:
-            current_pos = link.transform(current_pos)
+        # the chain and static_position that the cache was built for
+        self._cache_chain = None
+        self._cache_position = None
 
+    def score(self):
+        current_pos = self._static_position_at(len(self._chain))
         return self.norm(self.dynamic_position - current_pos)
 
+    def _sync(self) -> None:
+        """Invalidate cached results that depend on modified joints."""
+
+        chain = self._chain
+        n_links = len(chain)
+
+        if self._cache_chain is not chain:
+            self._cache_chain = chain
+            self._cache_position = None
+
+            # (idx, joints, params) of each link that contains joints
+            self._dynamic_links = list()
+            for idx, link in enumerate(chain):
+                joints = _joints_in(link)
+                if joints:
+                    params = [np.array(x.param) for x in joints]
+                    self._dynamic_links.append((idx, joints, params))
+
+            # all links from here on can be fused into a matrix
+            self._fusable = n_links
+            while self._fusable > 0 and _is_affine(chain[self._fusable - 1]):
+                self._fusable -= 1
+
+            self._matrices = [None] * n_links
+            self._positions = [None] * (n_links + 1)
+            self._suffix = [None] * (n_links + 1)
+            self._suffix_inverse = [None] * (n_links + 1)
+
+            # positions[:forward_valid+1] and suffix[suffix_valid:] are valid
+            self._forward_valid = 0
+            self._suffix_valid = n_links
+
+        # compare values (not identity); the position may be modified in-place
+        if self._cache_position is None or not np.array_equal(
+            self._cache_position, self.static_position
+        ):
+            self._cache_position = np.array(self.static_position)
+            self._positions[0] = self._cache_position
+            self._forward_valid = 0
+
+        for idx, joints, params in self._dynamic_links:
+            # compare values (not identity); params may be modified in-place
+            for joint_idx, joint in enumerate(joints):
+                if not np.array_equal(joint.param, params[joint_idx]):
+                    break
+            else:
+                continue
+
+            params[:] = [np.array(x.param) for x in joints]
+            self._matrices[idx] = None
+            self._forward_valid = min(self._forward_valid, idx)
+            self._suffix_valid = max(self._suffix_valid, idx + 1)
+
+    def _static_position_at(self, idx: int) -> np.ndarray:
+        """``static_position`` after the first ``idx`` links of the chain."""
+
+        self._sync()
+
+        n_links = len(self._chain)
+        if idx <= self._forward_valid:
+            return self._positions[idx]
+
+        split = idx
+        if idx == n_links:
+            # use the fused suffix for the part of the chain that is unchanged
+            split = min(n_links, max(self._forward_valid + 1, self._fusable))
+
+        for link_idx in range(self._forward_valid, split):
+            self._positions[link_idx + 1] = self._chain[link_idx].transform(
+                self._positions[link_idx]
+            )
+        self._forward_valid = split
+
+        if split == idx:
+            return self._positions[idx]
+
+        return _apply_matrix(self._suffix_at(split), self._positions[split])
+
+    def _dynamic_position_at(self, idx: int) -> np.ndarray:
+        """``dynamic_position`` before the last ``len(chain) - idx`` links."""
+
+        self._sync()
+
+        n_links = len(self._chain)
+        position = np.asarray(self.dynamic_position)
+
+        split = max(min(idx + 1, n_links), self._fusable)
+        if split < n_links:
+            suffix = self._suffix_at(split)
+            if suffix.shape[-1] == suffix.shape[-2]:
+                if self._suffix_inverse[split] is None:
+                    self._suffix_inverse[split] = np.linalg.inv(suffix)
+                position = _apply_matrix(self._suffix_inverse[split], position)
+            else:
+                split = n_links
+
+        for link in reversed(self._chain[idx:split]):
+            position = link.__inverse_transform__(position)
+
+        return position
+
+    def _suffix_at(self, idx: int) -> np.ndarray:
+        """The matrix that maps from ``chain[idx]`` into ``dynamic_frame``."""
+
+        n_links = len(self._chain)
+        for link_idx in range(self._suffix_valid - 1, idx - 1, -1):
+            if self._matrices[link_idx] is None:
+                self._matrices[link_idx] = _affine_matrix(self._chain[link_idx])
+
+            matrix = self._matrices[link_idx]
+            if link_idx + 1 < n_links:
+                matrix = self._suffix[link_idx + 1] @ matrix
+
+            self._suffix[link_idx] = matrix
+            self._suffix_inverse[link_idx] = None
+        self._suffix_valid = min(self._suffix_valid, idx)
+
+        return self._suffix[idx]
+
 
 class RotationTarget(Target):
     """IK rotation target (2D/3D).
@@ -149,6 +284,9 @@ class RotationTarget(Target):
     function computes the distance in radians between the current
     rotation and desired rotation.
 
+    .. versionchanged:: 0.15.0
+        The rotational part of the chain is cached instead of being
+        simplified on every call to ``score``.
     .. versionadded:: 0.10.0
 
     Parameters
@@ -162,6 +300,16 @@ class RotationTarget(Target):
         The frame that should be rotated by
         ``desired_rotation`` relative to ``static_frame``.
 
+    Notes
+    -----
+    To compute the score quickly, the target reduces the chain between
+    ``static_frame`` and ``dynamic_frame`` (and ``desired_rotation``) to its
+    rotational part once and caches the result. :class:`tf.Joints
+    <skbot.transform.Joint>` are evaluated on each call; all other links are
+    fused into constant matrices. The cache is rebuilt when the chain is
+    replaced, e.g., by an IK solver. If you modify a link that is not a joint,
+    create a new target.
+
     """
 
     def __init__(
@@ -190,18 +338,16 @@ class RotationTarget(Target):
             x for x in self.desired_rotation if not isinstance(x, tf.Translation)
         ]
 
+        # (source chain, reduced chain); rebuilt if the source is replaced
+        self._actual_cache = (None, None)
+        self._desired_cache = (None, None)
+
     def score(self):
         basis = np.eye(self.static_frame.ndim)
+        desired, reduced = self._reduced_chains()
 
-        desired_basis = basis
-        for link in self.desired_rotation:
-            desired_basis = link.transform(desired_basis)
-
-        reduced = tf.simplify_links(self._chain)
-        reduced = [x for x in reduced if not isinstance(x, tf.Translation)]
-        actual_basis = basis
-        for link in reduced:
-            actual_basis = link.transform(actual_basis)
+        desired_basis = _apply_rotation_chain(desired, basis)
+        actual_basis = _apply_rotation_chain(reduced, basis)
 
         trace = np.trace(desired_basis @ actual_basis.T)
         if self.static_frame.ndim == 3:
@@ -214,3 +360,128 @@ class RotationTarget(Target):
             raise NotImplementedError("Only 2D and 3D is currently supported.")
 
         return theta
+
+    def _reduced_chains(self) -> Tuple[List, List]:
+        """The (cached) rotational part of ``desired_rotation`` and the chain."""
+
+        basis = np.eye(self.static_frame.ndim)
+
+        source, desired = self._desired_cache
+        if source is not self.desired_rotation:
+            desired = _rotation_chain(self.desired_rotation, basis)
+            self._desired_cache = (self.desired_rotation, desired)
+
+        source, reduced = self._actual_cache
+        if source is not self._chain:
+            reduced = _rotation_chain(self._chain, basis)
+            self._actual_cache = (self._chain, reduced)
+
+        return desired, reduced
+
+
+def _is_joint(link: tf.Link) -> bool:
+    if isinstance(link, tf.InvertLink):
+        link = link._forward_link
+    return isinstance(link, tf.Joint)
+
+
+def _rotation_chain(
+    links: List[tf.Link], basis: np.ndarray
+) -> List[Union[tf.Link, np.ndarray]]:
+    """Reduce a chain to its rotational part.
+
+    Translations are dropped and joints are kept. Runs of other affine links
+    are fused into a matrix ``M`` that acts on row vectors, i.e., ``x @ M``.
+    Remaining links are kept as-is.
+    """
+
+    origin = np.zeros(basis.shape[-1])
+
+    reduced: List[Union[tf.Link, np.ndarray]] = list()
+    matrix = None
+    for link in tf.simplify_links(links, keep_joints=True):
+        forward = link._forward_link if isinstance(link, tf.InvertLink) else link
+
+        if isinstance(forward, tf.Translation):
+            continue
+
+        if _is_joint(link) or not isinstance(forward, AffineLink):
+            if matrix is not None:
+                reduced.append(matrix)
+                matrix = None
+            reduced.append(link)
+            continue
+
+        linear = link.transform(basis) - link.transform(origin)
+        matrix = linear if matrix is None else matrix @ linear
+
+    if matrix is not None:
+        reduced.append(matrix)
+
+    return reduced
+
+
+def _apply_rotation_chain(
+    reduced: List[Union[tf.Link, np.ndarray]], basis: np.ndarray
+) -> np.ndarray:
+    for element in reduced:
+        if isinstance(element, np.ndarray):
+            basis = basis @ element
+        else:
+            basis = element.transform(basis)
+
+    return basis
+
+
+def _joints_in(link: tf.Link) -> List[tf.Joint]:
+    if isinstance(link, tf.Joint):
+        return [link]
+    elif isinstance(link, tf.InvertLink):
+        return _joints_in(link._forward_link)
+    elif isinstance(link, (tf.CompundLink, AffineCompound)):
+        return [x for sub_link in link._links for x in _joints_in(sub_link)]
+    else:
+        return []
+
+
+def _is_affine(link: tf.Link) -> bool:
+    if isinstance(link, tf.InvertLink):
+        return _is_affine(link._forward_link)
+    elif isinstance(link, (tf.CompundLink, AffineCompound)):
+        return all(_is_affine(x) for x in link._links)
+    elif isinstance(link, (tf.Rotation, tf.Translation, tf.AffineMatrix)):
+        return link._axis == -1
+    else:
+        return False
+
+
+def _affine_matrix(link: tf.Link) -> np.ndarray:
+    """The homogeneous matrix of an affine link."""
+
+    forward = link._forward_link if isinstance(link, tf.InvertLink) else link
+    ndim = link.parent_dim
+
+    # fast paths for (unbatched) rotations and translations
+    if (
+        isinstance(forward, tf.Rotation)
+        and np.size(forward.angle) == 1
+        and np.ndim(forward._u) == 1
+    ):
+        matrix = np.eye(ndim + 1)
+        matrix[:-1, :-1] = link.transform(np.eye(ndim)).T
+        return matrix
+    elif (
+        isinstance(forward, tf.Translation)
+        and np.size(forward.amount) == 1
+        and np.ndim(forward.direction) == 1
+    ):
+        matrix = np.eye(ndim + 1)
+        matrix[:-1, -1] = link.transform(np.zeros(ndim))
+        return matrix
+
+    return tf.AffineMatrix.from_links([link]).affine_matrix
+
+
+def _apply_matrix(matrix: np.ndarray, x: np.ndarray) -> np.ndarray:
+    result = (matrix[..., :-1, :-1] @ x[..., None])[..., 0]
+    return result + matrix[..., :-1, -1]
@@ -1,18 +1,31 @@
 from xml.etree import ElementTree
 from scipy.spatial.transform import Rotation
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Union
 import numpy as np
 
 from ... import transform as rtf
 
 
-def create_frame_graph(urdf: str) -> Tuple[Dict[str, rtf.Frame], Dict[str, rtf.Link]]:
+def create_frame_graph(
+    urdf: str, *, as_kinematic_tree: bool = False
+) -> Union[Tuple[Dict[str, rtf.Frame], Dict[str, rtf.Link]], rtf.KinematicTree]:
     """Create a frame graph from a URDF string.
 
+    .. versionadded:: 0.15.0
+        Added the ability to export kinematic trees (``as_kinematic_tree``)
+
     Parameters
     ----------
     urdf: TextIO
         A text buffer containing the URDF XML.
+    as_kinematic_tree : bool
+        If ``True``, return a :class:`skbot.transform.KinematicTree` rooted at
+        the root link instead of frames and links. Its joints are the
+        revolute and prismatic joints in the order in which they appear in the
+        URDF, and their limits are taken from the ``<limit>`` elements. As
+        in the URDF specification, a missing ``lower`` or ``upper`` attribute
+        defaults to 0. Joints without a ``<limit>`` element are unbounded.
+        Defaults to ``False``.
 
     Returns
     -------
@@ -20,6 +33,8 @@ def create_frame_graph(urdf: str) -> Tuple[Dict[str, rtf.Frame], Dict[str, rtf.L
         A dict of frames (links and joints) contained in the file.
     links : Dict[str, Frames]
         A dict of links in the graph. Names are chosen based on joint names.
+    tree : KinematicTree
+        The kinematic tree (only if ``as_kinematic_tree`` is set).
 
     See Also
     --------
@@ -37,6 +52,9 @@ def create_frame_graph(urdf: str) -> Tuple[Dict[str, rtf.Frame], Dict[str, rtf.L
     frames = dict()
     links = dict()
     links_to_process: List[ElementTree.Element] = list()
+    child_frames = set()
+    joints: List[rtf.Link] = list()
+    limits: List[Tuple[float, float]] = list()
 
     for child in tree:
         if child.tag == "link":
@@ -51,6 +69,7 @@ def create_frame_graph(urdf: str) -> Tuple[Dict[str, rtf.Frame], Dict[str, rtf.L
 
         frame_offset = np.zeros(3, dtype=np.float_)
         frame_rotation = np.zeros(3, dtype=np.float_)
+        limit = (-np.inf, np.inf)
         for child in link:
             if child.tag == "parent":
                 frame_parent = frames[child.attrib["link"]]
@@ -73,6 +92,12 @@ def create_frame_graph(urdf: str) -> Tuple[Dict[str, rtf.Frame], Dict[str, rtf.L
             elif child.tag == "axis":
                 axis = child.attrib["xyz"]
                 axis = np.array(axis.split(" "), dtype=np.float_)
+            elif child.tag == "limit":
+                # missing bounds default to 0 (URDF spec)
+                limit = (
+                    float(child.attrib.get("lower", 0)),
+                    float(child.attrib.get("upper", 0)),
+                )
 
         # link parent -> joint
         rotation = Rotation.from_euler("xyz", frame_rotation)
@@ -95,5 +120,26 @@ def create_frame_graph(urdf: str) -> Tuple[Dict[str, rtf.Frame], Dict[str, rtf.L
         frame_link(frame_joint, frame_child)
 
         links[link.attrib["name"]] = frame_link
-
-    return frames, links
+        child_frames.add(frame_child)
+        if joint_type != "fixed":
+            joints.append(frame_link)
+            limits.append(limit)
+
+    if not as_kinematic_tree:
+        return frames, links
+
+    roots = [
+        frames[x.attrib["name"]]
+        for x in tree
+        if x.tag == "link" and frames[x.attrib["name"]] not in child_frames
+    ]
+    if len(roots) != 1:
+        raise ValueError("The URDF must contain exactly one root link.")
+
+    kinematic_tree = rtf.KinematicTree.from_frame_graph(roots[0], joints=joints)
+    if len(limits) > 0:
+        kinematic_tree.lower_limits[:], kinematic_tree.upper_limits[:] = np.transpose(
+            limits
+        )
+
+    return kinematic_tree
@@ -47,6 +47,7 @@ Base Elements
 
     Frame
     Link
+    KinematicTree
 
 Available Transformations
 -------------------------
@@ -58,6 +59,7 @@ Available Transformations
     :toctree:
 
     AffineSpace
+    AffineMatrix
     Translation
     Rotation
     PerspectiveProjection
@@ -165,7 +167,7 @@ from .functions import (
     scale,
 )
 
-from .affine import Translation, Rotation, Inverse, AffineSpace
+from .affine import Translation, Rotation, Inverse, AffineSpace, AffineMatrix
 from .projections import PerspectiveProjection
 from .utils3d import (
     FrustumProjection,
@@ -174,6 +176,7 @@ from .utils3d import (
     RotvecRotation,
 )
 from .joints import RotationalJoint, PrismaticJoint, AngleJoint, Joint
+from .kinematic_tree import KinematicTree
 from .utils2d import AxialHexagonTransform, Rotation2D, HexagonAxisRound
 
 from . import metrics
@@ -184,8 +187,10 @@ __all__ = [
     "Frame",
     "metrics",  # transform chain metrics
     "Link",
+    "KinematicTree",
     # nD Links
     "AffineSpace",
+    "AffineMatrix",
     "Rotation",
     "Translation",
     "PerspectiveProjection",
@@ -1,9 +1,15 @@
+import itertools
+from typing import Sequence
+
 import numpy as np
 from numpy.typing import ArrayLike
 from numba.extending import register_jitable, overload
 from numba.np.unsafe.ndarray import to_fixed_tuple
 import numba
 
+# register the numpy overloads
+from .. import _numba_overloads
+
 
 def reduce(
     reduce_op, x: np.ndarray, axis: ArrayLike, keepdims: bool = False
@@ -142,6 +148,23 @@ def vector_project(a: ArrayLike, b: ArrayLike, axis: int = -1) -> np.ndarray:
     return result
 
 
+def _compile_kernels(dtypes: Sequence[str], ndims: Sequence[int]) -> None:
+    """Compile the numba kernels of this module for the given inputs.
+
+    The signatures match the arrays that :func:`vector_project` passes to the
+    kernel, i.e., read-only, C-contiguous arrays. Each combination of
+    ``ndims`` is compiled for ``a`` and ``b`` (both of the same dtype).
+
+    """
+
+    for dtype in dtypes:
+        scalar = numba.from_dtype(np.dtype(dtype))
+        for ndim_a, ndim_b in itertools.product(ndims, repeat=2):
+            array_a = numba.types.Array(scalar, ndim_a, "C", readonly=True)
+            array_b = numba.types.Array(scalar, ndim_b, "C", readonly=True)
+            _vector_project_impl.compile((array_a, array_b))
+
+
 def scalar_project(
     a: ArrayLike, b: ArrayLike, *, axis: int = -1, keepdims=False
 ) -> np.ndarray:
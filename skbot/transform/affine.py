@@ -243,6 +243,111 @@ class Translation(AffineLink):
         return np.moveaxis(result, -1, self._axis)
 
 
+class AffineMatrix(AffineLink):
+    """A fixed affine transformation in N-D.
+
+    .. versionadded:: 0.15.0
+
+    The transformation is stored as a homogeneous matrix, which makes it
+    cheap to evaluate; transforming a vector is a single matrix-vector product
+    regardless of how many links the matrix was computed from. Use
+    :meth:`from_links` to fuse a chain of static affine links.
+
+    Parameters
+    ----------
+    matrix : ArrayLike
+        The homogeneous transformation matrix of shape ``(child_dim + 1,
+        parent_dim + 1)``, or a batch of such matrices.
+    axis : int
+        The axis along which computation takes place. All other axes are considered
+        batch dimensions.
+
+    Notes
+    -----
+    Implements __inverse_transform__ if the matrix is square.
+
+    The matrix is fixed, i.e., if the links it was computed from change, this
+    link doesn't.
+
+    """
+
+    def __init__(self, matrix: ArrayLike, *, axis: int = -1) -> None:
+        matrix = np.asarray(matrix, dtype=float)
+        super().__init__(matrix.shape[-1] - 1, matrix.shape[-2] - 1, axis=axis)
+
+        self._matrix = matrix
+        self._inverse = None
+
+    @classmethod
+    def from_links(cls, links: List[Link], *, axis: int = -1) -> "AffineMatrix":
+        """Fuse a chain of affine links into a single link.
+
+        Parameters
+        ----------
+        links : List[Link]
+            A sequence of links, e.g., as returned by
+            :func:`Frame.links_between <skbot.transform.Frame.links_between>`.
+            ``links[0]`` is applied first and ``links[-1]`` is applied last. The
+            chain must be affine.
+        axis : int
+            The axis along which computation takes place. All other axes are
+            considered batch dimensions.
+
+        Returns
+        -------
+        link : AffineMatrix
+            A link that transforms like the chain would at the time of fusion.
+
+        """
+
+        ndim = links[0].parent_dim
+
+        # origin and unit vectors, each followed by the chain. Points are
+        # transformed one at a time, because batched links broadcast each
+        # point to the batch's shape.
+        points = list()
+        for point in np.concatenate((np.zeros((1, ndim)), np.eye(ndim))):
+            for link in links:
+                point = link.transform(point)
+            points.append(np.moveaxis(point, axis, -1))
+        points = np.stack(np.broadcast_arrays(*points), axis=-2)
+
+        offset = points[..., 0, :]
+        linear = np.swapaxes(points[..., 1:, :] - offset[..., None, :], -1, -2)
+
+        child_dim = offset.shape[-1]
+        matrix = np.zeros((*offset.shape[:-1], child_dim + 1, ndim + 1))
+        matrix[..., :-1, :-1] = linear
+        matrix[..., :-1, -1] = offset
+        matrix[..., -1, -1] = 1
+
+        return cls(matrix, axis=axis)
+
+    @property
+    def affine_matrix(self) -> np.ndarray:
+        """The transformation matrix mapping the parent to the child frame."""
+        return self._matrix
+
+    @property
+    def _inverse_tf_matrix(self) -> np.ndarray:
+        if self._inverse is None:
+            self._inverse = np.linalg.inv(self._matrix)
+
+        return self._inverse
+
+    def transform(self, x: ArrayLike) -> np.ndarray:
+        return self._apply(self._matrix, x)
+
+    def __inverse_transform__(self, x: ArrayLike) -> np.ndarray:
+        return self._apply(self._inverse_tf_matrix, x)
+
+    def _apply(self, matrix: np.ndarray, x: ArrayLike) -> np.ndarray:
+        x = np.moveaxis(np.asarray(x), self._axis, -1)
+        result = np.einsum("...ij,...j->...i", matrix[..., :-1, :-1], x)
+        result += matrix[..., :-1, -1]
+        return np.moveaxis(result, -1, self._axis)
+
+
 class AffineSpace(Link):
     """Transform to affine space
 
@@ -163,6 +163,10 @@ class InvertLink(Link):
         return self._forward_link.transform(x)
 
     def __getattr__(self, attr):
+        if attr == "_forward_link":
+            # not set yet, e.g., while unpickling; avoid infinite recursion
+            raise AttributeError(attr)
+
         return getattr(self._forward_link, attr)
 
 
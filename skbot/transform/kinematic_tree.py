@@ -0,0 +1,354 @@
+from typing import Dict, List, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .affine import AffineMatrix, Rotation, Translation
+from .base import Frame, InvertLink, Link
+from .joints import Joint
+
+# joint types
+FIXED = 0
+REVOLUTE = 1
+PRISMATIC = 2
+
+
+class KinematicTree:
+    """Structure-of-arrays representation of a kinematic tree.
+
+    .. versionadded:: 0.15.0
+
+    A frame graph stores each frame and link as a Python object, and each
+    transformation walks the graph link by link. This class stores the same
+    (tree-shaped, 3D, affine) graph as a set of arrays instead; each node
+    (frame) has a parent, a fixed transformation into its parent, and
+    (optionally) a joint. This makes it cheap to evaluate the pose of all
+    frames at once, e.g., for batched forward kinematics, collision
+    checking, or inverse kinematics.
+
+    Nodes are sorted topologically, i.e., ``parents[idx] < idx`` for all nodes
+    but the root (``idx=0``), whose parent is ``-1``.
+
+    Parameters
+    ----------
+    names : List[str]
+        The name of each node (frame).
+    parents : ArrayLike
+        The index of each node's parent. Shape: ``(N,)``.
+    transforms : ArrayLike
+        The fixed part of the (homogeneous) transformation from each node into
+        its parent. Shape: ``(N, 4, 4)``.
+    joint_types : ArrayLike
+        The type of joint between each node and its parent; one of
+        ``KinematicTree.FIXED``, ``KinematicTree.REVOLUTE``, or
+        ``KinematicTree.PRISMATIC``. Shape: ``(N,)``.
+    joint_axes : ArrayLike
+        The axis of each node's joint (expressed in the node's frame). For
+        revolute joints it is a unit vector and the joint rotates (right-handed)
+        around it. For prismatic joints the joint translates along it by the
+        joint's value times the axis. Zero for fixed nodes. Shape: ``(N, 3)``.
+    joint_index : ArrayLike
+        The index of each node's joint value in ``q``, or ``-1`` if the node is
+        fixed. Shape: ``(N,)``.
+    lower_limits : ArrayLike
+        The minimum value of each joint. Shape: ``(J,)``.
+    upper_limits : ArrayLike
+        The maximum value of each joint. Shape: ``(J,)``.
+    q0 : ArrayLike
+        The initial value of each joint. Shape: ``(J,)``.
+
+    Notes
+    -----
+    The transformation from a node into its parent is ``transforms[idx] @
+    J(q[joint_index[idx]])`` where ``J`` is the (homogeneous) transformation
+    of the node's joint.
+
+    """
+
+    FIXED = FIXED
+    REVOLUTE = REVOLUTE
+    PRISMATIC = PRISMATIC
+
+    def __init__(
+        self,
+        names: List[str],
+        parents: ArrayLike,
+        transforms: ArrayLike,
+        joint_types: ArrayLike,
+        joint_axes: ArrayLike,
+        joint_index: ArrayLike,
+        lower_limits: ArrayLike,
+        upper_limits: ArrayLike,
+        q0: ArrayLike,
+    ) -> None:
+        self.names = list(names)
+        self.parents = np.asarray(parents, dtype=np.int_)
+        self.transforms = np.asarray(transforms, dtype=np.float_)
+        self.joint_types = np.asarray(joint_types, dtype=np.int_)
+        self.joint_axes = np.asarray(joint_axes, dtype=np.float_)
+        self.joint_index = np.asarray(joint_index, dtype=np.int_)
+        self.lower_limits = np.asarray(lower_limits, dtype=np.float_)
+        self.upper_limits = np.asarray(upper_limits, dtype=np.float_)
+        self.q0 = np.asarray(q0, dtype=np.float_)
+
+        if np.any(self.parents[1:] >= np.arange(1, len(self.parents))):
+            raise ValueError("Nodes must be sorted topologically.")
+
+        depth = np.zeros(len(self.parents), dtype=np.int_)
+        for idx in range(1, len(self.parents)):
+            depth[idx] = depth[self.parents[idx]] + 1
+        self.depth = depth
+
+        # nodes grouped by depth; each group is computed in one step
+        self._levels = [
+            np.flatnonzero(depth == level) for level in range(1, depth.max() + 1)
+        ]
+
+        self._revolute = np.flatnonzero(self.joint_types == REVOLUTE)
+        self._prismatic = np.flatnonzero(self.joint_types == PRISMATIC)
+
+        axes = self.joint_axes[self._revolute]
+        skew = np.zeros((len(axes), 3, 3))
+        skew[:, 0, 1] = -axes[:, 2]
+        skew[:, 0, 2] = axes[:, 1]
+        skew[:, 1, 0] = axes[:, 2]
+        skew[:, 1, 2] = -axes[:, 0]
+        skew[:, 2, 0] = -axes[:, 1]
+        skew[:, 2, 1] = axes[:, 0]
+        self._skew = skew
+        self._skew2 = skew @ skew
+
+    @property
+    def n_nodes(self) -> int:
+        """The number of nodes (frames) in the tree."""
+        return len(self.parents)
+
+    @property
+    def n_joints(self) -> int:
+        """The number of joints (entries of ``q``) in the tree."""
+        return len(self.q0)
+
+    def index(self, name: str) -> int:
+        """The index of the first node with the given name."""
+        return self.names.index(name)
+
+    def forward_kinematics(self, q: ArrayLike = None) -> np.ndarray:
+        """Compute the pose of each node.
+
+        Parameters
+        ----------
+        q : ArrayLike
+            The joint values. Shape: ``(..., J)`` where leading axes are batch
+            dimensions. If None, use ``q0``.
+
+        Returns
+        -------
+        poses : np.ndarray
+            The (homogeneous) transformation from each node into the root, i.e.,
+            ``poses[..., idx, :, :] @ x`` expresses ``x`` (given in node ``idx``)
+            in the root frame. Shape: ``(..., N, 4, 4)``.
+
+        """
+
+        if q is None:
+            q = self.q0
+        q = np.asarray(q, dtype=np.float_)
+        batch_shape = q.shape[:-1]
+
+        local = np.broadcast_to(self.transforms, (*batch_shape, self.n_nodes, 4, 4))
+        local = local.copy()
+
+        if len(self._revolute) > 0:
+            nodes = self._revolute
+            angle = q[..., self.joint_index[nodes]][..., None, None]
+            joint = np.zeros((*batch_shape, len(nodes), 4, 4))
+            joint[..., :3, :3] = (
+                np.eye(3)
+                + np.sin(angle) * self._skew
+                + (1 - np.cos(angle)) * self._skew2
+            )
+            joint[..., 3, 3] = 1
+            local[..., nodes, :, :] = local[..., nodes, :, :] @ joint
+
+        if len(self._prismatic) > 0:
+            nodes = self._prismatic
+            amount = q[..., self.joint_index[nodes]][..., None]
+            offset = amount * self.joint_axes[nodes]
+            block = local[..., nodes, :, :]
+            block[..., :3, 3] += np.einsum(
+                "...ij,...j->...i", block[..., :3, :3], offset
+            )
+            local[..., nodes, :, :] = block
+
+        poses = np.empty_like(local)
+        poses[..., 0, :, :] = local[..., 0, :, :]
+        for nodes in self._levels:
+            poses[..., nodes, :, :] = (
+                poses[..., self.parents[nodes], :, :] @ local[..., nodes, :, :]
+            )
+
+        return poses
+
+    @classmethod
+    def from_frame_graph(
+        cls, root: Frame, *, joints: List[Link] = None
+    ) -> "KinematicTree":
+        """Convert a frame graph into a kinematic tree.
+
+        The graph is traversed breadth-first starting at ``root``. Frames that
+        are reached via a non-3D link, e.g., a camera's projection into pixel
+        space, are ignored.
+
+        Parameters
+        ----------
+        root : Frame
+            The root of the tree, e.g., the world or a robot's base frame.
+        joints : List[Link]
+            The links that are parameterized, i.e., that become joints. They
+            must be (3D) :class:`tf.Rotation <skbot.transform.Rotation>` or
+            :class:`tf.Translation <skbot.transform.Translation>` links, and
+            ``q[idx]`` controls ``joints[idx]`` (its angle or amount). If None,
+            use all links that are instances of :class:`tf.Joint
+            <skbot.transform.Joint>` in the order in which they are found.
+
+        Returns
+        -------
+        tree : KinematicTree
+            The kinematic tree. All other links are stored as fixed
+            transformations using their current value.
+
+        Raises
+        ------
+        ValueError
+            If the graph is not a tree, if a link can't be represented (e.g.
+            it is batched), or if a joint in ``joints`` is not part of the tree.
+
+        """
+
+        joint_ids: Dict[int, int] = dict()
+        joint_links: List[Link] = list()
+        if joints is not None:
+            for link in joints:
+                joint_ids[id(link)] = len(joint_links)
+                joint_links.append(link)
+
+        names = [root.name]
+        parents = [-1]
+        transforms = [np.eye(4)]
+        joint_types = [FIXED]
+        joint_axes = [np.zeros(3)]
+        joint_index = [-1]
+
+        visited: Dict[Frame, int] = {root: 0}
+        queue = [root]
+        pos = 0
+        while pos < len(queue):
+            frame = queue[pos]
+            frame_idx = visited[frame]
+            pos += 1
+
+            for child, link in frame._children:
+                if child.ndim != 3 or link.parent_dim != link.child_dim:
+                    continue
+
+                if child in visited:
+                    # links back to the parent and parallel links are fine
+                    child_idx = visited[child]
+                    is_parent = child_idx == parents[frame_idx]
+                    is_child = parents[child_idx] == frame_idx
+                    if not (is_parent or is_child):
+                        raise ValueError("The frame graph is not a tree.")
+                    continue
+
+                up_link, inverted = _up_link(frame, child, link)
+
+                base = up_link._forward_link if inverted else up_link
+                if joints is None and isinstance(base, Joint):
+                    joint_ids[id(base)] = len(joint_links)
+                    joint_links.append(base)
+
+                if id(base) in joint_ids:
+                    joint_type, axis = _joint_axis(base)
+                    if inverted:
+                        axis = -axis
+                    transform = np.eye(4)
+                    index = joint_ids[id(base)]
+                else:
+                    joint_type = FIXED
+                    axis = np.zeros(3)
+                    transform = AffineMatrix.from_links([up_link]).affine_matrix
+                    index = -1
+
+                if transform.shape != (4, 4):
+                    raise ValueError("Batched links are not supported.")
+
+                visited[child] = len(names)
+                names.append(child.name)
+                parents.append(frame_idx)
+                transforms.append(transform)
+                joint_types.append(joint_type)
+                joint_axes.append(axis)
+                joint_index.append(index)
+                queue.append(child)
+
+        if len(set(joint_index) - {-1}) != len(joint_links):
+            raise ValueError("Some joints are not part of the tree.")
+
+        lower_limits = list()
+        upper_limits = list()
+        q0 = list()
+        for link in joint_links:
+            lower_limits.append(getattr(link, "lower_limit", -np.inf))
+            upper_limits.append(getattr(link, "upper_limit", np.inf))
+
+            if isinstance(link, Rotation):
+                value = np.asarray(link.angle)
+            else:
+                value = np.asarray(link.amount)
+
+            if value.size != 1:
+                raise ValueError("Batched joints are not supported.")
+            q0.append(value.item())
+
+        return cls(
+            names,
+            parents,
+            np.stack(transforms),
+            joint_types,
+            np.stack(joint_axes),
+            joint_index,
+            lower_limits,
+            upper_limits,
+            q0,
+        )
+
+
+def _up_link(frame: Frame, child: Frame, link: Link) -> Tuple[Link, bool]:
+    """The link from child into frame and whether it is an inverse."""
+
+    for neighbour, up_link in child._children:
+        if neighbour is frame:
+            break
+    else:
+        # one-way link; we can still use its inverse for fixed transforms
+        matrix = AffineMatrix.from_links([link]).affine_matrix
+        return AffineMatrix(np.linalg.inv(matrix)), False
+
+    if isinstance(up_link, InvertLink):
+        return up_link, True
+    return up_link, False
+
+
+def _joint_axis(link: Link) -> Tuple[int, np.ndarray]:
+    if isinstance(link, Rotation) and link.parent_dim == 3:
+        axis = np.cross(link._u_ortho, link._u)
+        if axis.shape != (3,):
+            raise ValueError("Batched joints are not supported.")
+        return REVOLUTE, axis / np.linalg.norm(axis)
+    elif isinstance(link, Translation) and link.parent_dim == 3:
+        direction = np.asarray(link.direction, dtype=np.float_)
+        if direction.shape != (3,):
+            raise ValueError("Batched joints are not supported.")
+        return PRISMATIC, direction
+    else:
+        raise ValueError(f"Unsupported joint: {type(link).__name__}.")
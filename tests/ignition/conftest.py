@@ -4,6 +4,12 @@ import hashlib
 from urllib.parse import quote
 from zipfile import ZipFile
 from io import BytesIO
+import socket
+import struct
+import threading
+import time
+import uuid
+import zmq
 
 import skbot.ignition as ign
 
@@ -499,3 +505,164 @@ def fake_internal_cache():
     fake_cache = ign.fuel.InternalCache()
     fake_cache.update("foo", "bar", "baz")
     return fake_cache
+
+
+"""
+Transport Fixtures
+------------------
+
+"""
+
+
+class FakePublisher:
+    """A minimal ign-transport publisher.
+
+    Answers discovery requests for a single topic, sends heartbeats, and only
+    publishes once a subscriber registered via the control socket (mimicking
+    ign-transport).
+    """
+
+    def __init__(self, partition, port, topic, msg_type="ignition.msgs.Clock"):
+        self.partition = partition
+        self.port = port
+        self.topic = f"@/{partition}@{topic}"
+        self.msg_type = msg_type
+        self.process_uuid = str(uuid.uuid4())
+        self.node_uuid = str(uuid.uuid4())
+        self.connections = list()
+
+        self.context = zmq.Context()
+        self.pub_socket = self.context.socket(zmq.PUB)
+        self.pub_socket.bind("tcp://127.0.0.1:*")
+        self.address = self.pub_socket.getsockopt_string(zmq.LAST_ENDPOINT)
+        self.ctrl_socket = self.context.socket(zmq.ROUTER)
+        self.ctrl_socket.bind("tcp://127.0.0.1:*")
+        self.ctrl = self.ctrl_socket.getsockopt_string(zmq.LAST_ENDPOINT)
+
+        self.udp = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+        self.udp.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.udp.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        self.udp.bind(("", port))
+        membership = struct.pack(
+            "4s4s",
+            socket.inet_aton(ign.discovery.MULTICAST_GROUP),
+            socket.inet_aton("127.0.0.1"),
+        )
+        self.udp.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, membership)
+        self.udp.setsockopt(
+            socket.IPPROTO_IP, socket.IP_MULTICAST_IF, socket.inet_aton("127.0.0.1")
+        )
+        self.udp.settimeout(0.05)
+
+        self.running = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def send(self, msg_type, **kwargs):
+        msg = ign.messages.Discovery(
+            version=ign.discovery.WIRE_VERSION,
+            process_uuid=self.process_uuid,
+            type=msg_type,
+            **kwargs,
+        )
+        payload = bytes(msg)
+        self.udp.sendto(
+            struct.pack("<H", len(payload)) + payload,
+            (ign.discovery.MULTICAST_GROUP, self.port),
+        )
+
+    def advertisement(self):
+        return ign.messages.DiscoveryPublisher(
+            topic=self.topic,
+            address=self.address,
+            process_uuid=self.process_uuid,
+            node_uuid=self.node_uuid,
+            scope=ign.messages.DiscoveryPublisherScope.ALL,
+            msg_pub=ign.messages.DiscoveryPublisherMessagePublisher(
+                ctrl=self.ctrl, msg_type=self.msg_type
+            ),
+        )
+
+    def publish(self, msg):
+        if not self.connections:
+            return
+
+        self.pub_socket.send_multipart(
+            [
+                self.topic.encode("utf-8"),
+                self.address.encode("utf-8"),
+                bytes(msg),
+                self.msg_type.encode("utf-8"),
+            ]
+        )
+
+    def _run(self):
+        last_heartbeat = 0
+        while self.running.is_set():
+            if time.monotonic() - last_heartbeat > 0.1:
+                self.send(ign.messages.DiscoveryType.HEARTBEAT)
+                last_heartbeat = time.monotonic()
+
+            while self.ctrl_socket.poll(0):
+                _, *frames = self.ctrl_socket.recv_multipart()
+                self.connections.append([x.decode("utf-8") for x in frames])
+
+            try:
+                datagram = self.udp.recv(65535)
+            except socket.timeout:
+                continue
+
+            msg = ign.messages.Discovery().parse(datagram[2:])
+            if msg.process_uuid == self.process_uuid:
+                continue
+            if msg.type == ign.messages.DiscoveryType.SUBSCRIBE:
+                if msg.sub.topic == self.topic:
+                    self.send(
+                        ign.messages.DiscoveryType.ADVERTISE, pub=self.advertisement()
+                    )
+
+    def start(self):
+        self.running.set()
+        self.thread.start()
+
+    def stop(self, say_bye=True):
+        self.running.clear()
+        self.thread.join()
+        if say_bye:
+            self.send(ign.messages.DiscoveryType.BYE)
+        self.udp.close()
+        self.context.destroy(linger=0)
+
+
+@pytest.fixture
+def discovery_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as probe:
+        probe.bind(("", 0))
+        return probe.getsockname()[1]
+
+
+@pytest.fixture
+def discovery_partition():
+    return f"skbot-test-{uuid.uuid4()}"
+
+
+@pytest.fixture
+def discovery_client(discovery_partition, discovery_port):
+    client = ign.DiscoveryClient(
+        discovery_partition,
+        port=discovery_port,
+        interface="127.0.0.1",
+        heartbeat_interval=0.1,
+        silence_interval=0.5,
+    )
+
+    with client:
+        yield client
+
+
+@pytest.fixture
+def fake_publisher(discovery_partition, discovery_port):
+    publisher = FakePublisher(discovery_partition, discovery_port, "/clock")
+    publisher.start()
+    yield publisher
+    if publisher.running.is_set():
+        publisher.stop()
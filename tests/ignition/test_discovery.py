@@ -0,0 +1,51 @@
+import time
+import pytest
+
+import skbot.ignition as ign
+
+
+def test_discover_publisher(discovery_client, fake_publisher):
+    publisher = discovery_client.wait_for_publisher("/clock", timeout=2)
+
+    assert publisher.address == fake_publisher.address
+    assert publisher.msg_pub.ctrl == fake_publisher.ctrl
+    assert len(discovery_client.publishers("/clock")) == 1
+
+
+def test_discover_timeout(discovery_client):
+    with pytest.raises(IOError):
+        discovery_client.wait_for_publisher("/clock", timeout=0.2)
+
+
+def test_discover_bye(discovery_client, fake_publisher):
+    discovery_client.wait_for_publisher("/clock", timeout=2)
+    fake_publisher.stop()
+
+    time.sleep(0.2)
+    assert discovery_client.publishers("/clock") == []
+
+
+def test_discover_silence(discovery_client, fake_publisher):
+    discovery_client.wait_for_publisher("/clock", timeout=2)
+    fake_publisher.stop(say_bye=False)
+
+    time.sleep(1)
+    assert discovery_client.publishers("/clock") == []
+
+
+def test_discover_other_partition(discovery_port, fake_publisher):
+    client = ign.DiscoveryClient(
+        "other-partition", port=discovery_port, interface="127.0.0.1"
+    )
+
+    with client:
+        with pytest.raises(IOError):
+            client.wait_for_publisher("/clock", timeout=0.2)
+
+
+def test_shared_client():
+    client = ign.discovery.shared_client("foo")
+
+    assert client is ign.discovery.shared_client("foo")
+    assert client is not ign.discovery.shared_client("bar")
+    assert not client.is_running
@@ -0,0 +1,74 @@
+import subprocess
+import sys
+
+import pytest
+
+import skbot.ignition as ign
+
+# measured ~5 ms on a laptop; generous to avoid flaky CI
+IMPORT_BUDGET = 0.25
+
+
+def run_isolated(code: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    )
+    return result.stdout.strip()
+
+
+def test_import_time_budget():
+    code = (
+        "import time; import sys;"
+        "start = time.perf_counter();"
+        "import skbot.ignition, skbot.ignition.sdformat;"
+        "print(time.perf_counter() - start)"
+    )
+
+    assert float(run_isolated(code)) < IMPORT_BUDGET
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "skbot.ignition.messages",
+        "skbot.ignition.sdformat.bindings.v18",
+        "skbot.ignition.sdformat.generic_sdf",
+        "skbot.transform",
+        "numba",
+        "numpy",
+        "zmq",
+        "xsdata",
+        "requests",
+        "cachetools",
+    ],
+)
+def test_import_is_lazy(module):
+    code = (
+        "import sys;"
+        "import skbot.ignition, skbot.ignition.sdformat;"
+        f"print('{module}' in sys.modules)"
+    )
+
+    assert run_isolated(code) == "False"
+
+
+def test_bindings_are_lazy():
+    code = (
+        "import sys;"
+        "from skbot.ignition.sdformat.bindings import v18;"
+        "v18.Geometry;"
+        "print('skbot.ignition.sdformat.bindings.v18.sensor' in sys.modules)"
+    )
+
+    assert run_isolated(code) == "False"
+
+
+def test_lazy_attributes():
+    assert "Subscriber" in dir(ign)
+    assert "loads" in dir(ign.sdformat)
+    assert ign.Subscriber is ign.subscriber.Subscriber
+    assert ign.sdformat.bindings.v18.ModelModel.__module__.endswith("v18.model")
+    assert ign.sdformat.bindings.v18.StateModel.__module__.endswith("v18.state")
+
+    with pytest.raises(AttributeError):
+        ign.not_a_member
@@ -0,0 +1,103 @@
+import pytest
+import zmq
+
+import skbot.ignition as ign
+from skbot.ignition import messages
+from skbot.ignition.lazy import LazyMessage
+
+
+@pytest.fixture
+def scene():
+    models = list()
+    for idx in range(3):
+        links = [
+            messages.Link(
+                name=f"link_{idx}_{link_idx}",
+                visual=[messages.Visual(name="visual", transparency=0.5)],
+            )
+            for link_idx in range(2)
+        ]
+        models.append(
+            messages.Model(
+                name=f"model_{idx}",
+                id=idx,
+                pose=messages.Pose(position=messages.Vector3d(x=idx, y=2, z=3)),
+                link=links,
+            )
+        )
+
+    return messages.Scene(
+        name="world", grid=True, model=models, ambient=messages.Color(r=0.5)
+    )
+
+
+def test_lazy_fields(scene):
+    lazy = LazyMessage(messages.Scene, bytes(scene))
+
+    assert lazy.name == "world"
+    assert lazy.grid is True
+    assert lazy.shadows is False
+    assert lazy.ambient.r == 0.5
+    assert len(lazy.model) == 3
+    assert lazy.model[1].pose.position.x == 1
+    assert lazy.model[2].link[1].name == "link_2_1"
+    assert lazy.model[0].link[0].visual[0].transparency == 0.5
+
+
+def test_lazy_decodes_on_access(scene):
+    lazy = LazyMessage(messages.Scene, bytes(scene))
+    model = lazy.model[0]
+    model.pose
+
+    assert "model" in lazy._cache
+    assert "name" not in lazy._cache
+    assert "pose" in model._cache
+    assert "link" not in model._cache
+    assert lazy.model[0] is model
+
+
+def test_lazy_defaults():
+    lazy = LazyMessage(messages.Scene, b"")
+
+    assert lazy.name == ""
+    assert lazy.model == []
+    assert lazy.ambient.r == 0
+    assert lazy.header.data == []
+
+
+def test_lazy_roundtrip(scene):
+    lazy = LazyMessage(messages.Scene, bytes(scene))
+
+    assert bytes(lazy) == bytes(scene)
+    assert lazy == scene
+    assert lazy.to_message() == scene
+    assert lazy.to_dict() == scene.to_dict()
+    assert lazy.model[0] == scene.model[0]
+
+
+def test_lazy_read_only(scene):
+    lazy = LazyMessage(messages.Scene, bytes(scene))
+
+    with pytest.raises(AttributeError):
+        lazy.name = "foo"
+
+    with pytest.raises(AttributeError):
+        lazy.not_a_field
+
+
+def test_lazy_merged_submessage():
+    first = bytes(messages.Pose(position=messages.Vector3d(x=1)))
+    second = bytes(messages.Pose(position=messages.Vector3d(y=2)))
+
+    lazy = LazyMessage(messages.Pose, first + second)
+
+    assert lazy.position.x == 1
+    assert lazy.position.y == 2
+
+
+def test_lazy_parser(scene):
+    frames = [b"topic", b"address", bytes(scene), b"ignition.msgs.Scene"]
+    lazy = ign.lazy.lazy_parser([zmq.Frame(x) for x in frames])
+
+    assert lazy.message_type is messages.Scene
+    assert lazy.model[2].name == "model_2"
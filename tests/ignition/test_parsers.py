@@ -0,0 +1,173 @@
+import numpy as np
+import pytest
+import zmq
+
+import skbot.ignition as ign
+from skbot.ignition import messages
+
+
+def as_zmq(msg, msg_type, copy=True):
+    frames = [b"topic", b"address", bytes(msg), msg_type.encode("utf-8")]
+    if not copy:
+        frames = [zmq.Frame(x) for x in frames]
+    return frames
+
+
+@pytest.mark.parametrize("copy", [True, False])
+def test_parse_image(copy):
+    expected = np.arange(4 * 5 * 3, dtype=np.uint8).reshape(4, 5, 3)
+    msg = messages.Image(
+        header=messages.Header(stamp=messages.Time(sec=3)),
+        width=5,
+        height=4,
+        step=15,
+        data=expected.tobytes(),
+        pixel_format_type=messages.PixelFormatType.RGB_INT8,
+    )
+
+    image = ign.parsers.parse_image(as_zmq(msg, "ignition.msgs.Image", copy))
+
+    assert image.header.stamp.sec == 3
+    assert image.width == 5 and image.height == 4
+    assert np.all(image.data == expected)
+    assert not image.data.flags.writeable
+
+
+def test_parse_image_padded_rows():
+    expected = np.arange(3 * 2, dtype="<u2").reshape(3, 2)
+    padded = np.zeros((3, 4), dtype="<u2")
+    padded[:, :2] = expected
+    msg = messages.Image(
+        width=2,
+        height=3,
+        step=8,
+        data=padded.tobytes(),
+        pixel_format_type=messages.PixelFormatType.L_INT16,
+    )
+
+    image = ign.parsers.parse_image(as_zmq(msg, "ignition.msgs.Image"))
+
+    assert image.data.shape == (3, 2)
+    assert np.all(image.data == expected)
+
+
+def test_parse_image_unknown_format():
+    msg = messages.Image(width=2, height=2, step=2, data=b"abcd")
+
+    image = ign.parsers.parse_image(as_zmq(msg, "ignition.msgs.Image"))
+
+    assert image.data.shape == (2, 2)
+    assert image.data.dtype == np.uint8
+
+
+def test_parse_point_cloud_packed():
+    points = np.zeros(
+        6,
+        dtype=[
+            ("x", "<f4"),
+            ("y", "<f4"),
+            ("z", "<f4"),
+            ("rgb", "u1", (3,)),
+            ("pad", "u1"),
+        ],
+    )
+    points["x"] = np.arange(6)
+    points["rgb"] = 7
+    Field = messages.PointCloudPackedField
+    DataType = messages.PointCloudPackedFieldDataType
+    msg = messages.PointCloudPacked(
+        field=[
+            Field(name="x", offset=0, datatype=DataType.FLOAT32, count=1),
+            Field(name="y", offset=4, datatype=DataType.FLOAT32, count=1),
+            Field(name="z", offset=8, datatype=DataType.FLOAT32, count=1),
+            Field(name="rgb", offset=12, datatype=DataType.UINT8, count=3),
+        ],
+        height=2,
+        width=3,
+        point_step=16,
+        row_step=48,
+        data=points.tobytes(),
+    )
+
+    cloud = ign.parsers.parse_point_cloud_packed(
+        as_zmq(msg, "ignition.msgs.PointCloudPacked", copy=False)
+    )
+
+    assert cloud.data.shape == (2, 3)
+    assert np.all(cloud.data["x"] == np.arange(6).reshape(2, 3))
+    assert cloud.data["rgb"].shape == (2, 3, 3)
+    assert np.all(cloud.data["rgb"] == 7)
+
+
+def test_parse_laser_scan():
+    ranges = np.linspace(0, 1, 2 * 5)
+    msg = messages.LaserScan(
+        frame="lidar",
+        angle_min=-1,
+        count=5,
+        vertical_count=2,
+        ranges=list(ranges),
+        intensities=list(ranges * 2),
+    )
+
+    scan = ign.parsers.parse_laser_scan(as_zmq(msg, "ignition.msgs.LaserScan"))
+
+    assert scan.frame == "lidar"
+    assert scan.angle_min == -1
+    assert scan.ranges.shape == (2, 5)
+    assert np.allclose(scan.ranges.ravel(), ranges)
+    assert np.allclose(scan.intensities.ravel(), ranges * 2)
+
+
+def test_parse_double_v():
+    msg = messages.Double_V(data=[1.0, 2.5, -3.0])
+
+    vector = ign.parsers.parse_double_v(as_zmq(msg, "ignition.msgs.Double_V"))
+
+    assert np.all(vector.data == [1.0, 2.5, -3.0])
+
+
+def test_parse_double_v_empty():
+    vector = ign.parsers.parse_double_v(
+        as_zmq(messages.Double_V(), "ignition.msgs.Double_V")
+    )
+
+    assert vector.data.shape == (0,)
+
+
+def test_parse_double_v_writable_buffer():
+    msg = messages.Double_V(data=[1.0, 2.5, -3.0])
+    frames = as_zmq(msg, "ignition.msgs.Double_V")
+    frames[2] = bytearray(frames[2])
+
+    vector = ign.parsers.parse_double_v(frames)
+
+    assert np.all(vector.data == [1.0, 2.5, -3.0])
+    assert not vector.data.flags.writeable
+
+
+@pytest.mark.parametrize("copy", [True, False])
+def test_array_parser_fallback(copy):
+    msg = messages.Clock(sim=messages.Time(sec=42))
+
+    result = ign.parsers.array_parser(as_zmq(msg, "ignition.msgs.Clock", copy))
+
+    assert result == msg
+
+
+def test_subscriber_zero_copy(discovery_client, fake_publisher):
+    fake_publisher.msg_type = "ignition.msgs.Double_V"
+    subscriber = ign.Subscriber(
+        "/clock",
+        discovery=discovery_client,
+        parser=ign.parsers.array_parser,
+        copy=False,
+    )
+
+    with subscriber:
+        while not fake_publisher.connections:
+            pass
+        fake_publisher.publish(messages.Double_V(data=[1.0, 2.0]))
+        msg = subscriber.recv(timeout=2000)
+
+    assert np.all(msg.data == [1.0, 2.0])
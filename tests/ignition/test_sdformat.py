@@ -1,10 +1,16 @@
 from dataclasses import dataclass
+import importlib
+import io
 import numpy as np
 import pytest
 from xsdata.exceptions import ParserError
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 from skbot.ignition.sdformat.bindings.v16.model import Model
+from skbot.ignition.sdformat import fast_parser
+from skbot.ignition.sdformat.exceptions import ParseError
+from skbot.ignition.sdformat.sdformat import xml_ctx
 import skbot.ignition as ign
 
 
@@ -70,6 +76,33 @@ def test_custom_constructor(valid_sdf_string):
         )
 
 
+def test_fast_parser(valid_sdf_string):
+    # the fast path must produce the same tree as xsData
+    expected = ign.sdformat.loads(
+        valid_sdf_string, handler="LxmlEventHandler", use_cache=False
+    )
+
+    try:
+        result = fast_parser.parse(valid_sdf_string, type(expected), xml_ctx)
+    except fast_parser.FastPathError:
+        pytest.skip("Document is handled by xsData.")
+
+    assert result == expected
+
+
+def test_fast_parser_fallback(invalid_sdf_string):
+    # documents the fast path rejects are still reported by xsData
+    try:
+        version = ign.sdformat.get_version(invalid_sdf_string)
+    except ParseError:
+        pytest.skip("Document is rejected before parsing.")
+
+    bindings = "skbot.ignition.sdformat.bindings.v" + version.replace(".", "")
+    root_class = importlib.import_module(bindings + ".sdf").Sdf
+    with pytest.raises(fast_parser.FastPathError):
+        fast_parser.parse(invalid_sdf_string, root_class, xml_ctx)
+
+
 def test_sax_handlers():
     sdf_file = Path(__file__).parent / "sdf" / "sdformat" / "empty.sdf"
 
@@ -92,7 +125,140 @@ def test_idempotence(valid_sdf_string):
     assert serialized_sdf == normalized_sdf
 
 
+def test_streaming(valid_sdf_string, tmp_path):
+    expected = ign.sdformat.loads(valid_sdf_string)
+
+    buffer = io.StringIO()
+    ign.sdformat.dump(expected, buffer, format=True)
+    assert buffer.getvalue() == ign.sdformat.dumps(expected, format=True)
+
+    sdf_file = tmp_path / "world.sdf"
+    with open(sdf_file, "wb") as file:
+        ign.sdformat.dump(expected, file)
+    assert sdf_file.read_text() == ign.sdformat.dumps(expected)
+
+    with open(sdf_file, "r") as file:
+        assert ign.sdformat.load(file) == expected
+
+    with open(sdf_file, "rb") as file:
+        assert ign.sdformat.load(file) == expected
+
+
 def test_force_version():
     sdf_file = Path(__file__).parent / "sdf" / "sdformat" / "empty.sdf"
 
     ign.sdformat.loads(sdf_file.read_text(), version="1.8")
+
+
+def test_parse_cache():
+    sdf_string = (
+        Path(__file__).parent / "sdf" / "v18" / "crooked_double_pendulum.sdf"
+    ).read_text()
+    ign.sdformat.cache.parse_cache.clear()
+
+    first = ign.sdformat.loads(sdf_string)
+    second = ign.sdformat.loads(sdf_string)
+
+    # a hit is an independent copy of the tree
+    assert first == second
+    assert first is not second
+    assert first.model is not second.model
+
+
+def test_parse_cache_key():
+    sdf_string = (Path(__file__).parent / "sdf" / "sdformat" / "empty.sdf").read_text()
+    cache = ign.sdformat.cache
+
+    assert cache.cache_key(sdf_string, "1.8") == cache.cache_key(sdf_string, "1.8")
+    assert cache.cache_key(sdf_string, "1.8") != cache.cache_key(sdf_string, "1.7")
+    assert cache.cache_key(sdf_string, "1.8") != cache.cache_key(
+        sdf_string + " ", "1.8"
+    )
+
+    # forcing a different version yields a different tree
+    v18 = ign.sdformat.loads(sdf_string, version="1.8")
+    v17 = ign.sdformat.loads(sdf_string, version="1.7")
+    assert type(v18) is not type(v17)
+
+
+def test_parse_cache_disabled():
+    sdf_string = (Path(__file__).parent / "sdf" / "sdformat" / "empty.sdf").read_text()
+    cache = ign.sdformat.cache
+    cache.parse_cache.clear()
+
+    ign.sdformat.loads(sdf_string, use_cache=False)
+    key = cache.cache_key(sdf_string, "specific", "1.8", "LxmlEventHandler")
+    assert cache.parse_cache.get(key) is None
+
+
+def test_parse_cache_threads():
+    # a small cache evicts constantly, which breaks unsynchronized lookups
+    cache = ign.sdformat.cache.ParseCache(maxsize=2)
+
+    def work(idx):
+        for step in range(1000):
+            key = str((idx + step) % 5)
+            blob = cache.get(key)
+            assert blob is None or blob == key.encode("utf-8")
+            cache.update(key, key.encode("utf-8"))
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(work, range(8)))
+
+
+def test_parse_cache_file(tmp_path):
+    sdf_string = (
+        Path(__file__).parent / "sdf" / "v18" / "crooked_double_pendulum.sdf"
+    ).read_text()
+    cache = ign.sdformat.cache
+    cache.parse_cache.clear()
+
+    expected = ign.sdformat.loads_generic(sdf_string, cache_dir=tmp_path)
+    assert len(list(tmp_path.glob("*.pickle"))) == 1
+
+    # the file cache survives a reset of the in-memory cache
+    cache.parse_cache.clear()
+    result = ign.sdformat.loads_generic(sdf_string, use_cache=False, cache_dir=tmp_path)
+    assert result is not expected
+    assert result.version == expected.version
+    assert [m.name for m in result.models] == [m.name for m in expected.models]
+
+
+def test_load_many(tmp_path):
+    sdf_folder = Path(__file__).parent / "sdf"
+    paths = [
+        sdf_folder / "v18" / "crooked_double_pendulum.sdf",
+        sdf_folder / "v18" / "pose_testing.sdf",
+        sdf_folder / "sdformat" / "empty.sdf",
+    ]
+
+    urdf_path = tmp_path / "robot.urdf"
+    urdf_path.write_text(
+        """<?xml version="1.0"?>
+        <robot name="robot_name">
+        <link name="link0"/>
+        <link name="link1"/>
+        <joint name="joint0" type="fixed">
+            <parent link="link0"/>
+            <child link="link1"/>
+        </joint>
+        </robot>
+        """
+    )
+
+    result = ign.sdformat.load_many(paths, output="specific", n_jobs=2)
+    expected = [ign.sdformat.loads(path.read_text()) for path in paths]
+    assert result == expected
+
+    graphs = ign.sdformat.load_many(
+        [str(x) for x in paths[:2]] + [urdf_path], output="frame_graph", n_jobs=2
+    )
+    assert graphs[0].name == "double_pendulum_with_base"
+    frames, links = graphs[2]
+    assert set(frames.keys()) == {"link0", "link1", "joint0"}
+
+    with pytest.raises(ValueError):
+        ign.sdformat.load_many([urdf_path], output="generic")
+
+    with pytest.raises(ValueError):
+        ign.sdformat.load_many(paths, output="not_an_output")
@@ -1,3 +1,4 @@
+import asyncio
 import skbot.ignition as ign
 import subprocess
 import time
@@ -58,3 +59,102 @@ def test_subscriber_address_error():
     with pytest.raises(IOError):
         with ign.Subscriber("/clock") as clock:
             msg = clock.recv()
+
+
+def test_subscriber_fake_publisher(discovery_client, fake_publisher):
+    with ign.Subscriber("/clock", discovery=discovery_client) as clock:
+        # the publisher only publishes after it learned about the subscriber
+        for _ in range(100):
+            if fake_publisher.connections:
+                break
+            time.sleep(0.01)
+        time.sleep(0.1)
+
+        fake_publisher.publish(ign.messages.Clock(sim=ign.messages.Time(sec=42)))
+        msg = clock.recv(timeout=2000)
+
+    assert msg.sim.sec == 42
+    topic, _, _, msg_type, connection = fake_publisher.connections[0]
+    assert topic == fake_publisher.topic
+    assert msg_type == "ignition.msgs.Clock"
+    assert int(connection) == ign.messages.DiscoveryType.NEW_CONNECTION
+
+
+def test_async_subscriber(discovery_client, fake_publisher):
+    # a second (fake) process publishing on another topic
+    other_publisher = type(fake_publisher)(
+        fake_publisher.partition,
+        fake_publisher.port,
+        "/stats",
+        msg_type="ignition.msgs.WorldStatistics",
+    )
+    other_publisher.start()
+
+    async def listen():
+        topics = ["/clock", "/stats"]
+        async with ign.AsyncSubscriber(topics, discovery=discovery_client) as sub:
+            while not (fake_publisher.connections and other_publisher.connections):
+                await asyncio.sleep(0.01)
+            await asyncio.sleep(0.1)
+
+            fake_publisher.publish(ign.messages.Clock(sim=ign.messages.Time(sec=42)))
+            other_publisher.publish(ign.messages.WorldStatistics(iterations=7))
+
+            received = dict()
+            async for topic, msg in sub:
+                received[topic] = msg
+                if len(received) == 2:
+                    break
+
+            with pytest.raises(IOError):
+                await sub.recv(timeout=0.1)
+
+        return received
+
+    try:
+        received = asyncio.run(asyncio.wait_for(listen(), 5))
+    finally:
+        other_publisher.stop()
+
+    assert received["/clock"].sim.sec == 42
+    assert received["/stats"].iterations == 7
+
+
+def test_conflating_subscriber(discovery_client, fake_publisher):
+    parsed = list()
+
+    def parser(msg):
+        result = ign.messages.Clock().parse(msg[2])
+        parsed.append(result)
+        return result
+
+    subscriber = ign.ConflatingSubscriber(
+        "/clock", discovery=discovery_client, parser=parser
+    )
+
+    with subscriber:
+        with pytest.raises(IOError):
+            subscriber.latest(timeout=0.05)
+
+        while not fake_publisher.connections:
+            time.sleep(0.01)
+        time.sleep(0.1)
+
+        for sec in range(5):
+            fake_publisher.publish(ign.messages.Clock(sim=ign.messages.Time(sec=sec)))
+            time.sleep(0.01)
+        time.sleep(0.1)
+
+        msg, timestamp = subscriber.latest(timeout=1)
+        assert msg.sim.sec == 4
+        assert timestamp <= time.monotonic()
+        assert subscriber.latest()[0] is msg
+        assert len(parsed) == 1
+        assert subscriber.dropped_count == subscriber.received_count - 1
+
+        with pytest.raises(IOError):
+            subscriber.recv(blocking=False)
+
+        fake_publisher.publish(ign.messages.Clock(sim=ign.messages.Time(sec=5)))
+        msg = subscriber.recv(timeout=1000)
+        assert msg.sim.sec == 5
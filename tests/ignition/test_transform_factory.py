@@ -8,6 +8,7 @@ import skbot.transform as tf
 from skbot.ignition.sdformat.generic_sdf.base import ElementBase, Pose
 from skbot.ignition.sdformat.generic_sdf.frame import Frame
 from skbot.ignition.sdformat.generic_sdf.joint import Joint
+from skbot.ignition.sdformat.generic_sdf.scope import LinkTree, ScopedFrames
 
 
 pytestmark = pytest.mark.filterwarnings(
@@ -86,6 +87,77 @@ def test_declared_frames():
         assert_matching_frames(generic_sdf.light.declared_frames())
 
 
+def test_scoped_frames():
+    model_file = Path(__file__).parent / "sdf" / "v18" / "world_with_state.sdf"
+    generic_sdf = ign.sdformat.loads_generic(model_file.read_text())
+    declared_frames = generic_sdf.worlds[0].declared_frames()
+
+    scopes = ScopedFrames(declared_frames)
+    assert dict(scopes) == declared_frames
+    assert len(scopes) == len(declared_frames)
+
+    world = {"world": declared_frames["world"]}
+    model_names = {name.split("::", 1)[0] for name in declared_frames if "::" in name}
+    for model_name in model_names:
+        expected = {
+            name.split("::", 1)[1]: frame
+            for name, frame in declared_frames.items()
+            if name.startswith(f"{model_name}::")
+        }
+        expected["world"] = declared_frames["world"]
+
+        scope = scopes.scope(model_name, overrides=world)
+        assert dict(scope) == expected
+        for name, frame in expected.items():
+            assert scope[name] is frame
+
+    empty = scopes.scope("does_not_exist", overrides=world)
+    assert dict(empty) == world
+    with pytest.raises(KeyError):
+        empty["link"]
+
+
+def test_link_tree(verifiable_sdf_string):
+    generic_sdf = ign.sdformat.loads_generic(verifiable_sdf_string)
+    if len(generic_sdf.worlds) == 0:
+        pytest.skip("Not a world.")
+
+    world = generic_sdf.worlds[0]
+    scaffolding = world.declared_frames()
+    world.to_static_graph(scaffolding, shape=(3,))
+
+    def assert_equivalent(actual, expected):
+        assert len(actual) == len(expected)
+        if len(expected) > 0:
+            expected = tf.CompundLink(expected).transform((1, 2, 3))
+            actual = tf.CompundLink(actual).transform((1, 2, 3))
+            assert np.allclose(actual, expected)
+
+    tree = LinkTree()
+    root = scaffolding["world"]
+    for frame in scaffolding.values():
+        assert_equivalent(tree.links_between(root, frame), root.links_between(frame))
+
+        try:
+            expected = frame.links_between(root)
+        except RuntimeError:
+            # one-way link, e.g., a camera's projection
+            with pytest.raises(RuntimeError):
+                tree.links_between(frame, root)
+        else:
+            assert_equivalent(tree.links_between(frame, root), expected)
+
+
+def test_link_tree_cycle():
+    a = tf.Frame(3, name="a")
+    b = tf.Translation((1, 0, 0))(a)
+    c = tf.Translation((0, 1, 0))(b)
+    tf.Translation((0, 0, 1))(c, a)
+
+    tree = LinkTree()
+    assert tree.links_between(a, c) == a.links_between(c)
+
+
 def test_static_graph(verifiable_sdf_string):
     generic_sdf = ign.sdformat.loads_generic(verifiable_sdf_string)
     static_frame_dict = generic_sdf.declared_frames()
@@ -175,6 +247,66 @@ def test_panda():
     root_frame = ign.sdformat.to_frame_graph(sdf_string)
 
 
+def test_fuse_static():
+    model_file = Path(__file__).parent / "sdf" / "robots" / "panda" / "model.sdf"
+    sdf_string = model_file.read_text()
+
+    root = ign.sdformat.to_frame_graph(sdf_string)
+    tool = root.find_frame(".../panda_link8")
+    joints = tool.joints_between(root)
+
+    fused_root = ign.sdformat.to_frame_graph(sdf_string, fuse_static=True)
+    fused_tool = fused_root.find_frame(".../panda_link8")
+    fused_joints = fused_tool.joints_between(fused_root)
+
+    assert len(fused_joints) == len(joints) == 7
+
+    def unwrap(links):
+        return [x._forward_link if isinstance(x, tf.InvertLink) else x for x in links]
+
+    links = unwrap(tool.links_between(root))
+    assert any(isinstance(x, tf.CompundLink) for x in links)
+    fused_links = unwrap(fused_tool.links_between(fused_root))
+    assert not any(isinstance(x, tf.CompundLink) for x in fused_links)
+
+    rng = np.random.default_rng(0)
+    for _ in range(5):
+        for joint, fused_joint in zip(joints, fused_joints):
+            value = rng.uniform(joint.lower_limit, joint.upper_limit)
+            joint.param = value
+            fused_joint.param = value
+
+        expected = tool.transform((0, 0, 0.1), root)
+        actual = fused_tool.transform((0, 0, 0.1), fused_root)
+        assert np.allclose(actual, expected)
+
+
+def test_kinematic_tree():
+    model_file = Path(__file__).parent / "sdf" / "robots" / "panda" / "model.sdf"
+    sdf_string = model_file.read_text()
+
+    root = ign.sdformat.to_frame_graph(sdf_string)
+    tree = ign.sdformat.to_frame_graph(sdf_string, as_kinematic_tree=True)
+    assert isinstance(tree, tf.KinematicTree)
+    assert tree.n_joints == 9
+
+    reference = tf.KinematicTree.from_frame_graph(root)
+    assert tree.names == reference.names
+    assert np.allclose(tree.transforms, reference.transforms)
+
+    tool = root.find_frame(".../panda_link8")
+    joints = tool.joints_between(root)
+    tree = tf.KinematicTree.from_frame_graph(root, joints=joints)
+
+    q = np.random.default_rng(0).uniform(tree.lower_limits, tree.upper_limits)
+    for joint, value in zip(joints, q):
+        joint.param = value
+
+    expected = tool.transform((0, 0, 0.1), root)
+    result = tree.forward_kinematics(q)[tree.index("panda_link8")] @ (0, 0, 0.1, 1)
+    assert np.allclose(result[:3], expected)
+
+
 def test_nd_panda():
     model_file = Path(__file__).parent / "sdf" / "robots" / "panda" / "model.sdf"
     sdf_string = model_file.read_text()
@@ -607,3 +739,76 @@ def test_insert_world():
 
     with pytest.raises(ValueError):
         ign.sdformat.to_frame_graph(sdf_string, insert_world_frame=False)
+
+
+def test_population():
+    model_file = Path(__file__).parent / "sdf" / "v18" / "population.sdf"
+    sdf_string = model_file.read_text()
+
+    world = ign.sdformat.to_frame_graph(sdf_string, seed=42)
+    grid = world.find_frame(".../population2")
+
+    # 2 rows x 7 cols with the default step, offset by the population's pose
+    positions = grid.transform((0, 0, 0), world)
+    assert positions.shape == (14, 3)
+    assert np.allclose(positions[:7, 0], 3 + 0.5 * np.arange(7))
+    assert np.allclose(positions[7:, 1], 3.5)
+    assert np.allclose(positions[..., 2], 3)
+
+    fused = ign.sdformat.to_frame_graph(sdf_string, seed=42, fuse_static=True)
+    for name in ["population", "population2"]:
+        expected = world.find_frame(f".../{name}").transform((1, 2, 3), world)
+        frame = fused.find_frame(f".../{name}")
+        assert np.allclose(frame.transform((1, 2, 3), fused), expected)
+
+
+@pytest.mark.parametrize(
+    "kind", ["random", "uniform", "linear-x", "linear-y", "linear-z"]
+)
+@pytest.mark.parametrize(
+    "region",
+    [
+        "<box><size>4 2 1</size></box>",
+        "<cylinder><radius>2</radius><length>1</length></cylinder>",
+    ],
+)
+def test_population_distribution(kind, region):
+    sdf_string = f"""
+    <sdf version="1.8">
+        <world name="world">
+            <population name="population">
+                <pose>1 2 3 0 0 0</pose>
+                <model_count>50</model_count>
+                <distribution><type>{kind}</type></distribution>
+                {region}
+                <model name="model">
+                    <link name="A">
+                        <must_be_base_link>true</must_be_base_link>
+                    </link>
+                </model>
+            </population>
+        </world>
+    </sdf>
+    """
+
+    world = ign.sdformat.to_frame_graph(sdf_string, seed=42)
+    positions = world.find_frame(".../population").transform((0, 0, 0), world)
+    positions = positions - (1, 2, 3)
+
+    assert positions.shape == (50, 3)
+    assert np.all(np.abs(positions[:, 2]) <= 0.5)
+    if "box" in region:
+        assert np.all(np.abs(positions[:, 0]) <= 2)
+        assert np.all(np.abs(positions[:, 1]) <= 1)
+    else:
+        assert np.all(np.linalg.norm(positions[:, :2], axis=-1) <= 2 + 1e-10)
+
+    if kind.startswith("linear"):
+        idx = "xyz".index(kind[-1])
+        assert np.all(np.diff(positions[:, idx]) > 0)
+        assert np.allclose(np.delete(positions, idx, axis=-1), 0)
+
+    # the same seed yields the same world
+    other = ign.sdformat.to_frame_graph(sdf_string, seed=42)
+    other_positions = other.find_frame(".../population").transform((0, 0, 0), other)
+    assert np.allclose(other_positions - (1, 2, 3), positions)
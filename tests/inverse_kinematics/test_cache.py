@@ -0,0 +1,144 @@
+from typing import List
+import pytest
+import skbot.inverse_kinematics as ik
+import skbot.transform as tf
+import numpy as np
+
+
+def _store(cache, world, joints, goal, values):
+    tool = world.find_frame(".../tool")
+    for joint, value in zip(joints, values):
+        joint.param = value
+    cache.add([ik.PositionTarget((0, 0, 0), goal, tool, world)], joints)
+
+
+def test_lookup(circle_bot):
+    world, joints = circle_bot
+    tool = world.find_frame(".../tool")
+    cache = ik.SolutionCache()
+
+    assert cache.lookup([ik.PositionTarget((0, 0, 0), (1, 0, 0), tool, world)]) is None
+
+    _store(cache, world, joints, (1, 0, 0), (0, 1))
+    _store(cache, world, joints, (0, 1, 0), (1, 1))
+    _store(cache, world, joints, (0, 5, 0), (2, 5))
+
+    targets = [ik.PositionTarget((0, 0, 0), (0, 1.5, 0), tool, world)]
+    assert np.allclose(cache.lookup(targets), (1, 1))
+    assert len(cache) == 3
+
+
+def test_lookup_tree(circle_bot):
+    world, joints = circle_bot
+    tool = world.find_frame(".../tool")
+    cache = ik.SolutionCache(maxsize=100)
+
+    # enough solutions to build the tree and evict some of them
+    rng = np.random.default_rng(0)
+    goals = rng.uniform(-5, 5, (150, 3))
+    for idx, goal in enumerate(goals):
+        _store(cache, world, joints, goal, (idx, idx))
+
+    assert len(cache) == 100
+    stored = goals[50:]
+
+    for query in rng.uniform(-5, 5, (20, 3)):
+        expected = 50 + np.argmin(np.linalg.norm(stored - query, axis=-1))
+        targets = [ik.PositionTarget((0, 0, 0), query, tool, world)]
+        assert np.allclose(cache.lookup(targets), (expected, expected))
+
+
+def test_lru_eviction(circle_bot):
+    world, joints = circle_bot
+    tool = world.find_frame(".../tool")
+    cache = ik.SolutionCache(maxsize=2)
+
+    _store(cache, world, joints, (1, 0, 0), (0, 1))
+    _store(cache, world, joints, (0, 1, 0), (1, 1))
+
+    # using the first solution makes the second one the least recent
+    cache.lookup([ik.PositionTarget((0, 0, 0), (1, 0, 0), tool, world)])
+    _store(cache, world, joints, (0, 5, 0), (2, 5))
+
+    targets = [ik.PositionTarget((0, 0, 0), (0, 1, 0), tool, world)]
+    assert np.allclose(cache.lookup(targets), (0, 1))
+    assert len(cache) == 2
+
+
+def test_wrong_joints(circle_bot):
+    world, joints = circle_bot
+    tool = world.find_frame(".../tool")
+    cache = ik.SolutionCache()
+
+    _store(cache, world, joints, (1, 0, 0), (0, 1))
+
+    targets = [ik.PositionTarget((0, 0, 0), (0, 1, 0), tool, world)]
+    with pytest.raises(ValueError):
+        cache.add(targets, joints[:1])
+
+    targets.append(ik.RotationTarget(tf.EulerRotation("Z", 90), tool, world))
+    with pytest.raises(ValueError):
+        cache.lookup(targets)
+
+
+def test_clear(circle_bot):
+    world, joints = circle_bot
+    tool = world.find_frame(".../tool")
+    cache = ik.SolutionCache(maxsize=2)
+
+    _store(cache, world, joints, (1, 0, 0), (0, 1))
+    _store(cache, world, joints, (0, 1, 0), (1, 1))
+    cache.lookup([ik.PositionTarget((0, 0, 0), (1, 0, 0), tool, world)])
+    cache.clear()
+    assert len(cache) == 0
+
+    # a cleared cache accepts a different problem
+    targets = [
+        ik.PositionTarget((0, 0, 0), (0, 1, 0), tool, world),
+        ik.RotationTarget(tf.EulerRotation("Z", 90), tool, world),
+    ]
+    joints[0].param = 2
+    cache.add(targets, joints[:1])
+    assert np.allclose(cache.lookup(targets), (2,))
+
+    # and evicts based on its new usage only
+    targets[0].dynamic_position = np.array((0, 5, 0))
+    joints[0].param = 3
+    cache.add(targets, joints[:1])
+    targets[0].dynamic_position = np.array((5, 0, 0))
+    joints[0].param = 4
+    cache.add(targets, joints[:1])
+
+    targets[0].dynamic_position = np.array((0, 1, 0))
+    assert np.allclose(cache.lookup(targets), (3,))
+    assert len(cache) == 2
+
+
+@pytest.mark.parametrize("solver", [ik.ccd, ik.gd, ik.dls])
+def test_seed(panda, solver):
+    base_frame: tf.Frame
+    joints: List[tf.Joint]
+    base_frame, joints = panda
+    tool_frame = base_frame.find_frame(".../panda_link8")
+
+    root_pos = tool_frame.transform((0, 0, 0), base_frame)
+    initial = [x.param + 0.2 for x in joints]
+    cache = ik.SolutionCache()
+
+    for joint, value in zip(joints, initial):
+        joint.param = value
+    targets = [ik.PositionTarget((0, 0, 0), root_pos, tool_frame, base_frame)]
+    solution = solver(targets, joints, cache=cache)
+    assert len(cache) == 1
+
+    # a nearby query starts at the cached solution
+    for joint, value in zip(joints, initial):
+        joint.param = value
+    targets = [ik.PositionTarget((0, 0, 0), root_pos + 1e-4, tool_frame, base_frame)]
+    assert cache.seed(targets, joints)
+    assert np.allclose([x.param for x in joints], solution)
+
+    solver(targets, joints, cache=cache)
+    final_pos = tool_frame.transform((0, 0, 0), base_frame)
+    assert np.allclose(final_pos, root_pos + 1e-4, atol=0.001)
+    assert len(cache) == 2
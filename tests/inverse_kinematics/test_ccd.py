@@ -201,9 +201,20 @@ def test_ccd_linesearch_maxiter(panda):
         expected[idx] = joint.param
         joint.param = (joint.upper_limit + joint.lower_limit) / 2
 
+    class CustomTarget(ik.Target):
+        # a target without fast-path; CCD has to do a line search
+        def __init__(self, wrapped: ik.Target) -> None:
+            super().__init__(wrapped.static_frame, wrapped.dynamic_frame)
+            self.wrapped = wrapped
+
+        def score(self):
+            return self.wrapped.score()
+
     targets = [
-        ik.RotationTarget(
-            tf.EulerRotation("Y", 90, degrees=True), tool_frame, base_frame
+        CustomTarget(
+            ik.RotationTarget(
+                tf.EulerRotation("Y", 90, degrees=True), tool_frame, base_frame
+            )
         )
     ]
 
@@ -211,6 +222,99 @@ def test_ccd_linesearch_maxiter(panda):
         ik.ccd(targets, joints, line_search_maxiter=1)
 
 
+def _gantry(inverted: bool = False):
+    # three prismatic axes followed by a three-axis wrist
+    frames = [tf.Frame(3, name=f"frame_{idx}") for idx in range(7)]
+    joints = [
+        tf.PrismaticJoint((1, 0, 0), lower_limit=-2, upper_limit=2),
+        tf.PrismaticJoint((0, 1, 0), lower_limit=-2, upper_limit=2),
+        tf.PrismaticJoint((0, 0, 1), lower_limit=-2, upper_limit=2),
+        tf.RotationalJoint((0, 0, 1), angle=0),
+        tf.RotationalJoint((0, 1, 0), angle=0),
+        tf.RotationalJoint((1, 0, 0), angle=0),
+    ]
+
+    for idx, joint in enumerate(joints):
+        link = tf.CompundLink([joint, tf.Translation((0.1, 0, 0.2))])
+        if inverted:
+            link(frames[idx + 1], frames[idx])
+        else:
+            link(frames[idx], frames[idx + 1])
+
+    if inverted:
+        return frames[-1], frames[0], joints
+    else:
+        return frames[0], frames[-1], joints
+
+
+@pytest.mark.parametrize("inverted", [False, True])
+def test_gantry_position(inverted):
+    tool_frame, base_frame, joints = _gantry(inverted)
+
+    for joint, value in zip(joints, [0.5, -0.3, 0.7, 0.4, -0.6, 1.0]):
+        joint.param = value
+    root_pos = tool_frame.transform((0.1, 0.2, 0.3), base_frame)
+
+    for joint in joints:
+        joint.param = 0
+
+    targets = [
+        ik.PositionTarget((0.1, 0.2, 0.3), root_pos, tool_frame, base_frame, atol=1e-6)
+    ]
+    ik.ccd(targets, joints[:3])
+
+    final_pos = tool_frame.transform((0.1, 0.2, 0.3), base_frame)
+    assert np.allclose(final_pos, root_pos, atol=1e-6)
+
+
+def test_gantry_position_limits():
+    tool_frame, base_frame, joints = _gantry()
+
+    targets = [ik.PositionTarget((0, 0, 0), (3, 0, 1.2), tool_frame, base_frame)]
+    with pytest.raises(RuntimeError):
+        ik.ccd(targets, joints[:3])
+
+    assert np.allclose([x.param for x in joints[:3]], (2, 0, 0))
+
+
+@pytest.mark.parametrize("inverted", [False, True])
+def test_gantry_orientation(inverted):
+    tool_frame, base_frame, joints = _gantry(inverted)
+
+    for joint, value in zip(joints, [0.5, -0.3, 0.7, 0.4, -0.6, 1.0]):
+        joint.param = value
+    desired = tf.AffineMatrix.from_links(tool_frame.links_between(base_frame))
+
+    for joint in joints:
+        joint.param = 0
+
+    targets = [ik.RotationTarget(desired, tool_frame, base_frame, atol=1e-5)]
+    ik.ccd(targets, joints[3:])
+
+    final = tf.AffineMatrix.from_links(tool_frame.links_between(base_frame))
+    assert np.allclose(
+        final.affine_matrix[:3, :3], desired.affine_matrix[:3, :3], atol=1e-4
+    )
+
+
+def test_orientation_2d():
+    base_frame = tf.Frame(2)
+    upper_frame = tf.Frame(2)
+    tool_frame = tf.Frame(2)
+
+    upper_joint = tf.AngleJoint(angle=0)
+    lower_joint = tf.AngleJoint(angle=0, lower_limit=-np.pi / 4, upper_limit=np.pi / 4)
+    tf.CompundLink([tf.Translation((1, 0)), upper_joint])(base_frame, upper_frame)
+    tf.CompundLink([tf.Translation((1, 0)), lower_joint])(upper_frame, tool_frame)
+
+    targets = [ik.RotationTarget(tf.Rotation((1, 0), (0, 1)), tool_frame, base_frame)]
+    ik.ccd(targets, [lower_joint, upper_joint])
+
+    # the lower joint can't reach the target alone and stops at its limit
+    assert np.allclose(lower_joint.param, -np.pi / 4)
+    assert targets[0].score() < targets[0].atol
+
+
 # # Multi-Frame (pos+rot) doesn't work with CCD (yet?)
 # def test_multi_frame_ccd(panda):
 #     base_frame: tf.Frame
@@ -0,0 +1,247 @@
+from typing import List, Union
+import pytest
+import skbot.inverse_kinematics as ik
+import skbot.transform as tf
+import numpy as np
+
+
+joint_types = Union[tf.RotationalJoint, tf.PrismaticJoint]
+
+
+def test_panda(panda):
+    base_frame: tf.Frame
+    joints: List[joint_types]
+    base_frame, joints = panda
+    tool_frame = base_frame.find_frame(".../panda_link8")
+
+    root_pos = tool_frame.transform((0, 0, 0), base_frame)
+
+    for joint in joints:
+        joint.param = joint.param + 0.2
+
+    targets = [ik.PositionTarget((0, 0, 0), root_pos, tool_frame, base_frame)]
+    attributes = set(vars(targets[0]))
+    values = ik.dls(targets, joints)
+    final_pos = tool_frame.transform((0, 0, 0), base_frame)
+
+    assert np.allclose(final_pos, root_pos, atol=0.001)
+    assert isinstance(values, list)
+    assert np.allclose(values, [x.param for x in joints])
+    assert set(vars(targets[0])) == attributes
+
+
+def test_panda_orientation(panda):
+    base_frame: tf.Frame
+    joints: List[joint_types]
+    base_frame, joints = panda
+    tool_frame = base_frame.find_frame(".../panda_link8")
+
+    for joint in joints:
+        joint.param = joint.param + 0.2
+
+    targets = [
+        ik.RotationTarget(
+            tf.EulerRotation("Y", 90, degrees=True), tool_frame, base_frame
+        )
+    ]
+    ik.dls(targets, joints)
+
+    tool_origin = tool_frame.transform((0, 0, 0), base_frame)
+    tool_facing = tool_frame.transform((1, 0, 0), base_frame)
+    final_ori = tool_facing - tool_origin
+
+    assert np.allclose(final_ori, (0, 0, -1), atol=0.001)
+
+
+def test_multi_frame(panda):
+    base_frame: tf.Frame
+    joints: List[joint_types]
+    base_frame, joints = panda
+    tool_frame = base_frame.find_frame(".../panda_link8")
+
+    root_pos = tool_frame.transform((0, 0, 0), base_frame)
+
+    for joint in joints:
+        joint.param += 0.2
+
+    targets = [
+        ik.PositionTarget((0, 0, 0), root_pos, tool_frame, base_frame),
+        ik.RotationTarget(
+            tf.EulerRotation("X", 180, degrees=True), tool_frame, base_frame
+        ),
+    ]
+
+    # joints are found automatically
+    ik.dls(targets)
+
+    tool_origin = tool_frame.transform((0, 0, 0), base_frame)
+    tool_facing = tool_frame.transform((0, 0, 1), base_frame)
+    final_ori = tool_facing - tool_origin
+    assert np.allclose(final_ori, (0, 0, -1), atol=0.001)
+
+    final_pos = tool_frame.transform((0, 0, 0), base_frame)
+    assert np.allclose(final_pos, root_pos, atol=0.001)
+
+
+def test_warm_start(panda):
+    base_frame: tf.Frame
+    joints: List[joint_types]
+    base_frame, joints = panda
+    tool_frame = base_frame.find_frame(".../panda_link8")
+
+    root_pos = tool_frame.transform((0, 0, 0), base_frame)
+    targets = [ik.PositionTarget((0, 0, 0), root_pos, tool_frame, base_frame)]
+
+    # follow a path; the target (and its cache) is reused
+    for offset in np.linspace(0, 0.1, 5):
+        targets[0].dynamic_position = root_pos + (0, offset, 0)
+        ik.dls(targets, joints, maxiter=5)
+
+        final_pos = tool_frame.transform((0, 0, 0), base_frame)
+        assert np.allclose(final_pos, targets[0].dynamic_position, atol=0.001)
+
+
+def test_pendulum(double_pendulum):
+    base_frame: tf.Frame
+    joints: List[joint_types]
+    base_frame, joints = double_pendulum
+    tool_frame = base_frame.find_frame(".../lower_link")
+
+    for joint in joints:
+        joint.param = (joint.upper_limit - joint.lower_limit) / 4
+
+    root_pos = tool_frame.transform((0, 0, 0), base_frame)
+
+    for joint in joints:
+        joint.param = (joint.upper_limit - joint.lower_limit) / 2
+
+    targets = [ik.PositionTarget((0, 0, 0), root_pos, tool_frame, base_frame)]
+    ik.dls(targets, joints)
+    final_pos = tool_frame.transform((0, 0, 0), base_frame)
+
+    assert np.allclose(final_pos, root_pos, atol=0.001)
+
+
+def test_circle_bot(circle_bot):
+    world, joints = circle_bot
+    tool = world.find_frame(".../tool")
+
+    # the initial pose must not be singular
+    joints[1].param = 1
+
+    targets = [ik.PositionTarget((0, 0, 0), (0, -3, 0), tool, world)]
+    ik.dls(targets, joints)
+
+    assert np.allclose(tool.transform((0, 0, 0), world), (0, -3, 0), atol=0.001)
+
+
+def test_joint_limits(circle_bot):
+    world, joints = circle_bot
+    tool = world.find_frame(".../tool")
+
+    # out of reach
+    targets = [ik.PositionTarget((0, 0, 0), (20, 0, 0), tool, world)]
+    with pytest.raises(RuntimeError):
+        ik.dls(targets, joints)
+
+    assert joints[1].lower_limit <= joints[1].param <= joints[1].upper_limit
+
+
+def test_nullspace(panda):
+    base_frame: tf.Frame
+    joints: List[joint_types]
+    base_frame, joints = panda
+    tool_frame = base_frame.find_frame(".../panda_link8")
+
+    root_pos = tool_frame.transform((0, 0, 0), base_frame)
+    center = np.array([(x.lower_limit + x.upper_limit) / 2 for x in joints])
+
+    for joint in joints:
+        joint.param += 0.2
+    initial = np.array([x.param for x in joints])
+
+    targets = [
+        ik.PositionTarget((0, 0, 0), root_pos, tool_frame, base_frame, atol=1e-4)
+    ]
+    values = ik.dls(targets, joints, nullspace_gain=0.1, maxiter=50)
+    final_pos = tool_frame.transform((0, 0, 0), base_frame)
+
+    assert np.allclose(final_pos, root_pos, atol=1e-4)
+    assert np.linalg.norm(values - center) < np.linalg.norm(initial - center)
+
+
+def test_custom_target(double_pendulum):
+    base_frame: tf.Frame
+    joints: List[joint_types]
+    base_frame, joints = double_pendulum
+    tool_frame = base_frame.find_frame(".../lower_link")
+
+    root_pos = tool_frame.transform((0, 0, 0), base_frame)
+    for joint in joints:
+        joint.param += 0.3
+
+    class CustomTarget(ik.Target):
+        # uses finite differences
+        def __init__(self, wrapped: ik.Target) -> None:
+            super().__init__(wrapped.static_frame, wrapped.dynamic_frame)
+            self.wrapped = wrapped
+
+        def score(self):
+            return self.wrapped.score()
+
+    targets = [
+        CustomTarget(ik.PositionTarget((0, 0, 0), root_pos, tool_frame, base_frame))
+    ]
+    ik.dls(targets, joints)
+    final_pos = tool_frame.transform((0, 0, 0), base_frame)
+
+    assert np.allclose(final_pos, root_pos, atol=0.001)
+
+
+def test_jacobian(panda):
+    base_frame: tf.Frame
+    joints: List[joint_types]
+    base_frame, joints = panda
+    tool_frame = base_frame.find_frame(".../panda_link8")
+
+    from skbot.inverse_kinematics.damped_least_squares import (
+        _target_terms,
+        _finite_differences,
+    )
+
+    values = np.array([x.param for x in joints]) + 0.1
+    for joint, value in zip(joints, values):
+        joint.param = value
+
+    # the (geometric) rotation Jacobian matches the derivative of the
+    # residual if the rotation error is zero
+    current = tf.AffineMatrix.from_links(tool_frame.links_between(base_frame))
+    targets = [
+        ik.PositionTarget((0.1, 0, 0), (0.3, 0.2, 0.4), tool_frame, base_frame),
+        ik.RotationTarget(current, tool_frame, base_frame),
+    ]
+
+    for target in targets:
+        residual, jacobian, score = _target_terms(target, joints)(values)
+        expected = _finite_differences(target, joints)(values)
+
+        assert np.allclose(residual, expected[0], atol=1e-7)
+        assert np.allclose(jacobian, expected[1], atol=1e-5)
+        assert np.allclose(score, expected[2])
+
+
+def test_maxiter(double_pendulum):
+    base_frame: tf.Frame
+    joints: List[joint_types]
+    base_frame, joints = double_pendulum
+    tool_frame = base_frame.find_frame(".../lower_link")
+
+    root_pos = tool_frame.transform((0, 0, 0), base_frame)
+
+    for joint in joints:
+        joint.param = (joint.upper_limit - joint.lower_limit) / 2
+
+    targets = [ik.PositionTarget((0, 0, 0), root_pos, tool_frame, base_frame)]
+
+    with pytest.raises(RuntimeError):
+        ik.dls(targets, joints, maxiter=0)
@@ -0,0 +1,82 @@
+import pytest
+import skbot.inverse_kinematics as ik
+import skbot.transform as tf
+import numpy as np
+
+
+def test_circle_bot(circle_bot):
+    world, joints = circle_bot
+    tool = world.find_frame(".../tool")
+
+    reach_map = ik.ReachabilityMap.from_frame_graph(
+        world, tool, resolution=0.5, n_samples=20_000, batch_size=3_000, seed=0
+    )
+
+    # the tool moves in the xy-plane and its z-axis always points up
+    assert reach_map.reachable((3, 4, 0))
+    assert reach_map.reachable((-9, 0.1, 0))
+    assert reach_map.reachable((3, 4, 0), direction=(0, 0, 1))
+    assert not reach_map.reachable((3, 4, 0), direction=(0, 0, -1))
+    assert not reach_map.reachable((3, 4, 2))
+    assert not reach_map.reachable((30, 0, 0))
+
+    batch = reach_map.reachable([[0, 5, 0], [0, 5, 5], [100, 100, 100]])
+    assert np.all(batch == [True, False, False])
+
+    assert reach_map.quality((3, 4, 0)) == 1 / 54
+    assert reach_map.quality((3, 4, 2)) == 0
+
+
+def test_panda(panda):
+    base_frame, joints = panda
+    tool_frame = base_frame.find_frame(".../panda_link8")
+
+    reach_map = ik.ReachabilityMap.from_frame_graph(
+        base_frame, tool_frame, joints, resolution=0.1, n_samples=20_000, seed=0
+    )
+
+    # positions of random configurations are (almost surely) in the map
+    rng = np.random.default_rng(1)
+    hits = 0
+    for _ in range(20):
+        for joint in joints:
+            joint.param = rng.uniform(joint.lower_limit, joint.upper_limit)
+
+        position = tool_frame.transform((0, 0, 0), base_frame)
+        hits += reach_map.reachable(position)
+
+    assert hits >= 18
+    assert not reach_map.reachable((0, 0, 3))
+
+
+def test_save_load(circle_bot, tmp_path):
+    world, joints = circle_bot
+    tool = world.find_frame(".../tool")
+
+    reach_map = ik.ReachabilityMap.from_frame_graph(
+        world, tool, resolution=0.5, n_samples=5_000, seed=0
+    )
+    reach_map.save(tmp_path / "circle_bot")
+
+    for mmap in [True, False]:
+        loaded = ik.ReachabilityMap.load(tmp_path / "circle_bot", mmap=mmap)
+        assert np.all(loaded.directions == reach_map.directions)
+        assert np.allclose(loaded.origin, reach_map.origin)
+        assert loaded.resolution == reach_map.resolution
+        assert loaded.reachable((0, 5, 0)) == reach_map.reachable((0, 5, 0))
+
+
+def test_unbounded_prismatic():
+    world = tf.Frame(3, name="world")
+    tool = tf.Frame(3, name="tool")
+    tf.PrismaticJoint((1, 0, 0), upper_limit=np.inf)(world, tool)
+
+    with pytest.raises(ValueError):
+        ik.ReachabilityMap.from_frame_graph(world, tool, n_samples=10)
+
+
+def test_unknown_tool(circle_bot):
+    world, _ = circle_bot
+
+    with pytest.raises(ValueError):
+        ik.ReachabilityMap.from_frame_graph(world, tf.Frame(3, name="foo"), [])
@@ -0,0 +1,101 @@
+import pytest
+import skbot.inverse_kinematics as ik
+import numpy as np
+
+
+solvers = pytest.mark.parametrize("solver", [ik.ccd, ik.gd, ik.dls])
+
+
+def _panda_problem(panda):
+    base_frame, joints = panda
+    tool_frame = base_frame.find_frame(".../panda_link8")
+
+    root_pos = tool_frame.transform((0, 0, 0), base_frame)
+    for joint in joints:
+        joint.param += 0.2
+
+    targets = [ik.PositionTarget((0, 0, 0), root_pos, tool_frame, base_frame)]
+    return targets, joints
+
+
+@solvers
+def test_return_result(panda, solver):
+    targets, joints = _panda_problem(panda)
+
+    result = solver(targets, joints, return_result=True)
+
+    assert isinstance(result, ik.IKResult)
+    assert result.success
+    assert result.message == ""
+    assert np.allclose(result.joint_values, [x.param for x in joints])
+    assert np.allclose(result.scores, [x.score() for x in targets])
+    assert np.all(result.scores <= [x.atol for x in targets])
+
+
+@solvers
+def test_time_budget(panda, solver):
+    targets, joints = _panda_problem(panda)
+    initial_score = targets[0].score()
+
+    with pytest.raises(RuntimeError, match="Time budget"):
+        solver(targets, joints, time_budget=0)
+
+    # the joints are left at the best values found so far
+    assert targets[0].score() <= initial_score
+
+    result = solver(targets, joints, time_budget=0, return_result=True)
+    assert not result.success
+    assert "Time budget" in result.message
+    assert result.scores[0] <= initial_score
+    assert np.allclose(result.joint_values, [x.param for x in joints])
+
+
+@solvers
+def test_callback(panda, solver):
+    targets, joints = _panda_problem(panda)
+    initial_score = targets[0].score()
+    progress = list()
+
+    def callback(result: ik.IKResult) -> bool:
+        progress.append(result)
+        return len(progress) == 2
+
+    result = solver(targets, joints, callback=callback, return_result=True)
+
+    assert len(progress) == 2
+    assert [x.iterations for x in progress] == [1, 2]
+    assert progress[1].scores[0] <= progress[0].scores[0] <= initial_score
+    assert not result.success
+    assert "callback" in result.message
+    assert result.iterations == 2
+
+
+def test_callback_not_called(panda):
+    targets, joints = _panda_problem(panda)
+    for joint in joints:
+        joint.param -= 0.2
+
+    # no iteration is needed
+    result = ik.ccd(targets, joints, callback=pytest.fail, return_result=True)
+    assert result.success
+    assert result.iterations == 0
+
+
+@solvers
+def test_iterations(double_pendulum, solver):
+    base_frame, joints = double_pendulum
+    tool_frame = base_frame.find_frame(".../lower_link")
+
+    for joint in joints:
+        joint.param = (joint.upper_limit - joint.lower_limit) / 4
+    root_pos = tool_frame.transform((0, 0, 0), base_frame)
+    for joint in joints:
+        joint.param = (joint.upper_limit - joint.lower_limit) / 2
+
+    # the iteration that reaches the targets counts, too
+    progress = list()
+    targets = [ik.PositionTarget((0, 0, 0), root_pos, tool_frame, base_frame)]
+    result = solver(targets, joints, callback=progress.append, return_result=True)
+
+    assert result.success
+    assert result.iterations == len(progress) > 0
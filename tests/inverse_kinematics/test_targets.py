@@ -78,3 +78,109 @@ def test_2d_rotation_target():
     )
 
     assert np.isclose(target.score(), np.pi / 2)
+
+
+def test_rotation_target_cache(panda):
+    world: tf.Frame
+    joints: List[tf.Link]
+
+    world, joints = panda
+    tool = world.find_frame(".../panda_link8")
+    desired = tf.RotvecRotation((1, 0, 0), angle=np.pi / 2)
+
+    def reference_score():
+        basis = np.eye(3)
+        desired_basis = desired.transform(basis)
+        actual_basis = basis
+        for link in tf.simplify_links(tool.links_between(world)):
+            if not isinstance(link, tf.Translation):
+                actual_basis = link.transform(actual_basis)
+        trace = np.trace(desired_basis @ actual_basis.T)
+        return np.arccos(np.clip((trace - 1) / 2, -1, 1))
+
+    target = ik.RotationTarget(desired, tool, world)
+    assert np.isclose(target.score(), reference_score())
+
+    # joints are evaluated on every call
+    for joint in joints:
+        joint.param = 0.3
+    assert np.isclose(target.score(), reference_score())
+
+    # replacing the chain invalidates the cache
+    target._chain = tf.simplify_links(target._chain, keep_links=joints)
+    joints[0].param = -0.5
+    assert np.isclose(target.score(), reference_score())
+
+
+def test_position_target_incremental(panda):
+    world: tf.Frame
+    joints: List[tf.Link]
+
+    world, joints = panda
+    tool = world.find_frame(".../panda_link8")
+    target = ik.PositionTarget((0.1, 0, 0), (0.3, 0.2, 0.5), tool, world)
+
+    def reference_score():
+        position = target.static_position
+        for link in tool.links_between(world):
+            position = link.transform(position)
+        return np.linalg.norm(target.dynamic_position - position)
+
+    rng = np.random.default_rng(0)
+    for step in range(50):
+        for idx in rng.choice(len(joints), size=rng.integers(1, 4)):
+            joints[idx].param = rng.uniform(-1, 1)
+        assert np.isclose(target.score(), reference_score())
+
+        if step == 20:
+            target._chain = tf.simplify_links(target._chain, keep_links=joints)
+        elif step == 30:
+            target.static_position = np.array((0, 0.1, 0.2))
+
+    # intermediate positions in the frame of each link
+    for idx in range(len(target._chain) + 1):
+        static_position = target.static_position
+        for link in target._chain[:idx]:
+            static_position = link.transform(static_position)
+        assert np.allclose(target._static_position_at(idx), static_position)
+
+        dynamic_position = target.dynamic_position
+        for link in reversed(target._chain[idx:]):
+            dynamic_position = link.__inverse_transform__(dynamic_position)
+        assert np.allclose(target._dynamic_position_at(idx), dynamic_position)
+
+
+def test_position_target_inplace_param():
+    frameA = tf.Frame(1, name="root")
+    joint = tf.PrismaticJoint((1,), upper_limit=10, lower_limit=-10)
+    frameB = joint(frameA)
+    target = ik.PositionTarget((0,), (-2,), frameB, frameA)
+
+    param = np.array(0.0)
+    joint.param = param
+    assert target.score() == 2
+
+    # reassigning a modified array is a change, too
+    param += 2
+    joint.param = param
+    assert target.score() == 0
+
+
+def test_position_target_inplace_static_position(panda):
+    world: tf.Frame
+    joints: List[tf.Link]
+
+    world, joints = panda
+    tool = world.find_frame(".../panda_link8")
+    target = ik.PositionTarget(np.zeros(3), (0.3, 0.2, 0.5), tool, world)
+    target.score()
+
+    rng = np.random.default_rng(0)
+    for _ in range(10):
+        target.static_position[:] = rng.uniform(-0.1, 0.1, 3)
+        joints[rng.integers(len(joints))].param = rng.uniform(-1, 1)
+
+        expected = ik.PositionTarget(
+            target.static_position.copy(), target.dynamic_position, tool, world
+        )
+        assert np.isclose(target.score(), expected.score())
@@ -117,3 +117,75 @@ def test_unkown_joint():
 
     with pytest.raises(ValueError):
         frames, links = pyros.create_frame_graph(urdf)
+
+
+def test_kinematic_tree():
+    urdf = """<?xml version="1.0"?>
+        <robot name="robot_name">
+        <link name="base"/>
+        <link name="link1"/>
+        <link name="link2"/>
+        <link name="tool"/>
+        <joint name="joint0" type="revolute">
+            <origin xyz="0 0 1" rpy="0 0 0.5"/>
+            <parent link="base"/>
+            <child link="link1"/>
+            <axis xyz="0 0 1"/>
+            <limit lower="-1" upper="1"/>
+        </joint>
+        <joint name="joint1" type="prismatic">
+            <origin xyz="1 0 0"/>
+            <parent link="link1"/>
+            <child link="link2"/>
+            <axis xyz="1 0 0"/>
+            <limit lower="0" upper="0.5"/>
+        </joint>
+        <joint name="joint2" type="fixed">
+            <origin xyz="0 0 0.1" rpy="0.3 0 0"/>
+            <parent link="link2"/>
+            <child link="tool"/>
+        </joint>
+        </robot>
+        """
+    frames, links = pyros.create_frame_graph(urdf)
+    tree = pyros.create_frame_graph(urdf, as_kinematic_tree=True)
+
+    assert tree.names[0] == "base"
+    assert tree.n_joints == 2
+    assert np.allclose(tree.lower_limits, (-1, 0))
+    assert np.allclose(tree.upper_limits, (1, 0.5))
+
+    links["joint0"].angle = 0.3
+    links["joint1"].amount = 0.2
+    poses = tree.forward_kinematics((0.3, 0.2))
+
+    expected = frames["tool"].transform((1, 2, 3), frames["base"])
+    result = poses[tree.index("tool")] @ (1, 2, 3, 1)
+    assert np.allclose(result[:3], expected)
+
+
+def test_kinematic_tree_default_limits():
+    urdf = """<?xml version="1.0"?>
+        <robot name="robot_name">
+        <link name="base"/>
+        <link name="link1"/>
+        <link name="link2"/>
+        <joint name="joint0" type="revolute">
+            <parent link="base"/>
+            <child link="link1"/>
+            <axis xyz="0 0 1"/>
+            <limit upper="1" effort="10" velocity="1"/>
+        </joint>
+        <joint name="joint1" type="prismatic">
+            <parent link="link1"/>
+            <child link="link2"/>
+            <axis xyz="1 0 0"/>
+            <limit lower="-0.5" effort="10" velocity="1"/>
+        </joint>
+        </robot>
+        """
+    tree = pyros.create_frame_graph(urdf, as_kinematic_tree=True)
+
+    # missing bounds default to 0 (URDF spec)
+    assert np.allclose(tree.lower_limits, (0, -0.5))
+    assert np.allclose(tree.upper_limits, (1, 0))
@@ -131,3 +131,68 @@ def test_affine():
     expected = np.ones((4, 3))
     result = affine.transform(input, cartesian)
     assert np.allclose(result, expected)
+
+
+def test_affine_matrix_from_links():
+    links = [
+        tf.EulerRotation("xyz", (0.1, 0.2, 0.3)),
+        tf.Translation((1, 2, 3)),
+        tf.RotvecRotation((0, 0, 1), angle=np.pi / 3),
+    ]
+    fused = tf.AffineMatrix.from_links(links)
+    expected = tf.CompundLink(links)
+
+    points = np.random.default_rng(0).random((10, 3))
+    assert np.allclose(fused.transform(points), expected.transform(points))
+    assert np.allclose(
+        fused.__inverse_transform__(points), expected.__inverse_transform__(points)
+    )
+
+    parent = tf.Frame(3)
+    child = fused(parent)
+    assert np.allclose(parent.get_affine_matrix(child), fused.affine_matrix)
+    assert np.allclose(
+        child.transform(points, parent), expected.__inverse_transform__(points)
+    )
+
+
+def test_affine_matrix_axis():
+    links = [tf.Translation((1, 2, 3), axis=0), tf.Translation((1, 0, 0), axis=0)]
+    fused = tf.AffineMatrix.from_links(links, axis=0)
+
+    points = np.zeros((3, 5))
+    result = fused.transform(points)
+    assert result.shape == (3, 5)
+    assert np.allclose(result, np.array([2, 2, 3])[:, None])
+
+
+def test_affine_matrix_from_batched_links():
+    # a batch of 4 must not be confused with the 4 points used for fusing
+    offsets = np.arange(12).reshape(4, 3)
+    links = [tf.EulerRotation("Z", np.pi / 2), tf.Translation(offsets)]
+
+    fused = tf.AffineMatrix.from_links(links)
+    assert fused.affine_matrix.shape == (4, 4, 4)
+
+    x = np.array((1, 2, 3))
+    expected = tf.CompundLink(links).transform(x)
+    assert np.allclose(fused.transform(x), expected)
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 4, 7])
+def test_affine_matrix_from_links_batch_sizes(batch_size):
+    rng = np.random.default_rng(0)
+    links = [
+        tf.EulerRotation("xyz", rng.uniform(-np.pi, np.pi, (batch_size, 3))),
+        tf.Translation(rng.uniform(-1, 1, (batch_size, 3))),
+        tf.RotvecRotation((0, 0, 1), angle=np.pi / 3),
+    ]
+    fused = tf.AffineMatrix.from_links(links)
+    expected = tf.CompundLink(links)
+    assert fused.affine_matrix.shape == (batch_size, 4, 4)
+
+    points = rng.random((batch_size, 3))
+    assert np.allclose(fused.transform(points), expected.transform(points))
+    assert np.allclose(
+        fused.__inverse_transform__(points), expected.__inverse_transform__(points)
+    )
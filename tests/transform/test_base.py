@@ -1,4 +1,5 @@
 import numpy as np
+import pickle
 import pytest
 from typing import List
 
@@ -152,6 +153,14 @@ def test_inverse_inverse():
     assert np.allclose(result, expected)
 
 
+def test_inverse_pickle():
+    link = tf.Translation((1, 0), amount=0.5)
+    inv_link = pickle.loads(pickle.dumps(tf.InvertLink(link)))
+
+    assert inv_link.amount == 0.5
+    assert np.allclose(inv_link.transform((3, 5)), (2.5, 5))
+
+
 def test_frames_between():
     link = tf.Translation((1, 0))
 
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+import skbot.transform as tf
+
+
+@pytest.fixture()
+def robot():
+    base = tf.Frame(3, name="base")
+    joint1 = tf.RotationalJoint((0, 0, 1), angle=0, lower_limit=-np.pi)
+    joint2 = tf.PrismaticJoint((1, 0, 0), amount=0.5)
+
+    link1 = tf.Frame(3, name="link1")
+    tf.CompundLink([tf.EulerRotation("xyz", (0, 0.5, 0)), tf.Translation((0, 0, 1))])(
+        link1, tf.Frame(3, name="joint1")
+    )
+    joint1(link1.find_frame(".../joint1"), base)
+
+    link2 = tf.Frame(3, name="link2")
+    joint2(link2, link1)
+    tool = tf.Translation((0, 0, 0.1))(link2)
+    tool.name = "tool"
+
+    return base, [joint1, joint2], tool
+
+
+def test_forward_kinematics(robot):
+    base, joints, tool = robot
+    tree = tf.KinematicTree.from_frame_graph(base)
+
+    assert tree.names[0] == "base"
+    assert tree.n_nodes == 5
+    assert tree.n_joints == 2
+    assert np.all(tree.parents[1:] < np.arange(1, tree.n_nodes))
+    assert np.allclose(tree.q0, (0, 0.5))
+    assert np.allclose(tree.lower_limits, (-np.pi, 0))
+
+    rng = np.random.default_rng(0)
+    for _ in range(5):
+        q = rng.uniform(tree.lower_limits, tree.upper_limits)
+        for joint, value in zip(joints, q):
+            joint.param = value
+
+        poses = tree.forward_kinematics(q)
+        for idx, name in enumerate(tree.names):
+            frame = base.find_frame(f".../{name}") if idx > 0 else base
+            expected = frame.transform((1, 2, 3), base)
+            result = poses[idx] @ (1, 2, 3, 1)
+            assert np.allclose(result[:3], expected)
+
+
+def test_batched_forward_kinematics(robot):
+    base, joints, tool = robot
+    tree = tf.KinematicTree.from_frame_graph(base, joints=joints[::-1])
+
+    q = np.random.default_rng(0).uniform(0, 0.5, size=(4, 3, 2))
+    poses = tree.forward_kinematics(q)
+    assert poses.shape == (4, 3, tree.n_nodes, 4, 4)
+
+    for idx in np.ndindex(4, 3):
+        assert np.allclose(poses[idx], tree.forward_kinematics(q[idx]))
+
+
+def test_not_a_tree():
+    a = tf.Frame(3, name="a")
+    b = tf.Translation((1, 0, 0))(a)
+    c = tf.Translation((0, 1, 0))(b)
+    tf.Translation((0, 0, 1))(c, a)
+
+    with pytest.raises(ValueError):
+        tf.KinematicTree.from_frame_graph(a)
+
+
+def test_missing_joint(robot):
+    base, joints, tool = robot
+
+    with pytest.raises(ValueError):
+        tf.KinematicTree.from_frame_graph(base, joints=[tf.RotationalJoint((1, 0, 0))])
@@ -1,4 +1,5 @@
 import numba
+import skbot
 import numpy as np
 import pytest
 import skbot.transform._utils as util
@@ -95,3 +96,13 @@ def test_numba_reduce_keepdims():
 
     assert actual.ndim == 1
     assert np.allclose(actual, expected)
+
+
+def test_warmup():
+    skbot.warmup(dtypes=["float64"], ndims=[1, 2])
+    n_signatures = len(util._vector_project_impl.signatures)
+
+    # the warmed up signatures match the ones used by vector_project
+    vector_project(np.ones(3), np.ones((4, 3)))
+    vector_project(np.ones((4, 3)).T, np.ones(3), axis=0)
+    assert len(util._vector_project_impl.signatures) == n_signatures